@@ -0,0 +1,342 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Command and catalog caches for ANTA."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from anta import __version__
+
+if TYPE_CHECKING:
+    from anta.catalog import AntaTestDefinition
+    from anta.device import AntaDevice
+    from anta.models import AntaCommand
+
+logger = logging.getLogger(__name__)
+
+PERSISTENT_CACHE_COMMANDS = [
+    r"^show aaa methods \w+$",
+    r"^show snmp (ipv4|ipv6) access-list summary$",
+    r"^show management api http-commands( (ip|ipv6) access-list summary)?$",
+    r"^show management ssh (ip|ipv6) access-list summary$",
+    r"^show ip name-server$",
+    r"^show hostname$",
+    r"^show vlan internal allocation policy$",
+]
+"""List of regular expressions matching commands whose output only depends on the device configuration.
+
+Commands returning the configuration text itself, like `show running-config`, must not be added: the configuration is never stored on disk.
+"""
+
+PERSISTENT_CACHE_FINGERPRINT_COMMAND = "show running-config | section aaa|snmp-server|management|name-server|hostname|ip domain|dns domain|vlan internal"
+"""Command returning the configuration sections the outputs of `PERSISTENT_CACHE_COMMANDS` depend on.
+
+The domain name sections are included as `show hostname` returns the FQDN of the device.
+The device state fingerprint is computed from its output, see `AsyncEOSDevice.refresh()`.
+Collecting it costs one additional request per device and per run.
+"""
+
+PERSISTENT_CACHE_FILENAME = "anta_cache.sqlite"
+"""Name of the SQLite database file created in the cache directory."""
+
+CATALOG_CACHE_DIRNAME = "catalogs"
+"""Name of the directory storing the compiled catalogs in the cache directory."""
+
+CATALOG_CACHE_VERSION = 1
+"""Version of the format of the compiled catalogs. Must be bumped when the format changes."""
+
+
+class PersistentCache:
+    """On-disk cache of command outputs shared across ANTA runs.
+
+    Outputs are stored in a SQLite database, keyed by device name and command UID, along with the device state fingerprint
+    they were collected with. A cached output is only returned if the current fingerprint of the device matches, i.e. the
+    device configuration has not changed since the output was collected.
+
+    Only the outputs of the commands matching one of the `commands` regular expressions are cached.
+    Commands returning operational state must never be cached.
+
+    Attributes
+    ----------
+    path
+        Path of the SQLite database file.
+    commands
+        List of regular expressions matching the commands that can be cached.
+    fingerprint_command
+        Command returning the configuration the cached outputs depend on, used to compute the device state fingerprint.
+    """
+
+    def __init__(self, directory: str | Path, commands: list[str] | None = None, fingerprint_command: str = PERSISTENT_CACHE_FINGERPRINT_COMMAND) -> None:
+        """Initialize a PersistentCache.
+
+        Parameters
+        ----------
+        directory
+            Directory where the cache database is stored. Created if it does not exist.
+        commands
+            List of regular expressions matching the commands that can be cached. Default to `PERSISTENT_CACHE_COMMANDS`.
+        fingerprint_command
+            Command returning the configuration the cached outputs depend on. Default to `PERSISTENT_CACHE_FINGERPRINT_COMMAND`.
+            It must cover the configuration of all the commands that can be cached.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path: Path = directory / PERSISTENT_CACHE_FILENAME
+        self.commands: list[str] = commands if commands is not None else PERSISTENT_CACHE_COMMANDS
+        self.fingerprint_command: str = fingerprint_command
+        self._commands_regex = re.compile("|".join(f"(?:{pattern})" for pattern in self.commands)) if self.commands else None
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS outputs (device TEXT, uid TEXT, fingerprint TEXT, output TEXT, updated REAL, PRIMARY KEY (device, uid))"
+        )
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        """Return a printable representation of a PersistentCache."""
+        return f"PersistentCache({self.path.parent!r})"
+
+    def is_cacheable(self, command: AntaCommand) -> bool:
+        """Return True if the output of the command can be stored in the persistent cache."""
+        return self._commands_regex is not None and self._commands_regex.match(command.command) is not None
+
+    def get(self, device: str, uid: str, fingerprint: str) -> dict[str, Any] | str | None:
+        """Return the cached output of a command or None if there is no output matching the device fingerprint.
+
+        Parameters
+        ----------
+        device
+            Device name.
+        uid
+            Command UID.
+        fingerprint
+            Current state fingerprint of the device.
+        """
+        row = self._connection.execute("SELECT output FROM outputs WHERE device = ? AND uid = ? AND fingerprint = ?", (device, uid, fingerprint)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, device: str, uid: str, fingerprint: str, output: dict[str, Any] | str) -> None:
+        """Store the output of a command, replacing any output previously collected with another fingerprint.
+
+        Parameters
+        ----------
+        device
+            Device name.
+        uid
+            Command UID.
+        fingerprint
+            Current state fingerprint of the device.
+        output
+            Output of the command.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO outputs (device, uid, fingerprint, output, updated) VALUES (?, ?, ?, ?, ?)",
+            (device, uid, fingerprint, json.dumps(output), time()),
+        )
+        self._connection.commit()
+
+    def clear(self, device: str | None = None) -> None:
+        """Remove the cached outputs of a device or of all devices if `device` is None."""
+        if device is None:
+            self._connection.execute("DELETE FROM outputs")
+        else:
+            self._connection.execute("DELETE FROM outputs WHERE device = ?", (device,))
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close the connection to the cache database.
+
+        Must be called at the end of the run. Closing a closed cache has no effect.
+        """
+        self._connection.close()
+
+
+class UnsupportedCommands:
+    """Fleet-wide memo of the commands that are not supported on a hardware platform.
+
+    A command is memoized per hardware model and EOS version once a device returned a
+    "not supported on this hardware platform" error for it. The memo can then be shared by
+    all the devices to avoid sending the same doomed request to every device of the same platform.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an UnsupportedCommands memo."""
+        self._errors: dict[tuple[str, str | None, str], list[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of memoized commands."""
+        return len(self._errors)
+
+    @staticmethod
+    def _key(device: AntaDevice, command: AntaCommand) -> tuple[str, str | None, str] | None:
+        """Return the memo key of a command for a device or None if the device hardware model is unknown."""
+        if not device.hw_model:
+            return None
+        return (device.hw_model, device.eos_version, command.uid)
+
+    def get(self, device: AntaDevice, command: AntaCommand) -> list[str] | None:
+        """Return the errors of a command if it is known to be unsupported on the device platform, None otherwise.
+
+        Parameters
+        ----------
+        device
+            The device on which the command would be collected.
+        command
+            The command to look up.
+        """
+        if (key := self._key(device, command)) is None or (errors := self._errors.get(key)) is None:
+            return None
+        return list(errors)
+
+    def add(self, device: AntaDevice, command: AntaCommand) -> None:
+        """Memoize a command if it failed because it is not supported on the device platform.
+
+        Parameters
+        ----------
+        device
+            The device on which the command has been collected.
+        command
+            The collected command.
+        """
+        if not command.error or command.supported or (key := self._key(device, command)) is None:
+            return
+        if key not in self._errors:
+            logger.debug("Command '%s' is not supported on %s (EOS %s)", command.command, device.hw_model, device.eos_version)
+        self._errors[key] = list(command.errors)
+
+    def clear(self) -> None:
+        """Forget all the memoized commands."""
+        self._errors.clear()
+
+
+class CatalogCache:
+    """On-disk cache of compiled test catalogs shared across ANTA runs.
+
+    Parsing and validating a large catalog is expensive. A compiled catalog stores the validated test definitions
+    of a catalog file using `pickle`, keyed by the hash of the file content. It is only loaded if it has been compiled
+    with the same versions of ANTA, Python and pydantic and if the Python modules defining the tests of the catalog
+    have not been modified since.
+
+    Compiled catalogs are trusted: the cache directory must only be writable by the user running ANTA.
+
+    Attributes
+    ----------
+    directory
+        Directory of the compiled catalogs.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize a CatalogCache.
+
+        Parameters
+        ----------
+        directory
+            Cache directory. The compiled catalogs are stored in its `catalogs` subdirectory, created if it does not exist.
+        """
+        self.directory: Path = Path(directory) / CATALOG_CACHE_DIRNAME
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """Return a printable representation of a CatalogCache."""
+        return f"CatalogCache({self.directory.parent!r})"
+
+    def path(self, content: str, file_format: str) -> Path:
+        """Return the path of the compiled catalog of a catalog file.
+
+        Parameters
+        ----------
+        content
+            Content of the catalog file.
+        file_format
+            Format of the catalog file.
+        """
+        digest = hashlib.sha256(f"{file_format}\n{content}".encode()).hexdigest()
+        return self.directory / f"{digest}.pickle"
+
+    @staticmethod
+    def _versions() -> dict[str, Any]:
+        """Return the versions a compiled catalog depends on, except the versions of the test modules."""
+        return {"format": CATALOG_CACHE_VERSION, "anta": __version__, "python": sys.version, "pydantic": PYDANTIC_VERSION}
+
+    @staticmethod
+    def _module_version(module_name: str) -> tuple[Any, ...]:
+        """Return the version of a Python module defining tests: its `__version__` attribute and the modification time and size of its file."""
+        module = importlib.import_module(module_name)
+        version = getattr(module, "__version__", None)
+        if (module_file := getattr(module, "__file__", None)) is None:
+            return (version,)
+        stat = Path(module_file).stat()
+        return (version, stat.st_mtime_ns, stat.st_size)
+
+    def load(self, content: str, file_format: str) -> list[AntaTestDefinition] | None:
+        """Return the test definitions of a compiled catalog or None if there is no valid compiled catalog for this catalog file.
+
+        Parameters
+        ----------
+        content
+            Content of the catalog file.
+        file_format
+            Format of the catalog file.
+        """
+        path = self.path(content, file_format)
+        try:
+            with path.open("rb") as f:
+                header = pickle.load(f)  # noqa: S301
+                if header["versions"] != self._versions() or any(self._module_version(name) != version for name, version in header["modules"].items()):
+                    logger.debug("Compiled catalog %s is outdated", path)
+                    return None
+                tests: list[AntaTestDefinition] = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # noqa: BLE001
+            # Unpickling can raise any exception, a compiled catalog that cannot be loaded is compiled again
+            logger.debug("Compiled catalog %s cannot be loaded: %s", path, e)
+            return None
+        logger.debug("Loaded compiled catalog %s", path)
+        return tests
+
+    def store(self, content: str, file_format: str, tests: list[AntaTestDefinition]) -> None:
+        """Compile a catalog.
+
+        Errors are logged and ignored: the catalog is then compiled again on the next run.
+
+        Parameters
+        ----------
+        content
+            Content of the catalog file.
+        file_format
+            Format of the catalog file.
+        tests
+            Validated test definitions of the catalog.
+        """
+        path = self.path(content, file_format)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            modules = {name: self._module_version(name) for name in sorted({definition.test.__module__ for definition in tests})}
+            with temp_path.open("wb") as f:
+                pickle.dump({"versions": self._versions(), "modules": modules}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(tests, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Replacing the file is atomic: concurrent ANTA runs never load a partially written compiled catalog
+            temp_path.replace(path)
+        except Exception as e:  # noqa: BLE001
+            # Test definitions referencing objects that cannot be pickled, e.g. test classes defined in a function, cannot be compiled
+            logger.warning("Catalog cannot be compiled to %s: %s", path, e)
+            temp_path.unlink(missing_ok=True)
+            return
+        logger.debug("Compiled catalog to %s", path)
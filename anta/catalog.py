@@ -8,24 +8,44 @@ from __future__ import annotations
 import importlib
 import logging
 import math
+from bisect import bisect_left
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
 from inspect import isclass
 from itertools import chain
-from json import load as json_load
+from operator import or_
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Optional, Union
 from warnings import warn
 
-from pydantic import BaseModel, ConfigDict, RootModel, ValidationError, ValidationInfo, field_validator, model_serializer, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    RootModel,
+    Tag,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 from pydantic.types import ImportString
 from pydantic_core import PydanticCustomError
-from yaml import YAMLError, safe_dump, safe_load
+from yaml import YAMLError
 
+from anta.cache import CatalogCache
 from anta.logger import anta_log_exception
-from anta.models import AntaTest
+from anta.models import AntaTest, _hashable
+from anta.serialization import dump_yaml, load_json, load_yaml
+from anta.tags import TagExpression, from_bitset, to_bitset
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Hashable, Iterable, Mapping
+    from collections.abc import Set as AbstractSet
     from types import ModuleType
 
     if sys.version_info >= (3, 11):
@@ -41,6 +61,72 @@ RawCatalogInput = dict[str, list[dict[str, Optional[dict[str, Any]]]]]
 # [ ( <AntaTest class>, <input_as AntaTest.Input or dict or None > ), ... ]
 ListAntaTestTuples = list[tuple[type[AntaTest], Optional[Union[AntaTest.Input, dict[str, Any]]]]]
 
+CATALOG_CHECK_CHUNK_SIZE = 1000
+"""Number of test definitions checked by a worker process at once, see `AntaCatalog.check()`."""
+
+INPUTS_FROM_KEY = "inputs_from"
+"""Key of the test inputs in a catalog file naming the device variable holding the inputs of a parametrized test definition."""
+
+
+def _inputs_key(value: Any) -> Hashable:  # noqa: ANN401
+    """Return a hashable key of raw test inputs, as loaded from a file.
+
+    Unlike `anta.models._hashable()`, values are not validated yet: equal values of different types like `1`, `1.0` and `True`
+    have different keys as they may be validated differently.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _inputs_key(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple([_inputs_key(item) for item in value])
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_inputs_key(item) for item in value)
+    return (type(value), value)
+
+
+def _check_test_definitions(module_name: str, offset: int, test_definitions: list[Any]) -> list[dict[str, Any]]:
+    """Check test definitions of a catalog and return the errors.
+
+    This function is run in worker processes by `AntaCatalog.check()`: its arguments and the returned errors must be picklable.
+
+    Parameters
+    ----------
+    module_name
+        Name of the Python module of the test definitions.
+    offset
+        Index of the first test definition in the list of test definitions of the module.
+    test_definitions
+        Raw test definitions, as loaded from the catalog file.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Errors in pydantic format, without context. The location of an error starts with the module name and the index of the test definition.
+    """
+    module = importlib.import_module(module_name)
+    errors: list[dict[str, Any]] = []
+    for index, test_definition in enumerate(test_definitions, start=offset):
+        if not isinstance(test_definition, dict) or len(test_definition) != 1:
+            msg = f"Syntax error when parsing: {test_definition}\nIt must be a dictionary with a single entry. Check the test catalog."
+            errors.append({"type": "value_error", "loc": (module_name, index), "msg": msg, "input": test_definition})
+            continue
+        for test_name, test_inputs in test_definition.items():
+            test: type[AntaTest] | None = getattr(module, test_name, None)
+            if test is None or not (isclass(test) and issubclass(test, AntaTest)):
+                msg = f"{test_name} is not defined in Python module {module_name}"
+                errors.append({"type": "value_error", "loc": (module_name, index, test_name), "msg": msg, "input": test_definition})
+                continue
+            try:
+                if isinstance(test_inputs, dict) and INPUTS_FROM_KEY in test_inputs:
+                    AntaParametrizedTestDefinition.from_inputs(test, test_inputs)
+                else:
+                    test.Input.model_validate(test_inputs if test_inputs is not None else {})
+            except ValidationError as e:
+                errors.extend(
+                    {"type": error["type"], "loc": (module_name, index, test_name, *error["loc"]), "msg": error["msg"], "input": error["input"]}
+                    for error in e.errors(include_url=False, include_context=False)
+                )
+    return errors
+
 
 class AntaTestDefinition(BaseModel):
     """Define a test with its associated inputs.
@@ -140,7 +226,237 @@ class AntaTestDefinition(BaseModel):
         return self
 
 
-class AntaCatalogFile(RootModel[dict[ImportString[Any], list[AntaTestDefinition]]]):  # pylint: disable=too-few-public-methods
+class AntaParametrizedTestDefinition(BaseModel):
+    """Define a test with inputs taken from the variables of each device.
+
+    In a catalog file, a test definition is parametrized by the `inputs_from` key. It names the device variable holding
+    the inputs of the test for each device, e.g. the `lldp_neighbors` variable of the devices defined in the inventory:
+    ```
+    anta.tests.connectivity:
+      - VerifyLLDPNeighbors:
+          inputs_from: lldp_neighbors
+          filters:
+            tags: ['leaf']
+    ```
+    The other inputs of the definition are shared by all the devices and are overridden by the device inputs.
+    Only the `filters` input is validated when the catalog is loaded: the inputs are validated when the test plan
+    of a device is built, once per distinct device inputs. See `AntaCatalog.get_test_plan()`.
+
+    Attributes
+    ----------
+    test
+        An AntaTest concrete subclass.
+    inputs_from
+        Name of the device variable holding the inputs of the test.
+    inputs
+        Raw inputs shared by all the devices.
+    filters
+        The validated `filters` input, used to select the devices running the test.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    test: type[AntaTest]
+    inputs_from: str
+    inputs: dict[str, Any] = Field(default_factory=dict)
+    filters: AntaTest.Input.Filters | None = None
+
+    @model_serializer()
+    def serialize_model(self) -> dict[str, dict[str, Any]]:
+        """Serialize the AntaParametrizedTestDefinition model like in a catalog file.
+
+        Returns
+        -------
+        dict
+            A dictionary representing the model.
+        """
+        return {self.test.__name__: {INPUTS_FROM_KEY: self.inputs_from, **self.inputs}}
+
+    @classmethod
+    def from_inputs(cls, test: type[AntaTest], inputs: dict[str, Any]) -> AntaParametrizedTestDefinition:
+        """Create an AntaParametrizedTestDefinition instance from the inputs of a test in a catalog file.
+
+        Parameters
+        ----------
+        test
+            An AntaTest concrete subclass.
+        inputs
+            Inputs of the test, including the `inputs_from` key.
+
+        Returns
+        -------
+        AntaParametrizedTestDefinition
+            The parametrized test definition.
+        """
+        inputs = inputs.copy()
+        inputs_from = inputs.pop(INPUTS_FROM_KEY)
+        return cls(test=test, inputs_from=inputs_from, inputs=inputs)
+
+    # ANN401 - Any ok for this validator as we are validating the received data
+    @model_validator(mode="before")
+    @classmethod
+    def set_filters(cls, data: Any) -> Any:  # noqa: ANN401
+        """Validate the `filters` input shared by all the devices as the `filters` field."""
+        if isinstance(data, dict) and isinstance(data.get("inputs"), dict) and "filters" not in data:
+            return {**data, "filters": data["inputs"].get("filters")}
+        return data
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> Self:
+        """Check that the shared inputs are fields of the `Input` model of the test."""
+        if unknown_inputs := sorted(set(self.inputs) - set(self.test.Input.model_fields)):
+            msg = f"{self.test.name} has no input named {', '.join(unknown_inputs)}"
+            raise ValueError(msg)
+        return self
+
+    def __hash__(self) -> int:
+        """Return the hash of the test, the variable and the inputs of the definition."""
+        return hash((self.test, self.inputs_from, _inputs_key(self.inputs)))
+
+    def resolve(self, variables: Mapping[str, Any]) -> AntaTestDefinition:
+        """Return the test definition of a device, validating the inputs of the test.
+
+        Parameters
+        ----------
+        variables
+            The variables of the device.
+
+        Returns
+        -------
+        AntaTestDefinition
+            The test definition with the shared inputs overridden by the device inputs.
+
+        Raises
+        ------
+        ValueError
+            If the device variable is missing or if the inputs are not valid.
+        """
+        if self.inputs_from not in variables:
+            msg = f"{self.test.name} inputs are not valid: variable '{self.inputs_from}' is not defined"
+            raise ValueError(msg)
+        device_inputs = variables[self.inputs_from]
+        if not isinstance(device_inputs, dict):
+            msg = f"{self.test.name} inputs are not valid: variable '{self.inputs_from}' must be a dictionary, got {type(device_inputs).__name__}"
+            raise ValueError(msg)  # noqa: TRY004
+        if "filters" in device_inputs:
+            msg = f"{self.test.name} inputs are not valid: variable '{self.inputs_from}' cannot define the filters of the test"
+            raise ValueError(msg)
+        return AntaTestDefinition(test=self.test, inputs={**self.inputs, **device_inputs})
+
+
+class AntaUnresolvedTestDefinition(BaseModel):
+    """Define a parametrized test that cannot be resolved with the variables of a device.
+
+    It is part of the test plan of the device so that the test is reported with an error, see `AntaCatalog.get_test_plan()`.
+
+    Attributes
+    ----------
+    test
+        An AntaTest concrete subclass.
+    error
+        The reason why the parametrized test cannot be resolved.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    test: type[AntaTest]
+    error: str
+
+
+def _test_definition_item(test_definition: Any) -> tuple[str, Any]:  # noqa: ANN401
+    """Return the test name and the raw inputs of a test definition in a catalog file, checking its syntax."""
+    if not isinstance(test_definition, dict):
+        msg = f"Syntax error when parsing: {test_definition}\nIt must be a dictionary. Check the test catalog."
+        raise ValueError(msg)  # noqa: TRY004 pydantic catches ValueError or AssertionError, no TypeError
+    if len(test_definition) != 1:
+        msg = f"Syntax error when parsing: {test_definition}\nIt must be a dictionary with a single entry. Check the indentation in the test catalog."
+        raise ValueError(msg)
+    return next(iter(test_definition.items()))
+
+
+def _create_test_definition(test: type[AntaTest], test_inputs: Any) -> AntaTestDefinition | AntaParametrizedTestDefinition:  # noqa: ANN401
+    """Create the definition of a test from its inputs in a catalog file, parametrized if the inputs have an `inputs_from` key."""
+    if isinstance(test_inputs, dict) and INPUTS_FROM_KEY in test_inputs:
+        return AntaParametrizedTestDefinition.from_inputs(test, test_inputs)
+    return AntaTestDefinition(test=test, inputs=test_inputs)
+
+
+def merge_test_definitions(tests: Iterable[AntaTestDefinition], *, ignore_filters: bool = False) -> list[AntaTestDefinition]:
+    """Merge the compatible definitions of the tests declaring mergeable inputs.
+
+    Two definitions of a test are compatible if all their inputs are equal, except the inputs declared in the `mergeable_inputs`
+    class attribute of the test. The items of the mergeable inputs of compatible definitions are concatenated, without duplicates,
+    in a single definition replacing the first one: the test runs once per device and reports its results per item.
+    Definitions whose merged inputs are not valid are not merged.
+
+    Parameters
+    ----------
+    tests
+        The test definitions to merge.
+    ignore_filters
+        Merge definitions with different `filters` inputs, e.g. once the tests of a device have been selected.
+        The merged definition keeps the `filters` input of the first definition.
+
+    Returns
+    -------
+    list[AntaTestDefinition]
+        The merged test definitions, in the order of their first definition.
+    """
+    merged_tests: list[AntaTestDefinition | list[AntaTestDefinition]] = []
+    groups: dict[Hashable, list[AntaTestDefinition]] = {}
+    for test in tests:
+        if not (mergeable_inputs := test.test.mergeable_inputs):
+            merged_tests.append(test)
+            continue
+        ignored_inputs = {*mergeable_inputs, "filters"} if ignore_filters else mergeable_inputs
+        key = (test.test, tuple([_hashable(getattr(test.inputs, name)) for name in type(test.inputs).model_fields if name not in ignored_inputs]))
+        if (group := groups.get(key)) is None:
+            group = groups[key] = []
+            merged_tests.append(group)
+        group.append(test)
+
+    result: list[AntaTestDefinition] = []
+    for test_or_group in merged_tests:
+        if isinstance(test_or_group, AntaTestDefinition):
+            result.append(test_or_group)
+        elif len(test_or_group) == 1 or (merged_test := _merge_group(test_or_group)) is None:
+            result.extend(test_or_group)
+        else:
+            result.append(merged_test)
+    return result
+
+
+def _merge_group(tests: list[AntaTestDefinition]) -> AntaTestDefinition | None:
+    """Merge compatible test definitions into a single definition or return None if the merged inputs are not valid."""
+    first = tests[0]
+    inputs = {name: getattr(first.inputs, name) for name in first.inputs.model_fields_set}
+    for name in first.test.mergeable_inputs:
+        items: dict[Hashable, Any] = {}
+        for test in tests:
+            for item in getattr(test.inputs, name) or ():
+                items.setdefault(_hashable(item), item)
+        if items:
+            inputs[name] = list(items.values())
+    try:
+        return AntaTestDefinition(test=first.test, inputs=first.test.Input.model_validate(inputs))
+    except ValidationError as e:
+        logger.debug("Cannot merge %s definitions of %s: %s", len(tests), first.test.name, e)
+        return None
+
+
+def _test_definition_tag(test_definition: Any) -> str:  # noqa: ANN401
+    """Return the tag of the model of a test definition, used to validate and serialize the test definitions of a catalog file."""
+    return "parametrized" if isinstance(test_definition, AntaParametrizedTestDefinition) else "test"
+
+
+# Test definitions of a catalog file. The discriminator is required to serialize each definition with its own serializer.
+_CatalogFileTestDefinition = Annotated[
+    Union[Annotated[AntaTestDefinition, Tag("test")], Annotated[AntaParametrizedTestDefinition, Tag("parametrized")]],
+    Discriminator(_test_definition_tag),
+]
+
+
+class AntaCatalogFile(RootModel[dict[ImportString[Any], list[_CatalogFileTestDefinition]]]):  # pylint: disable=too-few-public-methods
     """Represents an ANTA Test Catalog File.
 
     Example
@@ -154,7 +470,7 @@ class AntaCatalogFile(RootModel[dict[ImportString[Any], list[AntaTestDefinition]
 
     """
 
-    root: dict[ImportString[Any], list[AntaTestDefinition]]
+    root: dict[ImportString[Any], list[_CatalogFileTestDefinition]]
 
     @staticmethod
     def flatten_modules(data: dict[str, Any], package: str | None = None) -> dict[ModuleType, list[Any]]:
@@ -213,29 +529,19 @@ class AntaCatalogFile(RootModel[dict[ImportString[Any], list[AntaTestDefinition]
                 return data
             typed_data: dict[ModuleType, list[Any]] = AntaCatalogFile.flatten_modules(data)
             for module, tests in typed_data.items():
-                test_definitions: list[AntaTestDefinition] = []
+                test_definitions: list[AntaTestDefinition | AntaParametrizedTestDefinition] = []
                 for test_definition in tests:
-                    if isinstance(test_definition, AntaTestDefinition):
+                    if isinstance(test_definition, (AntaTestDefinition, AntaParametrizedTestDefinition)):
                         test_definitions.append(test_definition)
                         continue
-                    if not isinstance(test_definition, dict):
-                        msg = f"Syntax error when parsing: {test_definition}\nIt must be a dictionary. Check the test catalog."
-                        raise ValueError(msg)  # noqa: TRY004 pydantic catches ValueError or AssertionError, no TypeError
-                    if len(test_definition) != 1:
+                    test_name, test_inputs = _test_definition_item(test_definition)
+                    test: type[AntaTest] | None = getattr(module, test_name, None)
+                    if test is None:
                         msg = (
-                            f"Syntax error when parsing: {test_definition}\n"
-                            "It must be a dictionary with a single entry. Check the indentation in the test catalog."
+                            f"{test_name} is not defined in Python module {module.__name__}" f"{f' (from {module.__file__})' if module.__file__ is not None else ''}"
                         )
                         raise ValueError(msg)
-                    for test_name, test_inputs in test_definition.copy().items():
-                        test: type[AntaTest] | None = getattr(module, test_name, None)
-                        if test is None:
-                            msg = (
-                                f"{test_name} is not defined in Python module {module.__name__}"
-                                f"{f' (from {module.__file__})' if module.__file__ is not None else ''}"
-                            )
-                            raise ValueError(msg)
-                        test_definitions.append(AntaTestDefinition(test=test, inputs=test_inputs))
+                    test_definitions.append(_create_test_definition(test, test_inputs))
                 typed_data[module] = test_definitions
             return typed_data
         return data
@@ -248,11 +554,9 @@ class AntaCatalogFile(RootModel[dict[ImportString[Any], list[AntaTestDefinition]
         str
             The YAML representation string of this model.
         """
-        # TODO: Pydantic and YAML serialization/deserialization is not supported natively.
-        # This could be improved.
+        # Pydantic does not support YAML serialization natively: the model is dumped to JSON compatible Python objects
         # https://github.com/pydantic/pydantic/issues/1043
-        # Explore if this worth using this: https://github.com/NowanIlfideme/pydantic-yaml
-        return safe_dump(safe_load(self.model_dump_json(serialize_as_any=True, exclude_unset=True)), indent=2, width=math.inf)
+        return dump_yaml(self.model_dump(mode="json", serialize_as_any=True, exclude_unset=True), indent=2, width=math.inf)
 
     def to_json(self) -> str:
         """Return a JSON representation string of this model.
@@ -275,6 +579,7 @@ class AntaCatalog:
         self,
         tests: list[AntaTestDefinition] | None = None,
         filename: str | Path | None = None,
+        parametrized_tests: list[AntaParametrizedTestDefinition] | None = None,
     ) -> None:
         """Instantiate an AntaCatalog instance.
 
@@ -284,11 +589,16 @@ class AntaCatalog:
             A list of AntaTestDefinition instances.
         filename
             The path from which the catalog is loaded.
+        parametrized_tests
+            A list of AntaParametrizedTestDefinition instances, resolved for each device when building its test plan.
 
         """
         self._tests: list[AntaTestDefinition] = []
         if tests is not None:
             self._tests = tests
+        self._parametrized_tests: list[AntaParametrizedTestDefinition] = []
+        if parametrized_tests is not None:
+            self._parametrized_tests = parametrized_tests
         self._filename: Path | None = None
         if filename is not None:
             if isinstance(filename, Path):
@@ -297,14 +607,54 @@ class AntaCatalog:
                 self._filename = Path(filename)
 
         self.indexes_built: bool
-        self.tag_to_tests: defaultdict[str | None, set[AntaTestDefinition]]
+        self._tag_to_tests: defaultdict[str | None, set[AntaTestDefinition]] | None
+        self._indexed_tests: list[AntaTestDefinition]
+        self._indexed_parametrized_tests: list[AntaParametrizedTestDefinition]
+        self._tag_to_ids: defaultdict[str | None, list[int]]
+        self._tag_to_bitset: dict[str, int] | None
+        self._expression_to_ids: defaultdict[TagExpression, list[int]]
+        self._expression_tags: set[str]
+        self._plans: dict[tuple[frozenset[str], frozenset[str] | None, bool], tuple[AntaTestDefinition, ...]]
+        self._parametrized_plans: dict[tuple[frozenset[str], frozenset[str] | None, bool], list[int]]
+        self._plan_lengths: dict[tuple[frozenset[str], frozenset[str] | None, bool], int]
+        self._resolved_tests: dict[tuple[int, Hashable], AntaTestDefinition | AntaUnresolvedTestDefinition]
         self._init_indexes()
 
     def _init_indexes(self) -> None:
         """Init indexes related variables."""
-        self.tag_to_tests = defaultdict(set)
+        self._tag_to_tests = None
+        # Unique indexed tests: their position in this list is their ID in the `_tag_to_ids` index
+        self._indexed_tests = []
+        # Unique indexed parametrized tests: their IDs follow the IDs of the indexed tests
+        self._indexed_parametrized_tests = []
+        # Sorted IDs of the tests by tag
+        self._tag_to_ids = defaultdict(list)
+        # IDs of the tests by tag as bitsets, built on first use by get_tests_by_tags()
+        self._tag_to_bitset = None
+        # Sorted IDs of the tests filtered by a tag expression, by expression, and the tags used by these expressions
+        self._expression_to_ids = defaultdict(list)
+        self._expression_tags = set()
+        # Memoized test plans by set of indexed tags, selected tags and merging of the tests, see get_test_plan()
+        self._plans = {}
+        # IDs of the parametrized tests of the memoized test plans including parametrized tests
+        self._parametrized_plans = {}
+        # Number of tests of the memoized test plans before merging the tests
+        self._plan_lengths = {}
+        # Test definitions resolved from the parametrized tests by parametrized test ID and device inputs
+        self._resolved_tests = {}
         self.indexes_built = False
 
+    @property
+    def tag_to_tests(self) -> defaultdict[str | None, set[AntaTestDefinition]]:
+        """Sets of the indexed tests by tag, built on first access once the indexes are built."""
+        if self._tag_to_tests is None:
+            # Parametrized tests have the highest IDs and are not part of this index
+            count = len(self._indexed_tests)
+            self._tag_to_tests = defaultdict(
+                set, {tag: set(map(self._indexed_tests.__getitem__, ids[: bisect_left(ids, count)])) for tag, ids in self._tag_to_ids.items()}
+            )
+        return self._tag_to_tests
+
     @property
     def filename(self) -> Path | None:
         """Path of the file used to create this AntaCatalog instance."""
@@ -326,8 +676,24 @@ class AntaCatalog:
                 raise TypeError(msg)
         self._tests = value
 
+    @property
+    def parametrized_tests(self) -> list[AntaParametrizedTestDefinition]:
+        """List of AntaParametrizedTestDefinition in this catalog."""
+        return self._parametrized_tests
+
+    @parametrized_tests.setter
+    def parametrized_tests(self, value: list[AntaParametrizedTestDefinition]) -> None:
+        if not isinstance(value, list):
+            msg = "The catalog must contain a list of parametrized tests"
+            raise TypeError(msg)
+        for t in value:
+            if not isinstance(t, AntaParametrizedTestDefinition):
+                msg = "A parametrized test in the catalog must be an AntaParametrizedTestDefinition instance"
+                raise TypeError(msg)
+        self._parametrized_tests = value
+
     @staticmethod
-    def parse(filename: str | Path, file_format: Literal["yaml", "json"] = "yaml") -> AntaCatalog:
+    def parse(filename: str | Path, file_format: Literal["yaml", "json"] = "yaml", cache_dir: str | Path | None = None, *, trusted: bool = False) -> AntaCatalog:
         """Create an AntaCatalog instance from a test catalog file.
 
         Parameters
@@ -336,6 +702,11 @@ class AntaCatalog:
             Path to test catalog YAML or JSON file.
         file_format
             Format of the file, either 'yaml' or 'json'.
+        cache_dir
+            Optional cache directory. If provided, the validated catalog is compiled in this directory
+            and loaded from there as long as the file and the test modules are unchanged. See `anta.cache.CatalogCache`.
+        trusted
+            Skip the validation of the catalog structure and test definitions. See `from_dict()`.
 
         Returns
         -------
@@ -348,17 +719,95 @@ class AntaCatalog:
 
         try:
             file: Path = filename if isinstance(filename, Path) else Path(filename)
-            with file.open(encoding="UTF-8") as f:
-                data = safe_load(f) if file_format == "yaml" else json_load(f)
+            content = file.read_text(encoding="UTF-8")
+            catalog_cache = CatalogCache(cache_dir) if cache_dir is not None else None
+            if catalog_cache is not None and (tests := catalog_cache.load(content, file_format)) is not None:
+                return AntaCatalog(tests, filename=filename)
+            data = load_yaml(content) if file_format == "yaml" else load_json(content)
         except (TypeError, YAMLError, OSError, ValueError) as e:
             message = f"Unable to parse ANTA Test Catalog file '{filename}'"
             anta_log_exception(e, message, logger)
             raise
 
-        return AntaCatalog.from_dict(data, filename=filename)
+        catalog = AntaCatalog.from_dict(data, filename=filename, trusted=trusted)
+        # Compiled catalogs only store test definitions: catalogs with parametrized tests are not compiled
+        if catalog_cache is not None and catalog.tests and not catalog.parametrized_tests:
+            catalog_cache.store(content, file_format, catalog.tests)
+        return catalog
 
     @staticmethod
-    def from_dict(data: RawCatalogInput, filename: str | Path | None = None) -> AntaCatalog:
+    def check(filename: str | Path, file_format: Literal["yaml", "json"] = "yaml", *, workers: int | None = None) -> int:
+        """Check a test catalog file without instantiating an AntaCatalog.
+
+        Test definitions are checked in chunks of `CATALOG_CHECK_CHUNK_SIZE` definitions by a pool of worker processes.
+        All the errors are reported in a single ValidationError, located by module name, index of the test definition in
+        the module and test name.
+
+        Parameters
+        ----------
+        filename
+            Path to test catalog YAML or JSON file.
+        file_format
+            Format of the file, either 'yaml' or 'json'.
+        workers
+            Maximum number of worker processes. Default to the number of processors. If 1, the catalog is checked in the current process.
+
+        Returns
+        -------
+        int
+            The number of test definitions in the catalog.
+
+        Raises
+        ------
+        ValidationError
+            If any test definition is not valid.
+        """
+        if file_format not in ["yaml", "json"]:
+            message = f"'{file_format}' is not a valid format for an AntaCatalog file. Only 'yaml' and 'json' are supported."
+            raise ValueError(message)
+
+        try:
+            file: Path = filename if isinstance(filename, Path) else Path(filename)
+            content = file.read_text(encoding="UTF-8")
+            data = load_yaml(content) if file_format == "yaml" else load_json(content)
+        except (TypeError, YAMLError, OSError, ValueError) as e:
+            message = f"Unable to parse ANTA Test Catalog file '{filename}'"
+            anta_log_exception(e, message, logger)
+            raise
+
+        if data is None:
+            logger.warning("Catalog input data is empty")
+            return 0
+        if not isinstance(data, dict):
+            msg = f"Wrong input type for catalog data (from {filename}), must be a dict, got {type(data).__name__}"
+            raise TypeError(msg)
+
+        # Modules are imported here so that import errors are raised before starting the worker processes
+        try:
+            modules = AntaCatalogFile.flatten_modules(data)
+        except ValueError as e:
+            anta_log_exception(e, f"Test catalog is invalid! (from {filename})", logger)
+            raise
+        chunks = [
+            (module.__name__, offset, test_definitions[offset : offset + CATALOG_CHECK_CHUNK_SIZE])
+            for module, test_definitions in modules.items()
+            for offset in range(0, len(test_definitions), CATALOG_CHECK_CHUNK_SIZE)
+        ]
+        if workers == 1 or len(chunks) <= 1:
+            errors = list(chain.from_iterable(_check_test_definitions(*chunk) for chunk in chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                errors = list(chain.from_iterable(executor.map(_check_test_definitions, *zip(*chunks))))
+
+        if errors:
+            line_errors = [{"type": PydanticCustomError(error["type"], error["msg"]), "loc": error["loc"], "input": error["input"]} for error in errors]
+            validation_error = ValidationError.from_exception_data(AntaCatalogFile.__name__, line_errors)  # type: ignore[arg-type]
+            anta_log_exception(validation_error, f"Test catalog is invalid! (from {filename})", logger)
+            raise validation_error
+        return sum(len(chunk[2]) for chunk in chunks)
+
+    @staticmethod
+    def from_dict(data: RawCatalogInput, filename: str | Path | None = None, *, trusted: bool = False) -> AntaCatalog:
         """Create an AntaCatalog instance from a dictionary data structure.
 
         See RawCatalogInput type alias for details.
@@ -371,13 +820,16 @@ class AntaCatalog:
             Python dictionary used to instantiate the AntaCatalog instance.
         filename
             value to be set as AntaCatalog instance attribute
+        trusted
+            Skip the validation of the catalog structure and test definitions, for catalogs that have already been validated,
+            e.g. using `anta check catalog`. Test inputs are still instantiated using the Input model of their test
+            as tests rely on the types of the validated inputs. An invalid catalog may raise unexpected errors.
 
         Returns
         -------
         AntaCatalog
             An AntaCatalog populated with the 'data' dictionary content.
         """
-        tests: list[AntaTestDefinition] = []
         if data is None:
             logger.warning("Catalog input data is empty")
             return AntaCatalog(filename=filename)
@@ -386,18 +838,66 @@ class AntaCatalog:
             msg = f"Wrong input type for catalog data{f' (from {filename})' if filename is not None else ''}, must be a dict, got {type(data).__name__}"
             raise TypeError(msg)
 
+        test_definitions: Iterable[AntaTestDefinition | AntaParametrizedTestDefinition]
         try:
-            catalog_data = AntaCatalogFile(data)  # type: ignore[arg-type]
-        except ValidationError as e:
+            test_definitions = AntaCatalog._trusted_tests(data) if trusted else chain.from_iterable(AntaCatalogFile(data).root.values())  # type: ignore[arg-type]
+        except ValueError as e:
+            # Pydantic ValidationError is a ValueError, the trusted path raises ValueError for structural errors
             anta_log_exception(
                 e,
                 f"Test catalog is invalid!{f' (from {filename})' if filename is not None else ''}",
                 logger,
             )
             raise
-        for t in catalog_data.root.values():
-            tests.extend(t)
-        return AntaCatalog(tests, filename=filename)
+        tests: list[AntaTestDefinition] = []
+        parametrized_tests: list[AntaParametrizedTestDefinition] = []
+        for test_definition in test_definitions:
+            if isinstance(test_definition, AntaParametrizedTestDefinition):
+                parametrized_tests.append(test_definition)
+            else:
+                tests.append(test_definition)
+        return AntaCatalog(tests, filename=filename, parametrized_tests=parametrized_tests)
+
+    @staticmethod
+    def _trusted_tests(data: RawCatalogInput) -> list[AntaTestDefinition | AntaParametrizedTestDefinition]:
+        """Return the test definitions of a trusted catalog, only validating the test inputs.
+
+        The syntax of the catalog is checked but the test definitions are not validated. Identical inputs of a test
+        are validated once and share the same `AntaTest.Input` instance, which is immutable.
+
+        Parameters
+        ----------
+        data
+            Python dictionary of a catalog that has already been validated.
+
+        Returns
+        -------
+        list[AntaTestDefinition | AntaParametrizedTestDefinition]
+            The test definitions of the catalog.
+
+        Raises
+        ------
+        ValueError
+            If the catalog has a syntax error, references an undefined test or has invalid inputs.
+        """
+        tests: list[AntaTestDefinition | AntaParametrizedTestDefinition] = []
+        # Validated inputs by test and raw inputs
+        validated_inputs: dict[tuple[type[AntaTest], Hashable], AntaTest.Input] = {}
+        for module, test_definitions in AntaCatalogFile.flatten_modules(data).items():
+            for test_definition in test_definitions:
+                test_name, test_inputs = _test_definition_item(test_definition)
+                if (test := getattr(module, test_name, None)) is None:
+                    msg = f"{test_name} is not defined in Python module {module.__name__}"
+                    raise ValueError(msg)
+                if isinstance(test_inputs, dict) and INPUTS_FROM_KEY in test_inputs:
+                    tests.append(AntaParametrizedTestDefinition.from_inputs(test, test_inputs))
+                    continue
+                key = (test, _inputs_key(test_inputs))
+                if (inputs := validated_inputs.get(key)) is None:
+                    inputs = test.Input.model_validate(test_inputs if test_inputs is not None else {})
+                    validated_inputs[key] = inputs
+                tests.append(AntaTestDefinition.model_construct(test=test, inputs=inputs))
+        return tests
 
     @staticmethod
     def from_list(data: ListAntaTestTuples) -> AntaCatalog:
@@ -424,13 +924,15 @@ class AntaCatalog:
         return AntaCatalog(tests)
 
     @classmethod
-    def merge_catalogs(cls, catalogs: list[AntaCatalog]) -> AntaCatalog:
+    def merge_catalogs(cls, catalogs: list[AntaCatalog], *, merge_tests: bool = False) -> AntaCatalog:
         """Merge multiple AntaCatalog instances.
 
         Parameters
         ----------
         catalogs
             A list of AntaCatalog instances to merge.
+        merge_tests
+            Merge the compatible definitions of the tests declaring mergeable inputs, see `merge_test_definitions()`.
 
         Returns
         -------
@@ -438,7 +940,12 @@ class AntaCatalog:
             A new AntaCatalog instance containing the tests of all the input catalogs.
         """
         combined_tests = list(chain(*(catalog.tests for catalog in catalogs)))
-        return cls(tests=combined_tests)
+        if merge_tests:
+            tests_count = len(combined_tests)
+            combined_tests = merge_test_definitions(combined_tests)
+            logger.info("Merged compatible test definitions: %s test definitions reduced to %s", tests_count, len(combined_tests))
+        combined_parametrized_tests = list(chain(*(catalog.parametrized_tests for catalog in catalogs)))
+        return cls(tests=combined_tests, parametrized_tests=combined_parametrized_tests)
 
     def merge(self, catalog: AntaCatalog) -> AntaCatalog:
         """Merge two AntaCatalog instances.
@@ -473,8 +980,9 @@ class AntaCatalog:
         AntaCatalogFile
             An AntaCatalogFile instance containing tests of this AntaCatalog instance.
         """
-        root: dict[ImportString[Any], list[AntaTestDefinition]] = {}
-        for test in self.tests:
+        root: dict[ImportString[Any], list[AntaTestDefinition | AntaParametrizedTestDefinition]] = {}
+        tests: Iterable[AntaTestDefinition | AntaParametrizedTestDefinition] = chain(self.tests, self.parametrized_tests)
+        for test in tests:
             # Cannot use AntaTest.module property as the class is not instantiated
             root.setdefault(test.test.__module__, []).append(test)
         return AntaCatalogFile(root=root)
@@ -484,21 +992,42 @@ class AntaCatalog:
 
         If a `filtered_tests` set is provided, only the tests in this set will be indexed.
 
-        This method populates the tag_to_tests attribute, which is a dictionary mapping tags to sets of tests.
+        Each unique test gets an integer ID and the sorted IDs of the tests are indexed by tag. This index is used to build
+        the test plans returned by `get_test_plan()` and the `tag_to_tests` dictionary mapping tags to sets of tests.
+        Tests filtered by a tag expression that is not a simple list of tags are indexed by expression and are not part of `tag_to_tests`.
+        Parametrized tests are indexed after the other tests and are not part of `tag_to_tests` either.
 
-        Once the indexes are built, the `indexes_built` attribute is set to True.
+        Existing indexes are cleared first. Once the indexes are built, the `indexes_built` attribute is set to True.
         """
-        for test in self.tests:
+        self._init_indexes()
+        test_ids: dict[AntaTestDefinition | AntaParametrizedTestDefinition, int] = {}
+        tests: Iterable[AntaTestDefinition | AntaParametrizedTestDefinition] = chain(self.tests, self.parametrized_tests)
+        for test in tests:
             # Skip tests that are not in the specified filtered_tests set
             if filtered_tests and test.test.name not in filtered_tests:
                 continue
 
-            # Indexing by tag
-            if test.inputs.filters and (test_tags := test.inputs.filters.tags):
-                for tag in test_tags:
-                    self.tag_to_tests[tag].add(test)
+            # Skip duplicated tests, they have the same tags
+            if (test_id := test_ids.setdefault(test, len(test_ids))) < len(self._indexed_tests) + len(self._indexed_parametrized_tests):
+                continue
+            if isinstance(test, AntaParametrizedTestDefinition):
+                self._indexed_parametrized_tests.append(test)
+                filters = test.filters
             else:
-                self.tag_to_tests[None].add(test)
+                self._indexed_tests.append(test)
+                filters = test.inputs.filters
+
+            # Indexing by tag
+            test_filter = filters.tags if filters else None
+            if isinstance(test_filter, TagExpression):
+                if test_filter.union_tags is None:
+                    self._expression_to_ids[test_filter].append(test_id)
+                    self._expression_tags |= test_filter.tags
+                    continue
+                test_filter = set(test_filter.union_tags)
+            for tag in test_filter or (None,):
+                # IDs are increasing so the lists stay sorted
+                self._tag_to_ids[tag].append(test_id)
 
         self.indexes_built = True
 
@@ -506,21 +1035,24 @@ class AntaCatalog:
         """Clear this AntaCatalog instance indexes."""
         self._init_indexes()
 
-    def get_tests_by_tags(self, tags: set[str], *, strict: bool = False) -> set[AntaTestDefinition]:
+    def get_tests_by_tags(self, tags: set[str] | TagExpression, *, strict: bool = False) -> set[AntaTestDefinition]:
         """Return all tests that match a given set of tags, according to the specified strictness.
 
         Parameters
         ----------
         tags
             The tags to filter tests by. If empty, return all tests without tags.
+            If it is a tag expression, return the tests whose tags match the expression, e.g. `spine and not leaf`.
+            The expression is evaluated with bitwise operations on the test IDs by tag.
         strict
             If True, returns only tests that contain all specified tags (intersection).
             If False, returns tests that contain any of the specified tags (union).
+            Ignored if `tags` is a tag expression.
 
         Returns
         -------
         set[AntaTestDefinition]
-            A set of tests that match the given tags.
+            A set of tests that match the given tags. Parametrized tests are not included.
 
         Raises
         ------
@@ -530,6 +1062,8 @@ class AntaCatalog:
         if not self.indexes_built:
             msg = "Indexes have not been built yet. Call build_indexes() first."
             raise ValueError(msg)
+        if isinstance(tags, TagExpression):
+            return self._get_tests_by_expression(tags)
         if not tags:
             return self.tag_to_tests[None]
 
@@ -540,3 +1074,137 @@ class AntaCatalog:
         if strict:
             return set.intersection(*filtered_sets)
         return set.union(*filtered_sets)
+
+    def _get_tests_by_expression(self, expression: TagExpression) -> set[AntaTestDefinition]:
+        """Return the tests with tags matching a tag expression."""
+        if self._tag_to_bitset is None:
+            # Parametrized tests have the highest IDs and are not part of this index
+            count = len(self._indexed_tests)
+            self._tag_to_bitset = {tag: to_bitset(ids[: bisect_left(ids, count)], count) for tag, ids in self._tag_to_ids.items() if tag is not None}
+        # The universe is the set of the tests with tags
+        universe = reduce(or_, self._tag_to_bitset.values(), 0)
+        return {self._indexed_tests[test_id] for test_id in from_bitset(expression.select(self._tag_to_bitset, universe))}
+
+    def get_test_plan(
+        self,
+        tags: Iterable[str],
+        *,
+        selected_tags: AbstractSet[str] | None = None,
+        variables: Mapping[str, Any] | None = None,
+        merge_tests: bool = False,
+    ) -> tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]:
+        """Return the tests to run on a device.
+
+        Without `selected_tags`, the plan includes the tests without tags, the tests with any of the device tags
+        and the tests with a tag expression matching the device tags.
+
+        With `selected_tags`, e.g. from the `--tags` option of the CLI, the plan only includes the tests with any of the
+        device tags that are selected and the tests with a tag expression matching the device tags and using one of these tags.
+
+        The plan is computed from the sorted test IDs of the matching tags and memoized: the same tuple is returned
+        for all the devices matching the same tags of the catalog, whatever their other tags.
+
+        The parametrized tests matching the tags are resolved with the variables of the device and appended to the plan.
+        Their inputs are validated once per distinct device inputs: devices with the same inputs share the same test definition.
+        A parametrized test that cannot be resolved, e.g. because the device variable is missing or holds invalid inputs,
+        is part of the plan as an `AntaUnresolvedTestDefinition` holding the reason of the error.
+
+        With `merge_tests`, the compatible definitions of the plan are merged, whatever their `filters` input.
+        See `merge_test_definitions()`.
+
+        Parameters
+        ----------
+        tags
+            The tags of the device.
+        selected_tags
+            The selected tags.
+        variables
+            The variables of the device, holding the inputs of the parametrized tests.
+        merge_tests
+            Merge the compatible definitions of the tests declaring mergeable inputs.
+
+        Returns
+        -------
+        tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]
+            The tests matching the tags, without duplicates and in the order of the catalog, followed by the parametrized tests.
+
+        Raises
+        ------
+        ValueError
+            If the indexes have not been built prior to method call.
+        """
+        key = self._plan_key(tags, selected_tags, merge_tests=merge_tests)
+        matching_tags, selected, _ = key
+        plan: tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...] | None
+        if (plan := self._plans.get(key)) is None:
+            # Tests without tags are indexed with the None tag
+            indexed_tags: Iterable[str | None] = chain(matching_tags, (None,)) if selected is None else selected
+            ids_lists = [self._tag_to_ids[tag] for tag in indexed_tags if tag in self._tag_to_ids]
+            ids_lists.extend(
+                ids
+                for expression, ids in self._expression_to_ids.items()
+                if expression.match(matching_tags) and (selected is None or not selected.isdisjoint(expression.positive_tags))
+            )
+            test_ids: list[int] = ids_lists[0] if len(ids_lists) == 1 else sorted(set().union(*ids_lists))
+            # Each parametrized test is resolved to a single test definition
+            self._plan_lengths[key] = len(test_ids)
+            # Parametrized tests have the highest IDs
+            if (count := bisect_left(test_ids, len(self._indexed_tests))) < len(test_ids):
+                self._parametrized_plans[key] = test_ids[count:]
+                test_ids = test_ids[:count]
+            plan = tuple(map(self._indexed_tests.__getitem__, test_ids))
+            if merge_tests:
+                plan = tuple(merge_test_definitions(plan, ignore_filters=True))
+            self._plans[key] = plan
+        if (parametrized_ids := self._parametrized_plans.get(key)) is not None:
+            plan += tuple(self._resolve_test(test_id, variables if variables is not None else {}) for test_id in parametrized_ids)
+            if merge_tests:
+                resolved_tests = merge_test_definitions((test for test in plan if isinstance(test, AntaTestDefinition)), ignore_filters=True)
+                plan = (*resolved_tests, *(test for test in plan if isinstance(test, AntaUnresolvedTestDefinition)))
+        return plan
+
+    def get_unmerged_test_count(self, tags: Iterable[str], *, selected_tags: AbstractSet[str] | None = None) -> int:
+        """Return the number of tests of a merged test plan before merging the tests.
+
+        Parameters
+        ----------
+        tags
+            The tags of the device.
+        selected_tags
+            The selected tags.
+
+        Returns
+        -------
+        int
+            The number of tests of the plan returned by `get_test_plan()` with `merge_tests` before merging the tests.
+
+        Raises
+        ------
+        ValueError
+            If the merged test plan has not been computed using `get_test_plan()`.
+        """
+        if (count := self._plan_lengths.get(self._plan_key(tags, selected_tags, merge_tests=True))) is None:
+            msg = "The merged test plan has not been computed yet. Call get_test_plan() first."
+            raise ValueError(msg)
+        return count
+
+    def _plan_key(self, tags: Iterable[str], selected_tags: AbstractSet[str] | None, *, merge_tests: bool) -> tuple[frozenset[str], frozenset[str] | None, bool]:
+        """Return the key of the memoized test plan of a device, made of the tags of the catalog matching the device tags and selected tags."""
+        if not self.indexes_built:
+            msg = "Indexes have not been built yet. Call build_indexes() first."
+            raise ValueError(msg)
+        matching_tags = frozenset(tag for tag in tags if tag in self._tag_to_ids or tag in self._expression_tags)
+        selected = None if selected_tags is None else frozenset(tag for tag in selected_tags if tag in matching_tags)
+        return (matching_tags, selected, merge_tests)
+
+    def _resolve_test(self, test_id: int, variables: Mapping[str, Any]) -> AntaTestDefinition | AntaUnresolvedTestDefinition:
+        """Return the test definition of a parametrized test resolved with the variables of a device, memoized by device inputs."""
+        test = self._indexed_parametrized_tests[test_id - len(self._indexed_tests)]
+        key = (test_id, _inputs_key(variables.get(test.inputs_from)))
+        if (definition := self._resolved_tests.get(key)) is None:
+            try:
+                definition = test.resolve(variables)
+            except ValueError as e:
+                definition = AntaUnresolvedTestDefinition(test=test.test, error=str(e))
+            self._resolved_tests[key] = definition
+        return definition
@@ -11,19 +11,37 @@ from typing import TYPE_CHECKING
 
 import click
 from rich.pretty import pretty_repr
+from yaml import YAMLError
 
+from anta.catalog import AntaCatalog
 from anta.cli.console import console
-from anta.cli.utils import catalog_options
+from anta.cli.utils import ExitCode, catalog_file_options
 
 if TYPE_CHECKING:
-    from anta.catalog import AntaCatalog
+    from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
 @click.command
-@catalog_options
-def catalog(catalog: AntaCatalog) -> None:
+@click.pass_context
+@catalog_file_options
+@click.option(
+    "--workers",
+    help="Check the catalog using this number of worker processes, 0 to use all processors. Test definitions are not displayed when using worker processes.",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+)
+def catalog(ctx: click.Context, catalog: Path, catalog_format: str, workers: int) -> None:
     """Check that the catalog is valid."""
-    console.print(f"[bold][green]Catalog is valid: {catalog.filename}")
-    console.print(pretty_repr(catalog.tests))
+    file_format = catalog_format.lower()
+    try:
+        if workers == 1:
+            details = pretty_repr(AntaCatalog.parse(catalog, file_format=file_format).tests)  # type: ignore[arg-type]
+        else:
+            details = f"Catalog contains {AntaCatalog.check(catalog, file_format=file_format, workers=workers or None)} tests"  # type: ignore[arg-type]
+    except (TypeError, ValueError, YAMLError, OSError):
+        ctx.exit(ExitCode.USAGE_ERROR)
+    console.print(f"[bold][green]Catalog is valid: {catalog}")
+    console.print(details)
@@ -45,7 +45,7 @@ def run_cmd(
         console.print(f"[bold red] Command '{c.command}' failed to execute!")
         ctx.exit(ExitCode.USAGE_ERROR)
     elif ofmt == "json":
-        console.print(c.json_output)
+        console.print(dict(c.json_output))
     elif ofmt == "text":
         console.print(c.text_output)
 
@@ -94,6 +94,6 @@ def run_template(
         console.print(f"[bold red] Command '{c.command}' failed to execute!")
         ctx.exit(ExitCode.USAGE_ERROR)
     elif ofmt == "json":
-        console.print(c.json_output)
+        console.print(dict(c.json_output))
     elif ofmt == "text":
         console.print(c.text_output)
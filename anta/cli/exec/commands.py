@@ -13,21 +13,22 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
-from yaml import safe_load
 
 from anta.cli.console import console
 from anta.cli.exec import utils
 from anta.cli.utils import inventory_options
+from anta.serialization import load_yaml
 
 if TYPE_CHECKING:
     from anta.inventory import AntaInventory
+    from anta.tags import TagExpression
 
 logger = logging.getLogger(__name__)
 
 
 @click.command
 @inventory_options
-def clear_counters(inventory: AntaInventory, tags: set[str] | None) -> None:
+def clear_counters(inventory: AntaInventory, tags: set[str] | TagExpression | None) -> None:
     """Clear counter statistics on EOS devices."""
     asyncio.run(utils.clear_counters(inventory, tags=tags))
 
@@ -51,14 +52,14 @@ def clear_counters(inventory: AntaInventory, tags: set[str] | None) -> None:
     default=f"anta_snapshot_{datetime.now(tz=timezone.utc).astimezone().strftime('%Y-%m-%d_%H_%M_%S')}",
     show_default=True,
 )
-def snapshot(inventory: AntaInventory, tags: set[str] | None, commands_list: Path, output: Path) -> None:
+def snapshot(inventory: AntaInventory, tags: set[str] | TagExpression | None, commands_list: Path, output: Path) -> None:
     """Collect commands output from devices in inventory."""
     console.print(f"Collecting data for {commands_list}")
     console.print(f"Output directory is {output}")
     try:
         with commands_list.open(encoding="UTF-8") as file:
             file_content = file.read()
-            eos_commands = safe_load(file_content)
+            eos_commands = load_yaml(file_content)
     except FileNotFoundError:
         logger.error("Error reading %s", commands_list)
         sys.exit(1)
@@ -94,7 +95,7 @@ def snapshot(inventory: AntaInventory, tags: set[str] | None, commands_list: Pat
 )
 def collect_tech_support(
     inventory: AntaInventory,
-    tags: set[str] | None,
+    tags: set[str] | TagExpression | None,
     output: Path,
     latest: int | None,
     *,
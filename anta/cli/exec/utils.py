@@ -23,13 +23,14 @@ from asynceapi import EapiCommandError
 
 if TYPE_CHECKING:
     from anta.inventory import AntaInventory
+    from anta.tags import TagExpression
 
 EOS_SCHEDULED_TECH_SUPPORT = "/mnt/flash/schedule/tech-support"
 INVALID_CHAR = "`~!@#$/"
 logger = logging.getLogger(__name__)
 
 
-async def clear_counters(anta_inventory: AntaInventory, tags: set[str] | None = None) -> None:
+async def clear_counters(anta_inventory: AntaInventory, tags: set[str] | TagExpression | None = None) -> None:
     """Clear counters."""
 
     async def clear(dev: AntaDevice) -> None:
@@ -53,7 +54,7 @@ async def collect_commands(
     inv: AntaInventory,
     commands: dict[str, list[str]],
     root_dir: Path,
-    tags: set[str] | None = None,
+    tags: set[str] | TagExpression | None = None,
 ) -> None:
     """Collect EOS commands."""
 
@@ -67,7 +68,7 @@ async def collect_commands(
             return
         if c.ofmt == "json":
             outfile = outdir / f"{safe_command(command)}.json"
-            content = json.dumps(c.json_output, indent=2)
+            content = json.dumps(dict(c.json_output), indent=2)
         elif c.ofmt == "text":
             outfile = outdir / f"{safe_command(command)}.log"
             content = c.text_output
@@ -96,7 +97,7 @@ async def collect_commands(
             logger.error("Error when collecting commands: %s", str(r))
 
 
-async def collect_show_tech(inv: AntaInventory, root_dir: Path, *, configure: bool, tags: set[str] | None = None, latest: int | None = None) -> None:
+async def collect_show_tech(inv: AntaInventory, root_dir: Path, *, configure: bool, tags: set[str] | TagExpression | None = None, latest: int | None = None) -> None:
     """Collect scheduled show-tech on devices."""
 
     async def collect(device: AntaDevice) -> None:
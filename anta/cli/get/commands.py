@@ -26,6 +26,7 @@ from .utils import create_inventory_from_ansible, create_inventory_from_cvp, exp
 
 if TYPE_CHECKING:
     from anta.inventory import AntaInventory
+    from anta.tags import TagExpression
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +110,7 @@ def from_ansible(ctx: click.Context, output: Path, ansible_group: str, ansible_i
 @click.command
 @inventory_options
 @click.option("--connected/--not-connected", help="Display inventory after connection has been created", default=False, required=False)
-def inventory(inventory: AntaInventory, tags: set[str] | None, *, connected: bool) -> None:
+def inventory(inventory: AntaInventory, tags: set[str] | TagExpression | None, *, connected: bool) -> None:
     """Show inventory loaded in ANTA."""
     # TODO: @gmuloc - tags come from context - we cannot have everything..
     # ruff: noqa: ARG001
@@ -11,7 +11,6 @@ import inspect
 import json
 import logging
 import pkgutil
-import re
 import sys
 import textwrap
 from pathlib import Path
@@ -28,6 +27,8 @@ from anta.cli.utils import ExitCode
 from anta.inventory import AntaInventory
 from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
 from anta.models import AntaTest
+from anta.registry import RegisteredTest, extract_examples, find_tests
+from anta.serialization import dump_yaml, load_yaml
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -125,7 +126,7 @@ def write_inventory_to_file(hosts: list[AntaInventoryHost], output: Path) -> Non
     """Write a file inventory from pydantic models."""
     i = AntaInventoryInput(hosts=hosts)
     with output.open(mode="w", encoding="UTF-8") as out_fd:
-        out_fd.write(yaml.dump({AntaInventory.INVENTORY_ROOT_KEY: yaml.safe_load(i.yaml())}))
+        out_fd.write(dump_yaml({AntaInventory.INVENTORY_ROOT_KEY: i.model_dump(mode="json", serialize_as_any=True, exclude_unset=True)}))
     logger.info("ANTA inventory file has been created: '%s'", output)
 
 
@@ -187,7 +188,7 @@ def create_inventory_from_ansible(inventory: Path, output: Path, ansible_group:
     """
     try:
         with inventory.open(encoding="utf-8") as inv:
-            ansible_inventory = yaml.safe_load(inv)
+            ansible_inventory = load_yaml(inv)
     except yaml.constructor.ConstructorError as exc:
         if exc.problem and "!vault" in exc.problem:
             logger.error(
@@ -217,6 +218,8 @@ def create_inventory_from_ansible(inventory: Path, output: Path, ansible_group:
 def explore_package(module_name: str, test_name: str | None = None, *, short: bool = False, count: bool = False) -> int:
     """Parse ANTA test submodules recursively and print AntaTest examples.
 
+    The tests of the `anta.tests` package are looked up in the static registry of ANTA tests, without importing their modules.
+
     Parameters
     ----------
     module_name
@@ -233,6 +236,9 @@ def explore_package(module_name: str, test_name: str | None = None, *, short: bo
     int:
         The number of tests found.
     """
+    if (registered_tests := find_tests(module_name, test_name)) is not None:
+        return print_registered_tests(registered_tests, short=short, count=count)
+
     try:
         module_spec = importlib.util.find_spec(module_name)
     except ModuleNotFoundError:
@@ -316,18 +322,48 @@ def find_tests_examples(qname: str, test_name: str | None, *, short: bool = Fals
     return tests_found
 
 
-def print_test(test: type[AntaTest], *, short: bool = False) -> None:
+def print_registered_tests(tests: list[RegisteredTest], *, short: bool = False, count: bool = False) -> int:
+    """Print tests from the static registry of ANTA tests, grouped by module.
+
+    Parameters
+    ----------
+    tests
+        The registered tests to print, sorted by module.
+    short
+        If True, only print test names without their inputs.
+    count
+        If True, only count the tests.
+
+    Returns
+    -------
+    int:
+        The number of tests found.
+    """
+    if count:
+        return len(tests)
+    module = None
+    for test in tests:
+        if test.module != module:
+            module = test.module
+            console.print(f"{module}:")
+        print_test(test, short=short)
+    return len(tests)
+
+
+def print_test(test: type[AntaTest] | RegisteredTest, *, short: bool = False) -> None:
     """Print a single test.
 
     Parameters
     ----------
     test
-        the representation of the AntaTest as returned by inspect.getmembers
+        the representation of the AntaTest as returned by inspect.getmembers or its description in the static registry of ANTA tests
     short
         If True, only print test names without their inputs.
     """
-    if not test.__doc__ or (example := extract_examples(test.__doc__)) is None:
-        msg = f"Test {test.name} in module {test.__module__} is missing an Example"
+    example = test.example if isinstance(test, RegisteredTest) else extract_examples(test.__doc__) if test.__doc__ else None
+    if example is None:
+        module = test.module if isinstance(test, RegisteredTest) else test.__module__
+        msg = f"Test {test.name} in module {module} is missing an Example"
         raise LookupError(msg)
     # Picking up only the inputs in the examples
     # Need to handle the fact that we nest the routing modules in Examples.
@@ -344,16 +380,3 @@ def print_test(test: type[AntaTest], *, short: bool = False) -> None:
     console.print(f"      # {test.description}", soft_wrap=True)
     if not short and len(inputs) > test_name_line + 2:  # There are params
         console.print(textwrap.indent(textwrap.dedent("\n".join(inputs[test_name_line + 1 : -1])), " " * 6))
-
-
-def extract_examples(docstring: str) -> str | None:
-    """Extract the content of the Example section in a Numpy docstring.
-
-    Returns
-    -------
-    str | None
-        The content of the section if present, None if the section is absent or empty.
-    """
-    pattern = r"Examples\s*--------\s*(.*)(?:\n\s*\n|\Z)"
-    match = re.search(pattern, docstring, flags=re.DOTALL)
-    return match[1].strip() if match and match[1].strip() != "" else None
@@ -17,6 +17,7 @@ from anta.result_manager.models import AntaTestStatus
 if TYPE_CHECKING:
     from anta.catalog import AntaCatalog
     from anta.inventory import AntaInventory
+    from anta.tags import TagExpression
 
 
 class IgnoreRequiredWithHelp(AliasedGroup):
@@ -57,6 +58,15 @@ HIDE_STATUS.remove("unset")
 @click.pass_context
 @inventory_options
 @catalog_options
+@click.option(
+    "--trusted-catalog",
+    help="Only check the syntax of the test catalog, without validating the test definitions. Test inputs are still validated, "
+    "once per distinct inputs of a test. Use it for catalogs already validated using `anta check catalog`.",
+    envvar="ANTA_TRUSTED_CATALOG",
+    show_envvar=True,
+    is_flag=True,
+    default=False,
+)
 @click.option(
     "--device",
     "-d",
@@ -103,10 +113,17 @@ HIDE_STATUS.remove("unset")
     is_flag=True,
     default=False,
 )
+@click.option(
+    "--merge-tests",
+    help="Merge the compatible definitions of the tests supporting it to reduce the number of commands sent to the devices.",
+    show_envvar=True,
+    is_flag=True,
+    default=False,
+)
 def nrfu(
     ctx: click.Context,
     inventory: AntaInventory,
-    tags: set[str] | None,
+    tags: set[str] | TagExpression | None,
     catalog: AntaCatalog,
     device: tuple[str],
     test: tuple[str],
@@ -115,6 +132,7 @@ def nrfu(
     ignore_status: bool,
     ignore_error: bool,
     dry_run: bool,
+    merge_tests: bool,
     catalog_format: str = "yaml",
 ) -> None:
     """Run ANTA tests on selected inventory devices."""
@@ -135,6 +153,7 @@ def nrfu(
     ctx.obj["device"] = device
     ctx.obj["test"] = test
     ctx.obj["dry_run"] = dry_run
+    ctx.obj["merge_tests"] = merge_tests
 
     # Invoke `anta nrfu table` if no command is passed
     if not ctx.invoked_subcommand:
@@ -44,6 +44,7 @@ def run_tests(ctx: click.Context) -> None:
     device = nrfu_ctx_params["device"] or None
     test = nrfu_ctx_params["test"] or None
     dry_run = nrfu_ctx_params["dry_run"]
+    merge_tests = nrfu_ctx_params["merge_tests"]
 
     catalog = ctx.obj["catalog"]
     inventory = ctx.obj["inventory"]
@@ -59,6 +60,7 @@ def run_tests(ctx: click.Context) -> None:
                 devices=set(device) if device else None,
                 tests=set(test) if test else None,
                 dry_run=dry_run,
+                merge_tests=merge_tests,
             )
         )
     if dry_run:
@@ -75,7 +77,7 @@ def print_settings(
     catalog: AntaCatalog,
 ) -> None:
     """Print ANTA settings before running tests."""
-    message = f"- {inventory}\n- Tests catalog contains {len(catalog.tests)} tests"
+    message = f"- {inventory}\n- Tests catalog contains {len(catalog.tests) + len(catalog.parametrized_tests)} tests"
     console.print(Panel.fit(message, style="cyan", title="[green]Settings"))
     console.print()
 
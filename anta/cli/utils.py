@@ -8,15 +8,19 @@ from __future__ import annotations
 import enum
 import functools
 import logging
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
 import click
 from yaml import YAMLError
 
+from anta.cache import PersistentCache
 from anta.catalog import AntaCatalog
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
+from anta.tags import TagExpression
 
 if TYPE_CHECKING:
     from click import Option
@@ -39,12 +43,20 @@ class ExitCode(enum.IntEnum):
     TESTS_FAILED = 4
 
 
-def parse_tags(ctx: click.Context, param: Option, value: str | None) -> set[str] | None:
+def parse_tags(ctx: click.Context, param: Option, value: str | None) -> set[str] | TagExpression | None:
     # ruff: noqa: ARG001
-    """Click option callback to parse an ANTA inventory tags."""
-    if value is not None:
-        return set(value.split(",")) if "," in value else {value}
-    return None
+    """Click option callback to parse an ANTA inventory tags.
+
+    A list of tags separated by commas is returned as a set and a tag expression as a TagExpression instance.
+    """
+    if value is None:
+        return None
+    if TagExpression.is_expression(value):
+        try:
+            return TagExpression(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from e
+    return set(value.split(",")) if "," in value else {value}
 
 
 def exit_with_code(ctx: click.Context) -> None:
@@ -181,6 +193,17 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
         is_flag=True,
         default=False,
     )
+    @click.option(
+        "--cache-dir",
+        help=(
+            "Directory of a persistent cache reusing the outputs of configuration-derived commands across runs when the device configuration is unchanged, "
+            "and the compiled test catalogs."
+        ),
+        show_envvar=True,
+        envvar="ANTA_CACHE_DIR",
+        required=False,
+        type=click.Path(file_okay=False, dir_okay=True, writable=True, path_type=Path),
+    )
     @click.option(
         "--inventory",
         "-i",
@@ -190,12 +213,21 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
         required=True,
         type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
     )
+    @click.option(
+        "--inventory-variables",
+        help="Path to a YAML file of device variables by device name, holding the inputs of the parametrized tests of the catalog.",
+        envvar="ANTA_INVENTORY_VARIABLES",
+        show_envvar=True,
+        required=False,
+        type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
+    )
     @click.pass_context
     @functools.wraps(f)
     def wrapper(
         ctx: click.Context,
         *args: tuple[Any],
         inventory: Path,
+        inventory_variables: Path | None,
         username: str,
         password: str | None,
         enable_password: str | None,
@@ -204,6 +236,7 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
         timeout: float,
         insecure: bool,
         disable_cache: bool,
+        cache_dir: Path | None,
         **kwargs: dict[str, Any],
     ) -> Any:
         # If help is invoke somewhere, do not parse inventory
@@ -241,8 +274,11 @@ def core_options(f: Callable[..., Any]) -> Callable[..., Any]:
                 timeout=timeout,
                 insecure=insecure,
                 disable_cache=disable_cache,
+                # The persistent cache database is closed by click at the end of the run
+                persistent_cache=ctx.with_resource(closing(PersistentCache(cache_dir))) if cache_dir is not None and not disable_cache else None,
+                variables=inventory_variables,
             )
-        except (TypeError, ValueError, YAMLError, OSError, InventoryIncorrectSchemaError, InventoryRootKeyError):
+        except (TypeError, ValueError, YAMLError, OSError, sqlite3.Error, InventoryIncorrectSchemaError, InventoryRootKeyError):
             ctx.exit(ExitCode.USAGE_ERROR)
         return f(*args, inventory=i, **kwargs)
 
@@ -255,7 +291,7 @@ def inventory_options(f: Callable[..., Any]) -> Callable[..., Any]:
     @core_options
     @click.option(
         "--tags",
-        help="List of tags using comma as separator: tag1,tag2,tag3.",
+        help="List of tags using comma as separator: tag1,tag2,tag3, or tag expression: '(tag1 or tag2) and not tag3'.",
         show_envvar=True,
         envvar="ANTA_TAGS",
         type=str,
@@ -267,7 +303,7 @@ def inventory_options(f: Callable[..., Any]) -> Callable[..., Any]:
     def wrapper(
         ctx: click.Context,
         *args: tuple[Any],
-        tags: set[str] | None,
+        tags: set[str] | TagExpression | None,
         **kwargs: dict[str, Any],
     ) -> Any:
         # If help is invoke somewhere, do not parse inventory
@@ -278,10 +314,17 @@ def inventory_options(f: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
-def catalog_options(f: Callable[..., Any]) -> Callable[..., Any]:
-    """Click common options when requiring a test catalog to execute ANTA tests."""
-
-    @click.option(
+def catalog_file_options(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Click common options to provide a test catalog file, without parsing it."""
+    f = click.option(
+        "--catalog-format",
+        envvar="ANTA_CATALOG_FORMAT",
+        show_envvar=True,
+        help="Format of the catalog file, either 'yaml' or 'json'",
+        default="yaml",
+        type=click.Choice(["yaml", "json"], case_sensitive=False),
+    )(f)
+    return click.option(
         "--catalog",
         "-c",
         envvar="ANTA_CATALOG",
@@ -295,15 +338,13 @@ def catalog_options(f: Callable[..., Any]) -> Callable[..., Any]:
             path_type=Path,
         ),
         required=True,
-    )
-    @click.option(
-        "--catalog-format",
-        envvar="ANTA_CATALOG_FORMAT",
-        show_envvar=True,
-        help="Format of the catalog file, either 'yaml' or 'json'",
-        default="yaml",
-        type=click.Choice(["yaml", "json"], case_sensitive=False),
-    )
+    )(f)
+
+
+def catalog_options(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Click common options when requiring a test catalog to execute ANTA tests."""
+
+    @catalog_file_options
     @click.pass_context
     @functools.wraps(f)
     def wrapper(
@@ -313,12 +354,16 @@ def catalog_options(f: Callable[..., Any]) -> Callable[..., Any]:
         catalog_format: str,
         **kwargs: dict[str, Any],
     ) -> Any:
+        # The --trusted-catalog option is only defined by the commands running the tests, not by `anta check catalog`
+        trusted = bool(kwargs.pop("trusted_catalog", False))
         # If help is invoke somewhere, do not parse catalog
         if ctx.obj.get("_anta_help"):
             return f(*args, catalog=None, **kwargs)
+        # Compile the catalog in the persistent cache directory, if any, to skip its validation on the next runs
+        cache_dir = None if ctx.params.get("disable_cache") else ctx.params.get("cache_dir")
         try:
             file_format = catalog_format.lower()
-            c = AntaCatalog.parse(catalog, file_format=file_format)  # type: ignore[arg-type]
+            c = AntaCatalog.parse(catalog, file_format=file_format, cache_dir=cache_dir, trusted=trusted)  # type: ignore[arg-type]
         except (TypeError, ValueError, YAMLError, OSError):
             ctx.exit(ExitCode.USAGE_ERROR)
         return f(*args, catalog=c, **kwargs)
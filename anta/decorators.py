@@ -120,6 +120,9 @@ def skip_on_platforms(platforms: list[str]) -> Callable[[F], F]:
     This decorator factory generates a decorator that will check the hardware model of the device
     the test is run on. If the model is in the list of platforms specified, the test will be skipped.
 
+    The platforms are also exposed as the `skipped_platforms` attribute of the decorated function so that
+    the ANTA runner can skip the test when preparing the run, see `AntaTest.is_skipped_on_platform()`.
+
     Parameters
     ----------
     platforms
@@ -167,6 +170,8 @@ def skip_on_platforms(platforms: list[str]) -> Callable[[F], F]:
 
             return await function(*args, **kwargs)
 
+        # Expose the platforms as static metadata, merged with the ones of any inner skip_on_platforms decorator
+        wrapper.skipped_platforms = frozenset(platforms) | getattr(function, "skipped_platforms", frozenset())  # type: ignore[attr-defined]
         return cast(F, wrapper)
 
     return decorator
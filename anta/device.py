@@ -6,10 +6,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import Counter
 from typing import TYPE_CHECKING, Any, Literal
+from weakref import WeakValueDictionary
 
 import asyncssh
 import httpcore
@@ -22,11 +24,15 @@ import asynceapi
 from anta import __DEBUG__
 from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaCommand
+from anta.parsers import get_parser
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
+    from anta.cache import PersistentCache, UnsupportedCommands
+    from anta.tools import ItemIndex
+
 logger = logging.getLogger(__name__)
 
 # Do not load the default keypairs multiple times due to a performance issue introduced in cryptography 37.0
@@ -50,16 +56,44 @@ class AntaDevice(ABC):
         True if remote command execution succeeds.
     hw_model : str
         Hardware model of the device.
+    eos_version : str | None
+        EOS version of the device.
     tags : set[str]
         Tags for this device.
+    variables : dict[str, Any]
+        Variables of this device, e.g. the inputs of the parametrized tests of a catalog.
     cache : Cache | None
         In-memory cache from aiocache library for this device (None if cache is disabled).
-    cache_locks : dict
+    cache_locks : WeakValueDictionary
         Dictionary mapping keys to asyncio locks to guarantee exclusive access to the cache if not disabled.
+        A lock is discarded as soon as no coroutine is using it.
+    cache_consumers : Counter
+        Number of planned consumers remaining for each cached command UID (None if cache is disabled).
+    parse_consumers : Counter
+        Number of planned consumers that have not finished yet for each cached command UID, used to release the outputs
+        parsed by `parse()` (None if cache is disabled).
+    persistent_cache : PersistentCache | None
+        On-disk cache shared across ANTA runs for the outputs of configuration-derived commands.
+    fingerprint : str | None
+        Fingerprint of the device state used to validate the outputs stored in the persistent cache.
+    unsupported_commands : UnsupportedCommands | None
+        Memo of the commands not supported on a hardware platform, usually shared by all the devices of an ANTA run.
+    parsed_outputs : dict[str, dict[str, tuple[Any, Any]]]
+        Outputs parsed by `parse()` for the registered cache consumers, by command UID and parser name, along with the parsed output.
+    item_index_memos : dict[tuple[str, ...], dict[tuple[int, Any, bool], ItemIndex]]
+        Indexes of the lists of the cached outputs built by `anta.tools.index_items()`, by command UIDs of the tests using them.
 
     """
 
-    def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False) -> None:
+    def __init__(
+        self,
+        name: str,
+        tags: set[str] | None = None,
+        *,
+        disable_cache: bool = False,
+        persistent_cache: PersistentCache | None = None,
+        variables: dict[str, Any] | None = None,
+    ) -> None:
         """Initialize an AntaDevice.
 
         Parameters
@@ -70,21 +104,36 @@ class AntaDevice(ABC):
             Tags for this device.
         disable_cache
             Disable caching for all commands for this device.
+        persistent_cache
+            On-disk cache to reuse configuration-derived outputs across ANTA runs. Ignored if `disable_cache` is True.
+        variables
+            Variables for this device.
 
         """
         self.name: str = name
         self.hw_model: str | None = None
+        self.eos_version: str | None = None
         self.tags: set[str] = tags if tags is not None else set()
         # A device always has its own name as tag
         self.tags.add(self.name)
+        self.variables: dict[str, Any] = variables if variables is not None else {}
         self.is_online: bool = False
         self.established: bool = False
         self.cache: Cache | None = None
-        self.cache_locks: defaultdict[str, asyncio.Lock] | None = None
+        self.cache_locks: WeakValueDictionary[str, asyncio.Lock] | None = None
+        self.cache_consumers: Counter[str] | None = None
+        self.parse_consumers: Counter[str] | None = None
+        self._inflight_commands: dict[str, asyncio.Future[tuple[Any, list[str]] | None]] = {}
+        self.persistent_cache: PersistentCache | None = None
+        self.fingerprint: str | None = None
+        self.unsupported_commands: UnsupportedCommands | None = None
+        self.parsed_outputs: dict[str, dict[str, tuple[Any, Any]]] = {}
+        self.item_index_memos: dict[tuple[str, ...], dict[tuple[int, Any, bool], ItemIndex]] = {}
 
         # Initialize cache if not disabled
         if not disable_cache:
             self._init_cache()
+            self.persistent_cache = persistent_cache
 
     @property
     @abstractmethod
@@ -102,7 +151,168 @@ class AntaDevice(ABC):
     def _init_cache(self) -> None:
         """Initialize cache for the device, can be overridden by subclasses to manipulate how it works."""
         self.cache = Cache(cache_class=Cache.MEMORY, ttl=60, namespace=self.name, plugins=[HitMissRatioPlugin()])
-        self.cache_locks = defaultdict(asyncio.Lock)
+        self.cache_locks = WeakValueDictionary()
+        self.cache_consumers = Counter()
+        self.parse_consumers = Counter()
+
+    def _get_cache_lock(self, uid: str) -> asyncio.Lock:
+        """Return the asyncio lock of a command UID, creating it if no coroutine is currently using it.
+
+        The caller must keep a reference to the returned lock while using it.
+
+        Parameters
+        ----------
+        uid
+            The command UID.
+        """
+        if self.cache_locks is None:
+            msg = f"Caching is not enabled on {self.name}"
+            raise RuntimeError(msg)
+        lock = self.cache_locks.get(uid)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.cache_locks[uid] = lock
+        return lock
+
+    def register_cache_consumers(self, commands: list[AntaCommand]) -> None:
+        """Register commands that will be collected from this device during the current run.
+
+        The runner calls this method with the commands of each test instance before running the tests.
+        Once all the registered consumers of a command UID have collected it, the output is evicted
+        from the cache instead of waiting for the cache TTL to expire.
+
+        Parameters
+        ----------
+        commands
+            The commands that will be collected.
+        """
+        if self.cache_consumers is None or self.parse_consumers is None:
+            return
+        uids = [command.uid for command in commands if command.use_cache]
+        self.cache_consumers.update(uids)
+        self.parse_consumers.update(uids)
+
+    def clear_cache_consumers(self) -> None:
+        """Forget all the registered cache consumers of this device and the outputs parsed for them."""
+        if self.cache_consumers is not None:
+            self.cache_consumers.clear()
+        if self.parse_consumers is not None:
+            self.parse_consumers.clear()
+        self.parsed_outputs.clear()
+        self.item_index_memos.clear()
+
+    def parse(self, command: AntaCommand, parser: str) -> Any:  # noqa: ANN401
+        """Return the output of a collected command parsed by a registered parser.
+
+        When caching is enabled on both the device and the command, the parsed output is memoized per command UID
+        for the consumers registered using `register_cache_consumers()`: the parser runs once for all the tests using
+        the same cached output. The memoized parsed outputs of a command UID are released once all its registered consumers
+        have finished, see `release_parse_consumers()`, whether they have used the parser or not, or when the cache consumers are cleared.
+
+        The parsed output is shared by the tests and must not be mutated.
+
+        Parameters
+        ----------
+        command
+            The collected command.
+        parser
+            Name of the parser, registered using the `anta.parsers.parser` decorator.
+
+        Returns
+        -------
+        Any
+            The parsed output.
+        """
+        parse_output = get_parser(parser)
+        if self.cache is None or self.parse_consumers is None or not command.use_cache or command.uid not in self.parse_consumers:
+            return parse_output(command.output)
+
+        parsed_outputs = self.parsed_outputs.setdefault(command.uid, {})
+        entry = parsed_outputs.get(parser)
+        # The parsed output is only valid for the output it has been parsed from
+        if entry is None or entry[0] is not command.output:
+            entry = (command.output, parse_output(command.output))
+            parsed_outputs[parser] = entry
+        return entry[1]
+
+    def item_index_memo(self, commands: list[AntaCommand]) -> dict[tuple[int, Any, bool], ItemIndex] | None:
+        """Return the memo of the indexes of the lists of the outputs of the commands of a test.
+
+        When caching is enabled, the tests whose commands have the same registered cache consumers share the same
+        memo of indexes, see `anta.tools.item_indexes()`. The memo is released as soon as the last registered consumer
+        of one of these commands has finished, see `release_parse_consumers()`, or when the cache consumers are cleared.
+
+        Parameters
+        ----------
+        commands
+            The commands of the test.
+
+        Returns
+        -------
+        dict[tuple[int, Any, bool], ItemIndex] | None
+            The memo of indexes or None if the outputs of the commands are not shared with other tests.
+        """
+        if self.cache is None or self.parse_consumers is None:
+            return None
+        uids = tuple(sorted({command.uid for command in commands if command.use_cache and command.uid in self.parse_consumers}))
+        if not uids:
+            return None
+        return self.item_index_memos.setdefault(uids, {})
+
+    def release_parse_consumers(self, commands: list[AntaCommand]) -> None:
+        """Release the registered consumers of commands of a test that has finished.
+
+        The outputs parsed by `parse()` for a command UID and the memos of indexes of `item_index_memo()` including this
+        command UID are released when its last registered consumer has finished.
+
+        Parameters
+        ----------
+        commands
+            The commands of the finished test.
+        """
+        if self.parse_consumers is None:
+            return
+        for command in commands:
+            if not command.use_cache or (uid := command.uid) not in self.parse_consumers:
+                continue
+            self.parse_consumers[uid] -= 1
+            if self.parse_consumers[uid] <= 0:
+                del self.parse_consumers[uid]
+                self.parsed_outputs.pop(uid, None)
+                for uids in [uids for uids in self.item_index_memos if uid in uids]:
+                    del self.item_index_memos[uids]
+
+    async def release_cache_consumers(self, commands: list[AntaCommand]) -> None:
+        """Release the registered consumers of commands that will not be collected from this device.
+
+        Tests that do not collect their commands, e.g. because a command is blocked, must call this method so the outputs
+        of these commands are evicted from the cache once their other consumers have collected them.
+
+        Parameters
+        ----------
+        commands
+            The commands that will not be collected.
+        """
+        for command in commands:
+            if command.use_cache:
+                await self._release_cache_entry(command.uid)
+
+    async def _release_cache_entry(self, uid: str) -> None:
+        """Decrement the number of remaining consumers of a command UID and evict its output from the cache when it reaches zero.
+
+        Command UIDs that have not been registered using `register_cache_consumers()` are left untouched and rely on the cache TTL.
+
+        Parameters
+        ----------
+        uid
+            The command UID.
+        """
+        if self.cache is None or self.cache_consumers is None or uid not in self.cache_consumers:
+            return
+        self.cache_consumers[uid] -= 1
+        if self.cache_consumers[uid] <= 0:
+            del self.cache_consumers[uid]
+            await self.cache.delete(uid)  # pylint: disable=no-member
 
     @property
     def cache_statistics(self) -> dict[str, Any] | None:
@@ -159,6 +369,21 @@ class AntaDevice(ABC):
             An identifier used to build the eAPI request ID.
         """
 
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect device commands output in a single request.
+
+        This coroutine can be overridden by subclasses of `AntaDevice` to collect several commands in a single request
+        to the device. The default implementation collects each command using `_collect()`.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        await asyncio.gather(*(self._collect(command=command, collection_id=collection_id) for command in commands))
+
     async def collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
         """Collect the output for a specified command.
 
@@ -166,9 +391,52 @@ class AntaDevice(ABC):
         this method prioritizes retrieving the output from the cache. In cases where the output isn't cached yet,
         it will be freshly collected and then stored in the cache for future access.
         The method employs asynchronous locks based on the command's UID to guarantee exclusive access to the cache.
+        If consumers of the command have been registered using `register_cache_consumers()`, the output is evicted from
+        the cache once the last of them has collected it. A consumer is released even if the collection fails.
+
+        When the output isn't cached yet and the device has a persistent cache, the output is retrieved from the persistent
+        cache if the command is configuration-derived and the device `fingerprint` has not changed since it was stored.
+
+        When caching is NOT enabled at the device level, the method collects the output via the private `_collect` method
+        without interacting with the cache. Concurrent collections of the same command are coalesced: the command is sent
+        once and its output is shared with all the callers.
+
+        When caching is NOT enabled at the command level, the method directly collects the output via the private `_collect` method.
+
+        When the device has an `unsupported_commands` memo, a command known to be unsupported on the device hardware model and
+        EOS version is not sent to the device: its errors are set from the memo. Commands failing because they are not supported
+        are added to the memo.
+
+        Parameters
+        ----------
+        command
+            The command to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        cached = self.cache is not None and self.cache_locks is not None and command.use_cache
+        try:
+            if self.unsupported_commands is not None and (errors := self.unsupported_commands.get(self, command)) is not None:
+                logger.debug("Command '%s' is known to be unsupported on %s, not sending it to %s", command.command, self.hw_model, self.name)
+                command.errors = errors
+                return
+
+            if cached:
+                await self._collect_with_cache(command=command, collection_id=collection_id)
+            elif command.use_cache:
+                await self._collect_coalesced(command=command, collection_id=collection_id)
+            else:
+                await self._collect(command=command, collection_id=collection_id)
+        finally:
+            # The consumer is released whatever the outcome of the collection, otherwise the output would stay in the cache
+            if cached:
+                await self._release_cache_entry(command.uid)
 
-        When caching is NOT enabled, either at the device or command level, the method directly collects the output
-        via the private `_collect` method without interacting with the cache.
+        if self.unsupported_commands is not None:
+            self.unsupported_commands.add(self, command)
+
+    async def _collect_with_cache(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Collect the output for a specified command from the device cache, collecting and storing it on a cache miss.
 
         Parameters
         ----------
@@ -177,20 +445,75 @@ class AntaDevice(ABC):
         collection_id
             An identifier used to build the eAPI request ID.
         """
+        if self.cache is None:
+            msg = f"Caching is not enabled on {self.name}"
+            raise RuntimeError(msg)
+        uid = command.uid
         # Need to ignore pylint no-member as Cache is a proxy class and pylint is not smart enough
         # https://github.com/pylint-dev/pylint/issues/7258
-        if self.cache is not None and self.cache_locks is not None and command.use_cache:
-            async with self.cache_locks[command.uid]:
-                cached_output = await self.cache.get(command.uid)  # pylint: disable=no-member
-
-                if cached_output is not None:
-                    logger.debug("Cache hit for %s on %s", command.command, self.name)
-                    command.output = cached_output
-                else:
-                    await self._collect(command=command, collection_id=collection_id)
-                    await self.cache.set(command.uid, command.output)  # pylint: disable=no-member
-        else:
+        async with self._get_cache_lock(uid):
+            cached_output = await self.cache.get(uid)  # pylint: disable=no-member
+
+            if cached_output is not None:
+                logger.debug("Cache hit for %s on %s", command.command, self.name)
+                command.output = cached_output
+            else:
+                await self._collect_with_persistent_cache(command=command, collection_id=collection_id)
+                await self.cache.set(uid, command.output)  # pylint: disable=no-member
+
+    async def _collect_coalesced(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Collect the output for a specified command, sharing the output of an identical in-flight command if any.
+
+        If the in-flight collection raises an exception, the command is collected again.
+
+        Parameters
+        ----------
+        command
+            The command to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        uid = command.uid
+        if (inflight := self._inflight_commands.get(uid)) is not None and (result := await asyncio.shield(inflight)) is not None:
+            logger.debug("Sharing in-flight output of %s on %s", command.command, self.name)
+            command.output, errors = result
+            command.errors = list(errors)
+            return
+
+        future: asyncio.Future[tuple[Any, list[str]] | None] = asyncio.get_running_loop().create_future()
+        self._inflight_commands[uid] = future
+        try:
+            await self._collect(command=command, collection_id=collection_id)
+            future.set_result((command.output, command.errors))
+        finally:
+            if not future.done():
+                future.set_result(None)
+            if self._inflight_commands.get(uid) is future:
+                del self._inflight_commands[uid]
+
+    async def _collect_with_persistent_cache(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Collect the output for a specified command, using the persistent cache if possible.
+
+        Parameters
+        ----------
+        command
+            The command to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        if self.persistent_cache is None or self.fingerprint is None or not self.persistent_cache.is_cacheable(command):
             await self._collect(command=command, collection_id=collection_id)
+            return
+
+        cached_output = self.persistent_cache.get(self.name, command.uid, self.fingerprint)
+        if cached_output is not None:
+            logger.debug("Persistent cache hit for %s on %s", command.command, self.name)
+            command.output = cached_output
+            return
+
+        await self._collect(command=command, collection_id=collection_id)
+        if command.collected and command.output is not None:
+            self.persistent_cache.set(self.name, command.uid, self.fingerprint, command.output)
 
     async def collect_commands(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
         """Collect multiple commands.
@@ -204,6 +527,42 @@ class AntaDevice(ABC):
         """
         await asyncio.gather(*(self.collect(command=command, collection_id=collection_id) for command in commands))
 
+    async def collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect multiple commands in a single request to the device.
+
+        The commands are collected using `_collect_batch()`, e.g. in a single eAPI request for an `AsyncEOSDevice`, without
+        interacting with the device cache. Like `collect()`, the commands known to be unsupported on the device hardware model
+        and EOS version are not sent to the device and the commands failing because they are not supported are added to the
+        `unsupported_commands` memo.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect. They must not use the cache.
+        collection_id
+            An identifier used to build the eAPI request ID.
+
+        Raises
+        ------
+        ValueError
+            If a command uses the cache.
+        """
+        if cached := [command.command for command in commands if command.use_cache]:
+            msg = f"Commands using the cache cannot be collected in a batch: {', '.join(cached)}"
+            raise ValueError(msg)
+        pending = []
+        for command in commands:
+            if self.unsupported_commands is not None and (errors := self.unsupported_commands.get(self, command)) is not None:
+                logger.debug("Command '%s' is known to be unsupported on %s, not sending it to %s", command.command, self.hw_model, self.name)
+                command.errors = errors
+            else:
+                pending.append(command)
+        if pending:
+            await self._collect_batch(pending, collection_id=collection_id)
+        if self.unsupported_commands is not None:
+            for command in pending:
+                self.unsupported_commands.add(self, command)
+
     @abstractmethod
     async def refresh(self) -> None:
         """Update attributes of an AntaDevice instance.
@@ -271,6 +630,8 @@ class AsyncEOSDevice(AntaDevice):
         enable: bool = False,
         insecure: bool = False,
         disable_cache: bool = False,
+        persistent_cache: PersistentCache | None = None,
+        variables: dict[str, Any] | None = None,
     ) -> None:
         """Instantiate an AsyncEOSDevice.
 
@@ -302,6 +663,10 @@ class AsyncEOSDevice(AntaDevice):
             eAPI protocol. Value can be 'http' or 'https'.
         disable_cache
             Disable caching for all commands for this device.
+        persistent_cache
+            On-disk cache to reuse configuration-derived outputs across ANTA runs. Ignored if `disable_cache` is True.
+        variables
+            Variables for this device.
 
         """
         if host is None:
@@ -310,7 +675,7 @@ class AsyncEOSDevice(AntaDevice):
             raise ValueError(message)
         if name is None:
             name = f"{host}{f':{port}' if port else ''}"
-        super().__init__(name, tags, disable_cache=disable_cache)
+        super().__init__(name, tags, disable_cache=disable_cache, persistent_cache=persistent_cache, variables=variables)
         if username is None:
             message = f"'username' is required to instantiate device '{self.name}'"
             logger.error(message)
@@ -372,7 +737,44 @@ class AsyncEOSDevice(AntaDevice):
         """
         return (self._session.host, self._session.port)
 
-    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:  # noqa: C901  function is too complex - because of many required except blocks
+    def _enable_commands(self) -> list[dict[str, str | int]]:
+        """Return the eAPI commands to gain privileged access, if required."""
+        if self.enable and self._enable_password is not None:
+            return [
+                {
+                    "cmd": "enable",
+                    "input": str(self._enable_password),
+                },
+            ]
+        if self.enable:
+            # No password
+            return [{"cmd": "enable"}]
+        return []
+
+    @staticmethod
+    def _eapi_command(command: AntaCommand) -> dict[str, str | int]:
+        """Return the eAPI command of an AntaCommand."""
+        return {"cmd": command.command, "revision": command.revision} if command.revision else {"cmd": command.command}
+
+    def _set_command_errors(self, command: AntaCommand, errors: list[str]) -> None:
+        """Set the errors of a command that failed on EOS and log them.
+
+        Parameters
+        ----------
+        command
+            The failed command.
+        errors
+            The errors returned by EOS.
+        """
+        command.errors = errors
+        if command.requires_privileges:
+            logger.error("Command '%s' requires privileged mode on %s. Verify user permissions and if the `enable` option is required.", command.command, self.name)
+        if command.supported:
+            logger.error("Command '%s' failed on %s: %s", command.command, self.name, errors[0] if len(errors) == 1 else errors)
+        else:
+            logger.debug("Command '%s' is not supported on '%s' (%s)", command.command, self.name, self.hw_model)
+
+    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
         """Collect device command output from EOS using aio-eapi.
 
         Supports outformat `json` and `text` as output structure.
@@ -386,18 +788,7 @@ class AsyncEOSDevice(AntaDevice):
         collection_id
             An identifier used to build the eAPI request ID.
         """
-        commands: list[dict[str, str | int]] = []
-        if self.enable and self._enable_password is not None:
-            commands.append(
-                {
-                    "cmd": "enable",
-                    "input": str(self._enable_password),
-                },
-            )
-        elif self.enable:
-            # No password
-            commands.append({"cmd": "enable"})
-        commands += [{"cmd": command.command, "revision": command.revision}] if command.revision else [{"cmd": command.command}]
+        commands = [*self._enable_commands(), self._eapi_command(command)]
         try:
             response: list[dict[str, Any] | str] = await self._session.cli(
                 commands=commands,
@@ -409,15 +800,7 @@ class AsyncEOSDevice(AntaDevice):
             command.output = response[-1]
         except asynceapi.EapiCommandError as e:
             # This block catches exceptions related to EOS issuing an error.
-            command.errors = e.errors
-            if command.requires_privileges:
-                logger.error(
-                    "Command '%s' requires privileged mode on %s. Verify user permissions and if the `enable` option is required.", command.command, self.name
-                )
-            if command.supported:
-                logger.error("Command '%s' failed on %s: %s", command.command, self.name, e.errors[0] if len(e.errors) == 1 else e.errors)
-            else:
-                logger.debug("Command '%s' is not supported on '%s' (%s)", command.command, self.name, self.hw_model)
+            self._set_command_errors(command, e.errors)
         except TimeoutException as e:
             # This block catches Timeout exceptions.
             command.errors = [exc_to_str(e)]
@@ -446,6 +829,54 @@ class AsyncEOSDevice(AntaDevice):
             anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
         logger.debug("%s: %s", self.name, command)
 
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect device commands output from EOS in a single eAPI request.
+
+        The commands are sent in eAPI requests grouping consecutive commands with the same output format and version.
+        EOS stops executing the commands of a request at the first failing command: the errors of this command are set
+        and the following commands are collected in a new request. If a request fails for another reason, e.g. a timeout,
+        its commands are collected individually using `_collect()`.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        enable_commands = self._enable_commands()
+        pending = list(commands)
+        while pending:
+            first = pending[0]
+            size = next((i for i, command in enumerate(pending) if (command.ofmt, command.version) != (first.ofmt, first.version)), len(pending))
+            batch, pending = pending[:size], pending[size:]
+            try:
+                response: list[dict[str, Any] | str] = await self._session.cli(
+                    commands=[*enable_commands, *(self._eapi_command(command) for command in batch)],
+                    ofmt=first.ofmt,
+                    version=first.version,
+                    req_id=f"ANTA-{collection_id}-{id(first)}" if collection_id else f"ANTA-{id(first)}",
+                )  # type: ignore[assignment] # multiple commands returns a list
+            except asynceapi.EapiCommandError as e:
+                if len(e.passed) < len(enable_commands):
+                    # Failed to gain privileged access, collect the commands individually to report the errors
+                    await super()._collect_batch(batch, collection_id=collection_id)
+                    continue
+                outputs = e.passed[len(enable_commands) :]
+                self._set_command_errors(batch[len(outputs)], e.errors)
+                # The commands following the failed command have not been executed
+                pending = batch[len(outputs) + 1 :] + pending
+            except (TimeoutException, ConnectError, OSError, HTTPError) as e:
+                logger.debug("Cannot collect %s commands in a single request on %s (%s), collecting them individually", len(batch), self.name, exc_to_str(e))
+                await super()._collect_batch(batch, collection_id=collection_id)
+                continue
+            else:
+                # Do not keep responses of 'enable' command
+                outputs = response[len(enable_commands) :]
+            for command, output in zip(batch, outputs):
+                command.output = output
+                logger.debug("%s: %s", self.name, command)
+
     async def refresh(self) -> None:
         """Update attributes of an AsyncEOSDevice instance.
 
@@ -453,6 +884,8 @@ class AsyncEOSDevice(AntaDevice):
         - is_online: When a device IP is reachable and a port can be open
         - established: When a command execution succeeds
         - hw_model: The hardware model of the device
+        - eos_version: The EOS version of the device
+        - fingerprint: The device state fingerprint if a persistent cache is used
         """
         logger.debug("Refreshing device %s", self.name)
         self.is_online = await self._session.check_connection()
@@ -463,6 +896,7 @@ class AsyncEOSDevice(AntaDevice):
                 logger.warning("Cannot get hardware information from device %s", self.name)
             else:
                 self.hw_model = show_version.json_output.get("modelName", None)
+                self.eos_version = show_version.json_output.get("version", None)
                 if self.hw_model is None:
                     logger.critical("Cannot parse 'show version' returned by device %s", self.name)
                 # in some cases it is possible that 'modelName' comes back empty
@@ -473,6 +907,25 @@ class AsyncEOSDevice(AntaDevice):
             logger.warning("Could not connect to device %s: cannot open eAPI port", self.name)
 
         self.established = bool(self.is_online and self.hw_model)
+        if self.established and self.persistent_cache is not None:
+            await self._refresh_fingerprint()
+
+    async def _refresh_fingerprint(self) -> None:
+        """Update the device state fingerprint used to validate the outputs stored in the persistent cache.
+
+        The fingerprint is a SHA-256 digest of the hardware model, the EOS version and the output of the `fingerprint_command`
+        of the persistent cache, i.e. the configuration sections the cached outputs depend on.
+        The configuration is only used to compute the digest: it is neither cached nor stored.
+        """
+        self.fingerprint = None
+        if self.persistent_cache is None:
+            return
+        config = AntaCommand(command=self.persistent_cache.fingerprint_command, ofmt="text", use_cache=False)
+        await self._collect(config)
+        if not config.collected:
+            logger.warning("Cannot compute the state fingerprint of device %s, the persistent cache will not be used", self.name)
+            return
+        self.fingerprint = hashlib.sha256(f"{self.hw_model}\n{self.eos_version}\n{config.text_output}".encode()).hexdigest()
 
     async def copy(self, sources: list[Path], destination: Path, direction: Literal["to", "from"] = "from") -> None:
         """Copy files to and from the device using asyncssh.scp().
@@ -18,7 +18,7 @@ class BFDPeer(BaseModel):
     Only IPv4 peers are supported for now.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     peer_address: IPv4Address
     """IPv4 address of a BFD peer."""
     vrf: str = "default"
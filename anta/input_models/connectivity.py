@@ -9,7 +9,7 @@ from ipaddress import IPv4Address
 from typing import Any
 from warnings import warn
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
 
 from anta.custom_types import Interface
 
@@ -17,7 +17,7 @@ from anta.custom_types import Interface
 class Host(BaseModel):
     """Model for a remote host to ping."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     destination: IPv4Address
     """IPv4 address to ping."""
     source: IPv4Address | Interface
@@ -30,6 +30,10 @@ class Host(BaseModel):
     """Specify datagram size. Defaults to 100."""
     df_bit: bool = False
     """Enable do not fragment bit in IP header. Defaults to False."""
+    interval: PositiveFloat | None = None
+    """Interval between the ping packets in seconds. Defaults to the EOS default."""
+    timeout: PositiveInt | None = None
+    """Time to wait for a response in seconds. Defaults to the EOS default."""
 
     def __str__(self) -> str:
         """Return a human-readable string representation of the Host for reporting.
@@ -43,10 +47,43 @@ class Host(BaseModel):
         return f"Host {self.destination} (src: {self.source}, vrf: {self.vrf}, size: {self.size}B, repeat: {self.repeat}{df_status})"
 
 
+class PingBatch(BaseModel):
+    """Model for the batches of pings sent in a single eAPI request.
+
+    EOS runs the commands of an eAPI request sequentially: the pings are grouped in requests whose worst-case duration,
+    `(repeat - 1) * interval + timeout` per ping, does not exceed the latency budget. The requests are sent concurrently.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    max_duration: PositiveFloat = 10.0
+    """Latency budget of an eAPI request in seconds. A ping exceeding the budget is sent in its own request. Defaults to 10."""
+    interval: PositiveFloat = 0.2
+    """Interval between the ping packets in seconds for the hosts without `interval`. Defaults to 0.2."""
+    timeout: PositiveInt = 1
+    """Time to wait for a response in seconds for the hosts without `timeout`. Defaults to 1."""
+
+    def duration(self, host: Host) -> float:
+        """Return the worst-case duration of the ping of a host in seconds.
+
+        Parameters
+        ----------
+        host
+            The host to ping.
+
+        Returns
+        -------
+        float
+            The worst-case duration of the ping.
+        """
+        interval = host.interval if host.interval is not None else self.interval
+        timeout = host.timeout if host.timeout is not None else self.timeout
+        return (host.repeat - 1) * interval + timeout
+
+
 class LLDPNeighbor(BaseModel):
     """LLDP (Link Layer Discovery Protocol) model representing the port details and neighbor information."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     port: Interface
     """The LLDP port for the local device."""
     neighbor_device: str
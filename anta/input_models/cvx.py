@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.custom_types import Hostname
 
@@ -15,5 +15,6 @@ from anta.custom_types import Hostname
 class CVXPeers(BaseModel):
     """Model for a CVX Cluster Peer."""
 
+    model_config = ConfigDict(frozen=True)
     peer_name: Hostname
     registration_state: Literal["Connecting", "Connected", "Registration error", "Registration complete", "Unexpected peer state"] = "Registration complete"
@@ -15,7 +15,7 @@ from anta.custom_types import Interface, PortChannelInterface
 class InterfaceState(BaseModel):
     """Model for an interface state."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     name: Interface
     """Interface to validate."""
     status: Literal["up", "down", "adminDown"] | None = None
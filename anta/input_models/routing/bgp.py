@@ -43,7 +43,7 @@ AFI_SAFI_EOS_KEY = {
 class BgpAddressFamily(BaseModel):
     """Model for a BGP address family."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     afi: Afi
     """BGP Address Family Identifier (AFI)."""
     safi: Safi | None = None
@@ -15,7 +15,7 @@ from pydantic import BaseModel, ConfigDict
 class IPSecPeer(BaseModel):
     """IPSec (Internet Protocol Security) model represents the details of an IPv4 security peer."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     peer: IPv4Address
     """The IPv4 address of the security peer."""
     vrf: str = "default"
@@ -36,7 +36,7 @@ class IPSecPeer(BaseModel):
 class IPSecConn(BaseModel):
     """Details of an IPv4 security connection for a peer."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     source_address: IPv4Address
     """The IPv4 address of the source in the security connection."""
     destination_address: IPv4Address
@@ -13,7 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class DnsServer(BaseModel):
     """Model for a DNS server configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     server_address: IPv4Address | IPv6Address
     """The IPv4 or IPv6 address of the DNS server."""
     vrf: str = "default"
@@ -15,7 +15,7 @@ from anta.custom_types import Port
 class StunClientTranslation(BaseModel):
     """STUN (Session Traversal Utilities for NAT) model represents the configuration of an IPv4-based client translations."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     source_address: IPv4Address
     """The IPv4 address of the STUN client"""
     source_port: Port = 4500
@@ -15,7 +15,7 @@ from anta.custom_types import Hostname
 class NTPServer(BaseModel):
     """Model for a NTP server."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     server_address: Hostname | IPv4Address
     """The NTP server address as an IPv4 address or hostname. The NTP server name defined in the running configuration
     of the device may change during DNS resolution, which is not handled in ANTA. Please provide the DNS-resolved server name.
@@ -9,15 +9,22 @@ import asyncio
 import logging
 from ipaddress import ip_address, ip_network
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import ValidationError
-from yaml import YAMLError, safe_load
+from yaml import YAMLError
 
 from anta.device import AntaDevice, AsyncEOSDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.inventory.models import AntaInventoryInput
 from anta.logger import anta_log_exception
+from anta.serialization import load_yaml
+from anta.tags import TagExpression, from_bitset, to_bitset
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from anta.cache import PersistentCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +36,8 @@ class AntaInventory(dict[str, AntaDevice]):
     INVENTORY_ROOT_KEY = "anta_inventory"
     # Supported Output format
     INVENTORY_OUTPUT_FORMAT: ClassVar[list[str]] = ["native", "json"]
+    # Devices and bitsets of their positions by tag used to evaluate tag expressions, see _select_devices()
+    _tag_index: tuple[list[AntaDevice], dict[str, int]] | None = None
 
     def __str__(self) -> str:
         """Human readable string representing the inventory."""
@@ -84,6 +93,7 @@ class AntaInventory(dict[str, AntaDevice]):
                 host=str(host.host),
                 port=host.port,
                 tags=host.tags,
+                variables=host.variables,
                 **updated_kwargs,
             )
             inventory.add_device(device)
@@ -182,6 +192,8 @@ class AntaInventory(dict[str, AntaDevice]):
         enable: bool = False,
         insecure: bool = False,
         disable_cache: bool = False,
+        persistent_cache: PersistentCache | None = None,
+        variables: str | Path | None = None,
     ) -> AntaInventory:
         """Create an AntaInventory instance from an inventory file.
 
@@ -205,6 +217,10 @@ class AntaInventory(dict[str, AntaDevice]):
             Disable SSH Host Key validation.
         disable_cache
             Disable cache globally.
+        persistent_cache
+            On-disk cache shared by all the devices to reuse configuration-derived outputs across ANTA runs.
+        variables
+            Path to a YAML file of device variables by device name. See `load_variables()`.
 
         Raises
         ------
@@ -223,6 +239,7 @@ class AntaInventory(dict[str, AntaDevice]):
             "timeout": timeout,
             "insecure": insecure,
             "disable_cache": disable_cache,
+            "persistent_cache": persistent_cache,
         }
         if username is None:
             message = "'username' is required to create an AntaInventory"
@@ -236,7 +253,7 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             filename = Path(filename)
             with filename.open(encoding="UTF-8") as file:
-                data = safe_load(file)
+                data = load_yaml(file)
         except (TypeError, YAMLError, OSError) as e:
             message = f"Unable to parse ANTA Device Inventory file '{filename}'"
             anta_log_exception(e, message, logger)
@@ -258,6 +275,9 @@ class AntaInventory(dict[str, AntaDevice]):
         AntaInventory._parse_networks(inventory_input, inventory, **kwargs)
         AntaInventory._parse_ranges(inventory_input, inventory, **kwargs)
 
+        if variables is not None:
+            inventory.load_variables(variables)
+
         return inventory
 
     @property
@@ -269,11 +289,57 @@ class AntaInventory(dict[str, AntaDevice]):
     # Public methods
     ###########################################################################
 
+    def load_variables(self, filename: str | Path) -> None:
+        """Load the variables of the devices from a YAML file.
+
+        The file maps device names to their variables, e.g. the inputs of the parametrized tests of a catalog:
+        ```
+        leaf1:
+          lldp_neighbors:
+            neighbors:
+              - port: Ethernet1
+                neighbor_device: spine1
+                neighbor_port: Ethernet1
+        ```
+        The variables of the file override the variables with the same name defined in the inventory file.
+
+        Parameters
+        ----------
+        filename
+            Path to the YAML file of device variables.
+
+        Raises
+        ------
+        InventoryIncorrectSchemaError
+            The file does not map device names to dictionaries of variables.
+        """
+        try:
+            filename = Path(filename)
+            with filename.open(encoding="UTF-8") as file:
+                data = load_yaml(file)
+        except (TypeError, YAMLError, OSError) as e:
+            message = f"Unable to parse ANTA Device Variables file '{filename}'"
+            anta_log_exception(e, message, logger)
+            raise
+
+        if data is None:
+            return
+        if not isinstance(data, dict) or not all(isinstance(variables, dict) for variables in data.values()):
+            exc = InventoryIncorrectSchemaError(f"Device variables file '{filename}' must map device names to dictionaries of variables")
+            anta_log_exception(exc, f"Device variables are invalid! (from {filename})", logger)
+            raise exc
+
+        for name, variables in data.items():
+            if (device := self.get(name)) is None:
+                logger.warning("Device %s of the variables file %s is not in the inventory", name, filename)
+                continue
+            device.variables.update(variables)
+
     ###########################################################################
     # GET methods
     ###########################################################################
 
-    def get_inventory(self, *, established_only: bool = False, tags: set[str] | None = None, devices: set[str] | None = None) -> AntaInventory:
+    def get_inventory(self, *, established_only: bool = False, tags: Iterable[str] | TagExpression | None = None, devices: set[str] | None = None) -> AntaInventory:
         """Return a filtered inventory.
 
         Parameters
@@ -281,7 +347,7 @@ class AntaInventory(dict[str, AntaDevice]):
         established_only
             Whether or not to include only established devices.
         tags
-            Tags to filter devices.
+            Tags to filter devices: devices having any of the given tags or devices whose tags match a tag expression.
         devices
             Names to filter devices.
 
@@ -290,21 +356,50 @@ class AntaInventory(dict[str, AntaDevice]):
         AntaInventory
             An inventory with filtered AntaDevice objects.
         """
+        tags_set = frozenset(tags) if tags is not None and not isinstance(tags, TagExpression) else None
 
         def _filter_devices(device: AntaDevice) -> bool:
             """Select the devices based on the inputs `tags`, `devices` and `established_only`."""
-            if tags is not None and all(tag not in tags for tag in device.tags):
+            if tags_set is not None and tags_set.isdisjoint(device.tags):
                 return False
             if devices is None or device.name in devices:
                 return bool(not established_only or device.established)
             return False
 
-        filtered_devices: list[AntaDevice] = list(filter(_filter_devices, self.values()))
+        candidates = self._select_devices(tags) if isinstance(tags, TagExpression) else self.values()
+        filtered_devices: list[AntaDevice] = list(filter(_filter_devices, candidates))
         result = AntaInventory()
         for device in filtered_devices:
             result.add_device(device)
         return result
 
+    def _select_devices(self, expression: TagExpression) -> list[AntaDevice]:
+        """Return the devices whose tags match a tag expression.
+
+        The expression is evaluated with bitwise operations on the positions of the devices by tag.
+        The index of the positions is built once and rebuilt when devices are added to or removed from the inventory.
+
+        Parameters
+        ----------
+        expression
+            Tag expression to match.
+
+        Returns
+        -------
+        list[AntaDevice]
+            The matching devices, in the inventory order.
+        """
+        if self._tag_index is None or len(self._tag_index[0]) != len(self):
+            devices = list(self.values())
+            positions: dict[str, list[int]] = {}
+            for position, device in enumerate(devices):
+                for tag in device.tags:
+                    positions.setdefault(tag, []).append(position)
+            self._tag_index = (devices, {tag: to_bitset(tag_positions, len(devices)) for tag, tag_positions in positions.items()})
+        devices, index = self._tag_index
+        selected = expression.select(index, (1 << len(devices)) - 1)
+        return [devices[position] for position in from_bitset(selected)]
+
     ###########################################################################
     # SET methods
     ###########################################################################
@@ -314,8 +409,14 @@ class AntaInventory(dict[str, AntaDevice]):
         if key != value.name:
             msg = f"The key must be the device name for device '{value.name}'. Use AntaInventory.add_device()."
             raise RuntimeError(msg)
+        self._tag_index = None
         return super().__setitem__(key, value)
 
+    def __delitem__(self, key: str) -> None:
+        """Remove a device from the inventory."""
+        self._tag_index = None
+        return super().__delitem__(key)
+
     def add_device(self, device: AntaDevice) -> None:
         """Add a device to final inventory.
 
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import logging
 import math
+from typing import Any
 
-import yaml
 from pydantic import BaseModel, ConfigDict, IPvAnyAddress, IPvAnyNetwork
 
 from anta.custom_types import Hostname, Port
+from anta.serialization import dump_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,8 @@ class AntaInventoryHost(BaseModel):
         Custom name of the device.
     tags : set[str]
         Tags of the device.
+    variables : dict[str, Any] | None
+        Variables of the device, e.g. the inputs of the parametrized tests of a catalog.
     disable_cache : bool
         Disable cache for this device.
 
@@ -40,6 +43,7 @@ class AntaInventoryHost(BaseModel):
     host: Hostname | IPvAnyAddress
     port: Port | None = None
     tags: set[str] | None = None
+    variables: dict[str, Any] | None = None
     disable_cache: bool = False
 
 
@@ -105,8 +109,6 @@ class AntaInventoryInput(BaseModel):
         str
             The YAML representation string of this model.
         """
-        # TODO: Pydantic and YAML serialization/deserialization is not supported natively.
-        # This could be improved.
+        # Pydantic does not support YAML serialization natively: the model is dumped to JSON compatible Python objects
         # https://github.com/pydantic/pydantic/issues/1043
-        # Explore if this worth using this: https://github.com/NowanIlfideme/pydantic-yaml
-        return yaml.safe_dump(yaml.safe_load(self.model_dump_json(serialize_as_any=True, exclude_unset=True)), indent=2, width=math.inf)
+        return dump_yaml(self.model_dump(mode="json", serialize_as_any=True, exclude_unset=True), indent=2, width=math.inf)
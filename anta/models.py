@@ -5,28 +5,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import re
+import sys
 from abc import ABC, abstractmethod
-from functools import wraps
+from copy import deepcopy
+from functools import cache, wraps
 from string import Formatter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
-from anta import GITHUB_SUGGESTION
+from anta import __DEBUG__, GITHUB_SUGGESTION
 from anta.custom_types import REGEXP_EOS_BLACKLIST_CMDS, Revision
 from anta.logger import anta_log_exception, exc_to_str
 from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.tags import TagExpression
+from anta.tools import item_indexes
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import Coroutine, Hashable, Mapping
 
     from rich.progress import Progress, TaskID
 
     from anta.device import AntaDevice
 
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
 F = TypeVar("F", bound=Callable[..., Any])
 # Proper way to type input class - revisit this later if we get any issue @gmuloc
 # This would imply overhead to define classes
@@ -34,6 +45,9 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 logger = logging.getLogger(__name__)
 
+BULK_THRESHOLD = 10
+"""Default minimum number of commands rendered from an AntaTemplate to collect them using the bulk command of the template."""
+
 
 class AntaParamsBaseModel(BaseModel):
     """Extends BaseModel and overwrite __getattr__ to return None on missing attribute."""
@@ -41,6 +55,66 @@ class AntaParamsBaseModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+_SCALAR_TYPES = (str, int, float, type(None))
+
+
+def _hashable(value: Any, mutable_models: set[type[BaseModel]] | None = None) -> Hashable:  # noqa: ANN401
+    """Return a hashable representation of a validated input value.
+
+    Dictionaries and sets are converted to frozensets so that their hash does not depend on the order of their items.
+
+    Parameters
+    ----------
+    value
+        Value of an `AntaTest.Input` field.
+    mutable_models
+        Optional set updated with the classes of the models found in the value that are not frozen.
+
+    Returns
+    -------
+    Hashable
+        A hashable object equal for equal values.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, BaseModel):
+        if mutable_models is not None and not value.model_config.get("frozen", False):
+            mutable_models.add(type(value))
+        return tuple([_hashable(value.__dict__.get(name), mutable_models) for name in type(value).model_fields])
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item, mutable_models)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item, mutable_models) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple([_hashable(item, mutable_models) for item in value])
+    return value
+
+
+@cache
+def params_model(field_names: tuple[str, ...]) -> type[AntaParamsBaseModel]:
+    """Return an AntaParams model to elegantly store AntaTemplate variables.
+
+    Models are cached by field names so that templates with the same variables share the same model.
+
+    Parameters
+    ----------
+    field_names
+        Names of the template variables.
+
+    Returns
+    -------
+    type[AntaParamsBaseModel]
+        The AntaParams model.
+    """
+    # Extracting the type from the params based on the expected field_names from the template
+    fields: dict[str, Any] = {key: (Any, ...) for key in field_names}
+    return create_model(
+        "AntaParams",
+        __base__=AntaParamsBaseModel,
+        **fields,
+    )
+
+
 class AntaTemplate:
     """Class to define a command template as Python f-string.
 
@@ -58,11 +132,17 @@ class AntaTemplate:
         eAPI output - json or text.
     use_cache
         Enable or disable caching for this AntaTemplate if the AntaDevice supports it.
+    bulk
+        Optional Python f-string of a command returning the outputs of many commands rendered from this template at once.
+        Example: 'show vlan'. Its variables must be a subset of the variables of `template`. See `AntaTest.use_bulk()`.
+    bulk_threshold
+        Minimum number of rendered commands to collect them using the bulk command. Templates whose bulk command returns
+        a large output, like a full routing table, should use a higher threshold.
     """
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         template: str,
         version: Literal[1, "latest"] = "latest",
@@ -70,29 +150,44 @@ class AntaTemplate:
         ofmt: Literal["json", "text"] = "json",
         *,
         use_cache: bool = True,
+        bulk: str | None = None,
+        bulk_threshold: int = BULK_THRESHOLD,
     ) -> None:
         self.template = template
         self.version = version
         self.revision = revision
         self.ofmt = ofmt
         self.use_cache = use_cache
+        self.bulk = bulk
+        self.bulk_threshold = bulk_threshold
 
-        # Create a AntaTemplateParams model to elegantly store AntaTemplate variables
-        field_names = [fname for _, fname, _, _ in Formatter().parse(self.template) if fname]
-        # Extracting the type from the params based on the expected field_names from the template
-        fields: dict[str, Any] = {key: (Any, ...) for key in field_names}
-        self.params_schema = create_model(
-            "AntaParams",
-            __base__=AntaParamsBaseModel,
-            **fields,
-        )
+        # The AntaParams model and the names of the template variables are computed on first use, see params_schema
+        self._params_schema: type[AntaParamsBaseModel] | None = None
+        self._field_names: frozenset[str] = frozenset()
+        # Validated command used as a prototype to render commands, see render()
+        self._prototype: AntaCommand | None = None
+        # Template of the bulk command, see render_bulk()
+        self._bulk_template: AntaTemplate | None = None
 
     def __repr__(self) -> str:
         """Return the representation of the class.
 
-        Copying pydantic model style, excluding `params_schema`
+        Copying pydantic model style, excluding private attributes and the bulk attributes if there is no bulk command
         """
-        return " ".join(f"{a}={v!r}" for a, v in vars(self).items() if a != "params_schema")
+        excluded = ("bulk", "bulk_threshold") if self.bulk is None else ()
+        return " ".join(f"{a}={v!r}" for a, v in vars(self).items() if not a.startswith("_") and a not in excluded)
+
+    @property
+    def params_schema(self) -> type[AntaParamsBaseModel]:
+        """Return the AntaParams model storing the variables of this template.
+
+        The model is created when first accessed and shared by all the templates having the same variables.
+        """
+        if self._params_schema is None:
+            field_names = tuple(dict.fromkeys(fname for _, fname, _, _ in Formatter().parse(self.template) if fname))
+            self._field_names = frozenset(field_names)
+            self._params_schema = params_model(field_names)
+        return self._params_schema
 
     def render(self, **params: str | int | bool) -> AntaCommand:
         """Render an AntaCommand from an AntaTemplate instance.
@@ -115,20 +210,92 @@ class AntaTemplate:
         ------
         AntaTemplateRenderError
             If a parameter is missing to render the AntaTemplate instance.
+        ValidationError
+            If a parameter is not a variable of the AntaTemplate instance.
         """
+        params_schema = self.params_schema
+        # Parameters are checked by name: the AntaParams model only validates them to report unexpected parameters.
+        # Missing parameters are reported when formatting the template.
+        if params.keys() > self._field_names:
+            params_schema(**params)
         try:
-            command = self.template.format(**params)
+            command = self.template.format_map(params)
         except (KeyError, SyntaxError) as e:
             raise AntaTemplateRenderError(self, e.args[0]) from e
-        return AntaCommand(
-            command=command,
-            ofmt=self.ofmt,
-            version=self.version,
-            revision=self.revision,
-            template=self,
-            params=self.params_schema(**params),
-            use_cache=self.use_cache,
-        )
+        command_params = params_schema.model_construct(None, **params)
+
+        # The command attributes inherited from the template are validated once, when building the prototype.
+        # Copying the prototype is cheaper than validating a new AntaCommand instance for every rendered command.
+        prototype = self._prototype
+        if (
+            prototype is None
+            or prototype.version != self.version
+            or prototype.revision != self.revision
+            or prototype.ofmt != self.ofmt
+            or prototype.use_cache != self.use_cache
+        ):
+            prototype = self._prototype = AntaCommand(
+                command=command,
+                ofmt=self.ofmt,
+                version=self.version,
+                revision=self.revision,
+                template=self,
+                params=command_params,
+                use_cache=self.use_cache,
+            )
+        return prototype.model_copy(update={"command": command, "params": command_params, "errors": []})
+
+    def render_bulk(self, commands: list[AntaCommand]) -> list[AntaCommand]:
+        """Render the bulk commands replacing commands rendered from this AntaTemplate instance.
+
+        Commands are grouped by the values of the variables of the bulk command: one bulk command is rendered per group,
+        in the order of the first command of each group. The parameters of the replaced commands are kept in the
+        `bulk_params` attribute of the bulk commands.
+
+        Parameters
+        ----------
+        commands
+            Commands rendered from this AntaTemplate instance.
+
+        Returns
+        -------
+        list[AntaCommand]
+            The rendered bulk commands.
+
+        Raises
+        ------
+        AntaTemplateRenderError
+            If a variable of the bulk command is not a variable of the rendered commands.
+        """
+        if self.bulk is None:
+            msg = f"AntaTemplate {self.template} has no bulk command"
+            raise ValueError(msg)
+        if (
+            (bulk_template := self._bulk_template) is None
+            or bulk_template.template != self.bulk
+            or bulk_template.version != self.version
+            or bulk_template.revision != self.revision
+            or bulk_template.ofmt != self.ofmt
+            or bulk_template.use_cache != self.use_cache
+        ):
+            bulk_template = self._bulk_template = AntaTemplate(self.bulk, self.version, self.revision, self.ofmt, use_cache=self.use_cache)
+        field_names = tuple(bulk_template.params_schema.model_fields)
+        groups: dict[tuple[Any, ...], list[AntaCommand]] = {}
+        for command in commands:
+            params = command.params.model_dump()
+            try:
+                key = tuple(params[name] for name in field_names)
+            except KeyError as e:
+                raise AntaTemplateRenderError(bulk_template, e.args[0]) from e
+            groups.setdefault(key, []).append(command)
+        bulk_commands = []
+        for key, group in groups.items():
+            bulk_command = bulk_template.render(**dict(zip(field_names, key)))
+            # Commands rendered from the bulk template reference this template so that they are identified as bulk commands of the test
+            bulk_command.template = self
+            bulk_command.bulk_params = [command.params for command in group]
+            bulk_commands.append(bulk_command)
+        return bulk_commands
 
 
 class AntaCommand(BaseModel):
@@ -165,6 +332,9 @@ class AntaCommand(BaseModel):
         Pydantic Model containing the variables values used to render the template.
     use_cache
         Enable or disable caching for this AntaCommand if the AntaDevice supports it.
+    bulk_params
+        If this command is a bulk command, parameters of the commands rendered from the template that it replaces.
+        See `AntaTemplate.render_bulk()`.
 
     """
 
@@ -179,24 +349,46 @@ class AntaCommand(BaseModel):
     errors: list[str] = []
     params: AntaParamsBaseModel = AntaParamsBaseModel()
     use_cache: bool = True
+    bulk_params: list[AntaParamsBaseModel] = []
 
     @property
     def uid(self) -> str:
-        """Generate a unique identifier for this command."""
-        uid_str = f"{self.command}_{self.version}_{self.revision or 'NA'}_{self.ofmt}"
-        # Ignoring S324 probable use of insecure hash function - sha1 is enough for our needs.
-        return hashlib.sha1(uid_str.encode()).hexdigest()  # noqa: S324
+        """Return a unique identifier for this command.
+
+        The identifier is computed once and stored on the instance. It is only computed again if the command,
+        version, revision or output format of the command have been modified.
+        """
+        key = (self.command, self.version, self.revision, self.ofmt)
+        if (cached_uid := self.__dict__.get("_uid")) is None or cached_uid[0] != key:
+            uid_str = f"{self.command}_{self.version}_{self.revision or 'NA'}_{self.ofmt}"
+            # Ignoring S324 probable use of insecure hash function - sha1 is enough for our needs.
+            # The identifier is interned so that equal commands share the same cache key object.
+            # Stored in the instance dictionary with the attributes it is computed from, like the cached hash of AntaTest.Input.
+            cached_uid = self.__dict__["_uid"] = (key, sys.intern(hashlib.sha1(uid_str.encode()).hexdigest()))  # noqa: S324
+        return cached_uid[1]
 
     @property
-    def json_output(self) -> dict[str, Any]:
-        """Get the command output as JSON."""
+    def items_params(self) -> list[AntaParamsBaseModel]:
+        """Return the parameters of the items whose output is returned by this command.
+
+        A bulk command returns the output of all the commands it replaces, any other command returns the output of its own parameters.
+        Tests rendering templates with a bulk command must iterate over these parameters instead of using `params` directly.
+        """
+        return self.bulk_params or [self.params]
+
+    @property
+    def json_output(self) -> Mapping[str, Any]:
+        """Get the command output as JSON.
+
+        The output is returned as a read-only view: it is not copied and can be shared with other tests through the device cache.
+        """
         if self.output is None:
             msg = f"There is no output for command '{self.command}'"
             raise RuntimeError(msg)
         if self.ofmt != "json" or not isinstance(self.output, dict):
             msg = f"Output of command '{self.command}' is invalid"
             raise RuntimeError(msg)
-        return dict(self.output)
+        return MappingProxyType(self.output)
 
     @property
     def text_output(self) -> str:
@@ -328,6 +520,9 @@ class AntaTest(ABC):
     # Optional class attributes
     name: ClassVar[str]
     description: ClassVar[str]
+    mergeable_inputs: ClassVar[tuple[str, ...]] = ()
+    """Names of the list inputs whose items can be concatenated to merge compatible definitions of this test,
+    see `anta.catalog.merge_test_definitions()`. The test must report its results per item so that they stay attributable."""
     __removal_in_version: ClassVar[str]
     """Internal class variable set by the `deprecated_test_class` decorator."""
 
@@ -364,16 +559,51 @@ class AntaTest(ABC):
             Define fields to overwrite in the TestResult object.
         """
 
-        model_config = ConfigDict(extra="forbid")
+        # Pydantic schemas of the inputs are built on first validation instead of when anta.tests modules are imported
+        # Inputs are frozen once validated so that their hash can be cached
+        model_config = ConfigDict(extra="forbid", defer_build=True, frozen=True)
         result_overwrite: ResultOverwrite | None = None
         filters: Filters | None = None
 
         def __hash__(self) -> int:
             """Implement generic hashing for AntaTest.Input.
 
-            This will work in most cases but this does not consider 2 lists with different ordering as equal.
+            The hash is computed from the field values. It does not depend on the order of the items of dictionaries and sets
+            but 2 lists with different ordering are not considered as equal. The hash is cached on first use, unless the inputs
+            include models that are not frozen: these models could be modified, making the cached hash stale.
+            """
+            if (cached_hash := self.__dict__.get("_hash")) is None:
+                mutable_models: set[type[BaseModel]] = set()
+                cached_hash = hash(_hashable(self, mutable_models))
+                if not mutable_models:
+                    # Stored in the instance dictionary as the model is frozen
+                    self.__dict__["_hash"] = cached_hash
+            return cached_hash
+
+        def __getstate__(self) -> dict[Any, Any]:
+            """Exclude the cached hash from the pickled state as string hashes are not the same in other Python processes."""
+            state = super().__getstate__()
+            state["__dict__"] = {name: value for name, value in state["__dict__"].items() if name != "_hash"}
+            return state
+
+        def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+            """Return a copy of the inputs without the cached hash as the copy can be updated.
+
+            Parameters
+            ----------
+            update
+                Values to change or add in the copy.
+            deep
+                Whether to make a deep copy of the inputs.
+
+            Returns
+            -------
+            Self
+                The copy of the inputs.
             """
-            return hash(self.model_dump_json())
+            copied = super().model_copy(update=update, deep=deep)
+            copied.__dict__.pop("_hash", None)
+            return copied
 
         class ResultOverwrite(BaseModel):
             """Test inputs model to overwrite result fields.
@@ -389,11 +619,25 @@ class AntaTest(ABC):
 
             """
 
-            model_config = ConfigDict(extra="forbid")
+            model_config = ConfigDict(extra="forbid", frozen=True)
             description: str | None = None
             categories: list[str] | None = None
             custom_field: str | None = None
 
+            def apply(self, result: TestResult) -> None:
+                """Overwrite the fields of a test result.
+
+                Parameters
+                ----------
+                result
+                    The result of the test using these inputs.
+                """
+                if self.categories:
+                    result.categories = self.categories
+                if self.description:
+                    result.description = self.description
+                result.custom_field = self.custom_field
+
         class Filters(BaseModel):
             """Runtime filters to map tests with list of tags or devices.
 
@@ -401,10 +645,12 @@ class AntaTest(ABC):
             ----------
             tags
                 Tag of devices on which to run the test.
+                Either a list of tags, the test runs on devices having any of these tags,
+                or a tag expression like `(spine or leaf) and not lab`, the test runs on devices whose tags match the expression.
             """
 
-            model_config = ConfigDict(extra="forbid")
-            tags: set[str] | None = None
+            model_config = ConfigDict(extra="forbid", frozen=True)
+            tags: set[str] | TagExpression | None = None
 
     def __init__(
         self,
@@ -458,17 +704,14 @@ class AntaTest(ABC):
             self.result.is_error(message=message)
             return
         if res_ow := self.inputs.result_overwrite:
-            if res_ow.categories:
-                self.result.categories = res_ow.categories
-            if res_ow.description:
-                self.result.description = res_ow.description
-            self.result.custom_field = res_ow.custom_field
+            res_ow.apply(self.result)
 
     def _init_commands(self, eos_data: list[dict[Any, Any] | str] | None) -> None:
         """Instantiate the `instance_commands` instance attribute from the `commands` class attribute.
 
         - Copy of the `AntaCommand` instances
         - Render all `AntaTemplate` instances using the `render()` method.
+        - Replace the rendered commands with the bulk commands of their template if `use_bulk()` returns True.
 
         Any template rendering error will set this test result status as 'error'.
         Any exception in user code in `render()` will set this test result status as 'error'.
@@ -479,7 +722,10 @@ class AntaTest(ABC):
                     self.instance_commands.append(cmd.model_copy())
                 elif isinstance(cmd, AntaTemplate):
                     try:
-                        self.instance_commands.extend(self.render(cmd))
+                        rendered_commands = self.render(cmd)
+                        if cmd.bulk is not None and self.use_bulk(cmd, rendered_commands):
+                            rendered_commands = cmd.render_bulk(rendered_commands)
+                        self.instance_commands.extend(rendered_commands)
                     except AntaTemplateRenderError as e:
                         self.result.is_error(message=f"Cannot render template {{{e.template}}}")
                         return
@@ -517,6 +763,10 @@ class AntaTest(ABC):
             msg = f"Class {cls.__module__}.{cls.__name__} is missing required class attribute(s): {', '.join(missing_attrs)}"
             raise AttributeError(msg)
 
+        if unknown_inputs := [name for name in cls.mergeable_inputs if name not in cls.Input.model_fields]:
+            msg = f"Class {cls.__module__}.{cls.__name__} has mergeable inputs that are not defined in its Input model: {', '.join(unknown_inputs)}"
+            raise AttributeError(msg)
+
         cls.name = getattr(cls, "name", cls.__name__)
         if not hasattr(cls, "description"):
             if not cls.__doc__ or cls.__doc__.strip() == "":
@@ -525,6 +775,17 @@ class AntaTest(ABC):
                 raise AttributeError(msg)
             cls.description = cls.__doc__.split(sep="\n", maxsplit=1)[0]
 
+    @classmethod
+    def is_skipped_on_platform(cls, hw_model: str | None) -> bool:
+        """Return True if the test is skipped on the hardware model by the `skip_on_platforms` decorator.
+
+        Parameters
+        ----------
+        hw_model
+            Hardware model of the device.
+        """
+        return hw_model is not None and hw_model in getattr(cls.test, "skipped_platforms", ())
+
     @property
     def module(self) -> str:
         """Return the Python module in which this AntaTest class is defined."""
@@ -550,6 +811,22 @@ class AntaTest(ABC):
         msg = f"AntaTemplate are provided but render() method has not been implemented for {self.module}.{self.__class__.__name__}"
         raise NotImplementedError(msg)
 
+    def use_bulk(self, template: AntaTemplate, commands: list[AntaCommand]) -> bool:
+        """Return True if the commands rendered from an AntaTemplate with a bulk command must be replaced by bulk commands.
+
+        By default, bulk commands are used when the number of rendered commands reaches the `bulk_threshold` of the template:
+        a few large requests are then cheaper for the device than one request per item. Can be overridden by subclasses,
+        for instance to let the user choose the collection strategy.
+
+        Parameters
+        ----------
+        template
+            AntaTemplate instance of this AntaTest with a bulk command.
+        commands
+            Commands rendered from the template using the `render()` method.
+        """
+        return len(commands) >= template.bulk_threshold
+
     @property
     def blocked(self) -> bool:
         """Check if CLI commands contain a blocked keyword."""
@@ -566,11 +843,31 @@ class AntaTest(ABC):
                     state = True
         return state
 
+    def batch_commands(self) -> list[list[AntaCommand]] | None:
+        """Group the commands of this test instance in batches collected in a single request to the device.
+
+        This method can be overridden by subclasses to reduce the number of requests to the device, e.g. one eAPI request
+        per batch for an `AsyncEOSDevice`. The batches must include all the commands of the `instance_commands` attribute,
+        which must not use the cache. See `AntaDevice.collect_batch()`.
+
+        Returns
+        -------
+        list[list[AntaCommand]] | None
+            The batches of commands. None by default: each command is collected in its own request.
+        """
+        return None
+
     async def collect(self) -> None:
         """Collect outputs of all commands of this test class from the device of this test instance."""
         try:
             if self.blocked is False:
-                await self.device.collect_commands(self.instance_commands, collection_id=self.name)
+                if (batches := self.batch_commands()) is None:
+                    await self.device.collect_commands(self.instance_commands, collection_id=self.name)
+                else:
+                    await asyncio.gather(*(self.device.collect_batch(batch, collection_id=self.name) for batch in batches))
+            else:
+                # The commands will not be collected
+                await self.device.release_cache_consumers(self.instance_commands)
         except Exception as e:  # noqa: BLE001
             # device._collect() is user-defined code.
             # We need to catch everything if we want the AntaTest object
@@ -618,45 +915,68 @@ class AntaTest(ABC):
             if self.result.result != "unset":
                 return self.result
 
-            # Data
-            if eos_data is not None:
-                self.save_commands_data(eos_data)
-                self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
-
-            # If some data is missing, try to collect
-            if not self.collected:
-                await self.collect()
-                if self.result.result != "unset":
-                    AntaTest.update_progress()
-                    return self.result
-
-                if cmds := self.failed_commands:
-                    unsupported_commands = [f"'{c.command}' is not supported on {self.device.hw_model}" for c in cmds if not c.supported]
-                    if unsupported_commands:
-                        msg = f"Test {self.name} has been skipped because it is not supported on {self.device.hw_model}: {GITHUB_SUGGESTION}"
-                        self.logger.warning(msg)
-                        self.result.is_skipped("\n".join(unsupported_commands))
-                    else:
-                        self.result.is_error(message="\n".join([f"{c.command} has failed: {', '.join(c.errors)}" for c in cmds]))
-                    AntaTest.update_progress()
-                    return self.result
-
             try:
-                function(self, **kwargs)
-            except Exception as e:  # noqa: BLE001
-                # test() is user-defined code.
-                # We need to catch everything if we want the AntaTest object
-                # to live until the reporting
-                message = f"Exception raised for test {self.name} (on device {self.device.name})"
-                anta_log_exception(e, message, self.logger)
-                self.result.is_error(message=exc_to_str(e))
-
-            # TODO: find a correct way to time test execution
-            AntaTest.update_progress()
-            return self.result
+                # Data
+                if eos_data is not None:
+                    self.save_commands_data(eos_data)
+                    self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
+
+                # If some data is missing, try to collect
+                if not self.collected:
+                    await self.collect()
+                    if self.result.result != "unset":
+                        AntaTest.update_progress()
+                        return self.result
+
+                    if cmds := self.failed_commands:
+                        unsupported_commands = [f"'{c.command}' is not supported on {self.device.hw_model}" for c in cmds if not c.supported]
+                        if unsupported_commands:
+                            msg = f"Test {self.name} has been skipped because it is not supported on {self.device.hw_model}: {GITHUB_SUGGESTION}"
+                            self.logger.warning(msg)
+                            self.result.is_skipped("\n".join(unsupported_commands))
+                        else:
+                            self.result.is_error(message="\n".join([f"{c.command} has failed: {', '.join(c.errors)}" for c in cmds]))
+                        AntaTest.update_progress()
+                        return self.result
+
+                # In debug mode, keep a copy of the outputs to detect tests mutating outputs shared through the device cache
+                outputs = deepcopy([command.output for command in self.instance_commands]) if __DEBUG__ else None
+
+                try:
+                    with item_indexes(self.device.item_index_memo(self.instance_commands)):
+                        function(self, **kwargs)
+                except Exception as e:  # noqa: BLE001
+                    # test() is user-defined code.
+                    # We need to catch everything if we want the AntaTest object
+                    # to live until the reporting
+                    message = f"Exception raised for test {self.name} (on device {self.device.name})"
+                    anta_log_exception(e, message, self.logger)
+                    self.result.is_error(message=exc_to_str(e))
+
+                if outputs is not None:
+                    self._check_outputs(outputs)
+
+                # TODO: find a correct way to time test execution
+                AntaTest.update_progress()
+                return self.result
+            finally:
+                # The outputs parsed for this test are released once all the tests using the same commands have finished
+                self.device.release_parse_consumers(self.instance_commands)
 
         return wrapper
 
+    def _check_outputs(self, outputs: list[dict[str, Any] | str | None]) -> None:
+        """Log an error for each command output that has been mutated by the test.
+
+        Parameters
+        ----------
+        outputs
+            Copy of the command outputs taken before running the test.
+        """
+        for command, output in zip(self.instance_commands, outputs):
+            if command.output != output:
+                self.logger.error("Test %s (on device %s) has mutated the output of command '%s'", self.name, self.device.name, command.command)
+
     @classmethod
     def update_progress(cls: type[AntaTest]) -> None:
         """Update progress bar for all AntaTest objects if it exists."""
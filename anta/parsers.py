@@ -0,0 +1,76 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Registry of the parsers of command outputs shared by ANTA tests.
+
+A parser is a function deriving a structure from the output of a command. Tests get parsed outputs using
+`AntaDevice.parse()`, which memoizes the result per command UID alongside the device cache so that a parser
+runs once per device and per collected output, whatever the number of tests using it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+P = TypeVar("P", bound=Callable[[Any], Any])
+
+PARSERS: dict[str, Callable[[Any], Any]] = {}
+"""Parsers registered using the `parser` decorator, by name."""
+
+
+def parser(name: str) -> Callable[[P], P]:
+    r"""Return a decorator registering a parser of command outputs.
+
+    The decorated function takes the output of a command, a dictionary or a string depending on the output format,
+    and returns the parsed output. It must not mutate the command output and the parsed output must be treated as
+    read-only by the tests as it is shared by all the tests using the same command output.
+
+    Examples
+    --------
+    ```python
+    @parser("logging_states")
+    def logging_states(output: str) -> str:
+        return output.partition("\n\nExternal configuration:")[0]
+    ```
+
+    Parameters
+    ----------
+    name
+        Name of the parser, used by the tests to get parsed outputs. Registering a parser with an existing name replaces the previous parser.
+
+    Returns
+    -------
+    Callable[[P], P]
+        A decorator registering the parser.
+    """
+
+    def decorator(function: P) -> P:
+        PARSERS[name] = function
+        return function
+
+    return decorator
+
+
+def get_parser(name: str) -> Callable[[Any], Any]:
+    """Return a registered parser.
+
+    Parameters
+    ----------
+    name
+        Name of the parser.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        The parser.
+
+    Raises
+    ------
+    ValueError
+        If there is no parser registered with this name.
+    """
+    try:
+        return PARSERS[name]
+    except KeyError:
+        msg = f"There is no parser named '{name}'. Registered parsers: {', '.join(sorted(PARSERS)) or 'none'}"
+        raise ValueError(msg) from None
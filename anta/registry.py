@@ -0,0 +1,198 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Static registry of the ANTA tests.
+
+The registry describes the tests of the `anta.tests` package: their name, module, description, categories, commands,
+documentation example and the JSON schema of their inputs. It is generated in the `registry.json` file of the `anta` package
+with `docs/scripts/generate_test_registry.py` and can be queried without importing the test modules.
+The module of a test is only imported when the test class is actually needed, see `RegisteredTest.load()`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+import logging
+import pkgutil
+import re
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from anta.models import AntaCommand, AntaTest
+from anta.serialization import load_json
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_PACKAGE = "anta.tests"
+REGISTRY_FILE = Path(__file__).parent / "registry.json"
+
+
+@dataclass(frozen=True)
+class RegisteredTest:
+    """Static description of an ANTA test.
+
+    Attributes
+    ----------
+    name
+        Name of the test.
+    module
+        Name of the Python module defining the test.
+    class_name
+        Name of the test class in its module.
+    description
+        Description of the test.
+    categories
+        Categories of the test.
+    commands
+        Commands and templates of commands collected by the test.
+    example
+        Content of the Examples section of the test docstring or None if the test has no example.
+    input_schema
+        JSON schema of the inputs of the test.
+    """
+
+    name: str
+    module: str
+    class_name: str
+    description: str
+    categories: tuple[str, ...]
+    commands: tuple[str, ...]
+    example: str | None
+    input_schema: dict[str, Any] = field(repr=False, compare=False)
+
+    @classmethod
+    def from_test(cls, test: type[AntaTest]) -> RegisteredTest:
+        """Describe an AntaTest subclass.
+
+        Parameters
+        ----------
+        test
+            The AntaTest subclass.
+
+        Returns
+        -------
+        RegisteredTest
+            The description of the test.
+        """
+        example = extract_examples(test.__doc__) if test.__doc__ else None
+        return cls(
+            name=test.name,
+            module=test.__module__,
+            class_name=test.__name__,
+            description=test.description,
+            categories=tuple(test.categories),
+            commands=tuple(command.command if isinstance(command, AntaCommand) else command.template for command in test.commands),
+            example=example,
+            input_schema=test.Input.model_json_schema(),
+        )
+
+    def load(self) -> type[AntaTest]:
+        """Import the module of the test and return the test class.
+
+        Returns
+        -------
+        type[AntaTest]
+            The AntaTest subclass.
+        """
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
+def extract_examples(docstring: str) -> str | None:
+    """Extract the content of the Example section in a Numpy docstring.
+
+    Returns
+    -------
+    str | None
+        The content of the section if present, None if the section is absent or empty.
+    """
+    pattern = r"Examples\s*--------\s*(.*)(?:\n\s*\n|\Z)"
+    match = re.search(pattern, docstring, flags=re.DOTALL)
+    return match[1].strip() if match and match[1].strip() != "" else None
+
+
+def build_registry(package: str = REGISTRY_PACKAGE) -> list[RegisteredTest]:
+    """Import all the modules of a package and describe the AntaTest subclasses they define.
+
+    Parameters
+    ----------
+    package
+        Name of the package defining the tests.
+
+    Returns
+    -------
+    list[RegisteredTest]
+        The descriptions of the tests, sorted by module and by name like the output of `anta get tests`.
+    """
+    tests: list[RegisteredTest] = []
+    module = importlib.import_module(package)
+    for module_info in pkgutil.walk_packages(module.__path__, prefix=f"{package}."):
+        if module_info.ispkg:
+            continue
+        test_module = importlib.import_module(module_info.name)
+        tests.extend(
+            RegisteredTest.from_test(obj)
+            for _, obj in inspect.getmembers(test_module, inspect.isclass)
+            if issubclass(obj, AntaTest) and obj is not AntaTest and obj.__module__ == test_module.__name__
+        )
+    return tests
+
+
+def dump_registry(tests: list[RegisteredTest]) -> str:
+    """Serialize the registry to JSON, one test per line.
+
+    Parameters
+    ----------
+    tests
+        The descriptions of the tests.
+
+    Returns
+    -------
+    str
+        The JSON document of the registry.
+    """
+    lines = [json.dumps(asdict(test), sort_keys=True) for test in tests]
+    return "[\n" + ",\n".join(lines) + "\n]\n"
+
+
+@cache
+def load_registry() -> tuple[RegisteredTest, ...] | None:
+    """Load the registry of the `anta.tests` package from the `registry.json` file of the `anta` package.
+
+    Returns
+    -------
+    tuple[RegisteredTest, ...] | None
+        The descriptions of the tests or None if the registry file is missing or invalid.
+    """
+    try:
+        data = load_json(REGISTRY_FILE.read_bytes())
+        return tuple(RegisteredTest(**{**entry, "categories": tuple(entry["categories"]), "commands": tuple(entry["commands"])}) for entry in data)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        logger.debug("Cannot load the ANTA test registry from %s: %s", REGISTRY_FILE, e)
+        return None
+
+
+def find_tests(module: str = REGISTRY_PACKAGE, test_name: str | None = None) -> list[RegisteredTest] | None:
+    """Return the registered tests of a module of the `anta.tests` package without importing it.
+
+    Parameters
+    ----------
+    module
+        Name of a package or module of `anta.tests`, e.g. `anta.tests.routing`.
+    test_name
+        If provided, only return the tests whose name starts with this value.
+
+    Returns
+    -------
+    list[RegisteredTest] | None
+        The registered tests of the module or None if the module is not part of the registry, e.g. a module of custom tests.
+    """
+    if (registry := load_registry()) is None:
+        return None
+    tests = [test for test in registry if test.module == module or test.module.startswith(f"{module}.")]
+    if not tests:
+        return None
+    return [test for test in tests if test_name is None or test.name.startswith(test_name)]
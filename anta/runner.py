@@ -9,22 +9,25 @@ import asyncio
 import logging
 import os
 import resource
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from anta import GITHUB_SUGGESTION
+from anta.cache import UnsupportedCommands
+from anta.catalog import AntaUnresolvedTestDefinition
 from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaTest
+from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.tags import TagExpression
 from anta.tools import Catchtime, cprofile
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
+    from collections.abc import Set as AbstractSet
 
     from anta.catalog import AntaCatalog, AntaTestDefinition
     from anta.device import AntaDevice
     from anta.inventory import AntaInventory
     from anta.result_manager import ResultManager
-    from anta.result_manager.models import TestResult
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +80,9 @@ def log_cache_statistics(devices: list[AntaDevice]) -> None:
             logger.info("Caching is not enabled on %s", device.name)
 
 
-async def setup_inventory(inventory: AntaInventory, tags: set[str] | None, devices: set[str] | None, *, established_only: bool) -> AntaInventory | None:
+async def setup_inventory(
+    inventory: AntaInventory, tags: set[str] | TagExpression | None, devices: set[str] | None, *, established_only: bool
+) -> AntaInventory | None:
     """Set up the inventory for the ANTA run.
 
     Parameters
@@ -85,7 +90,7 @@ async def setup_inventory(inventory: AntaInventory, tags: set[str] | None, devic
     inventory
         AntaInventory object that includes the device(s).
     tags
-        Tags to filter devices from the inventory.
+        Tags or tag expression to filter devices from the inventory.
     devices
         Devices on which to run tests. None means all devices.
     established_only
@@ -120,8 +125,8 @@ async def setup_inventory(inventory: AntaInventory, tags: set[str] | None, devic
 
 
 def prepare_tests(
-    inventory: AntaInventory, catalog: AntaCatalog, tests: set[str] | None, tags: set[str] | None
-) -> defaultdict[AntaDevice, set[AntaTestDefinition]] | None:
+    inventory: AntaInventory, catalog: AntaCatalog, tests: set[str] | None, tags: set[str] | TagExpression | None, *, merge_tests: bool = False
+) -> dict[AntaDevice, tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]] | None:
     """Prepare the tests to run.
 
     Parameters
@@ -133,35 +138,45 @@ def prepare_tests(
     tests
         Tests to run against devices. None means all tests.
     tags
-        Tags to filter devices from the inventory.
+        Tags or tag expression to filter devices from the inventory.
+    merge_tests
+        Merge the compatible test definitions of each device to reduce the number of tests and commands to run.
 
     Returns
     -------
-    defaultdict[AntaDevice, set[AntaTestDefinition]] | None
+    dict[AntaDevice, tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]] | None
         A mapping of devices to the tests to run or None if there are no tests to run.
+        Devices with the same matching tags share the same tuple of tests, unless the catalog has parametrized tests.
+        The parametrized tests that cannot be resolved with the variables of a device are reported with an error.
     """
     # Build indexes for the catalog. If `tests` is set, filter the indexes based on these tests
     catalog.build_indexes(filtered_tests=tests)
 
-    # Using a set to avoid inserting duplicate tests
-    device_to_tests: defaultdict[AntaDevice, set[AntaTestDefinition]] = defaultdict(set)
+    device_to_tests: dict[AntaDevice, tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]] = {}
 
     total_test_count = 0
+    unmerged_test_count = 0
 
     # Create the device to tests mapping from the tags
     for device in inventory.devices:
-        if tags:
+        selected_tags: AbstractSet[str] | None
+        if isinstance(tags, TagExpression):
+            # If there is a CLI tag expression, execute tests with the tags of the expression on the devices matching the expression
+            if not tags.match(device.tags):
+                continue
+            selected_tags = tags.positive_tags
+        elif tags:
             # If there are CLI tags, execute tests with matching tags for this device
-            if not (matching_tags := tags.intersection(device.tags)):
+            if tags.isdisjoint(device.tags):
                 # The device does not have any selected tag, skipping
                 continue
-            device_to_tests[device].update(catalog.get_tests_by_tags(matching_tags))
+            selected_tags = tags
         else:
-            # If there is no CLI tags, execute all tests that do not have any tags
-            device_to_tests[device].update(catalog.tag_to_tests[None])
-
-            # Then add the tests with matching tags from device tags
-            device_to_tests[device].update(catalog.get_tests_by_tags(device.tags))
+            # If there is no CLI tags, execute all tests that do not have any tags and the tests with matching tags from device tags
+            selected_tags = None
+        device_to_tests[device] = catalog.get_test_plan(device.tags, selected_tags=selected_tags, variables=device.variables, merge_tests=merge_tests)
+        if merge_tests:
+            unmerged_test_count += catalog.get_unmerged_test_count(device.tags, selected_tags=selected_tags)
 
         total_test_count += len(device_to_tests[device])
 
@@ -172,10 +187,59 @@ def prepare_tests(
         logger.warning(msg)
         return None
 
+    if merge_tests:
+        logger.info("Merged compatible tests: %s tests reduced to %s", unmerged_test_count, total_test_count)
+
     return device_to_tests
 
 
-def get_coroutines(selected_tests: defaultdict[AntaDevice, set[AntaTestDefinition]], manager: ResultManager) -> list[Coroutine[Any, Any, TestResult]]:
+def get_platform_skipped_result(device: AntaDevice, test: AntaTestDefinition) -> TestResult:
+    """Return the result of a test skipped on the device hardware model by the `skip_on_platforms` decorator.
+
+    Parameters
+    ----------
+    device
+        The device on which the test is skipped.
+    test
+        The definition of the skipped test.
+
+    Returns
+    -------
+    TestResult
+        The skipped test result.
+    """
+    result = TestResult(name=device.name, test=test.test.name, categories=test.test.categories, description=test.test.description)
+    if res_ow := test.inputs.result_overwrite:
+        res_ow.apply(result)
+    result.is_skipped(f"{test.test.__name__} test is not supported on {device.hw_model}.")
+    return result
+
+
+def get_unresolved_result(device: AntaDevice, test: AntaUnresolvedTestDefinition) -> TestResult:
+    """Return the result of a parametrized test that cannot be resolved with the variables of the device.
+
+    Parameters
+    ----------
+    device
+        The device on which the test cannot run.
+    test
+        The definition of the unresolved test.
+
+    Returns
+    -------
+    TestResult
+        The errored test result.
+    """
+    result = TestResult(name=device.name, test=test.test.name, categories=test.test.categories, description=test.test.description)
+    result.is_error(message=test.error)
+    return result
+
+
+def get_coroutines(
+    selected_tests: dict[AntaDevice, tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]],
+    manager: ResultManager,
+    unsupported_commands: UnsupportedCommands | None = None,
+) -> list[Coroutine[Any, Any, TestResult]]:
     """Get the coroutines for the ANTA run.
 
     Parameters
@@ -184,6 +248,9 @@ def get_coroutines(selected_tests: defaultdict[AntaDevice, set[AntaTestDefinitio
         A mapping of devices to the tests to run. The selected tests are generated by the `prepare_tests` function.
     manager
         A ResultManager
+    unsupported_commands
+        A memo of the commands not supported on a hardware platform, shared by all the devices. The devices consult it when collecting
+        commands.
 
     Returns
     -------
@@ -192,12 +259,26 @@ def get_coroutines(selected_tests: defaultdict[AntaDevice, set[AntaTestDefinitio
     """
     coros = []
     for device, test_definitions in selected_tests.items():
+        # The cache consumers are registered for the current run only
+        device.clear_cache_consumers()
+        device.unsupported_commands = unsupported_commands
         for test in test_definitions:
+            if isinstance(test, AntaUnresolvedTestDefinition):
+                # The inputs of a parametrized test are not valid for this device
+                logger.error("Unable to prepare test %s on device %s: %s", test.test.name, device.name, test.error)
+                manager.add(get_unresolved_result(device, test))
+                continue
+            if test.test.is_skipped_on_platform(device.hw_model):
+                # Do not instantiate tests that would be skipped by the skip_on_platforms decorator
+                manager.add(get_platform_skipped_result(device, test))
+                continue
             try:
                 test_instance = test.test(device=device, inputs=test.inputs)
-                manager.add(test_instance.result)
+                if test_instance.result.result == AntaTestStatus.UNSET:
+                    device.register_cache_consumers(test_instance.instance_commands)
                 coros.append(test_instance.test())
-            except Exception as e:  # noqa: PERF203, BLE001
+                manager.add(test_instance.result)
+            except Exception as e:  # noqa: BLE001
                 # An AntaTest instance is potentially user-defined code.
                 # We need to catch everything and exit gracefully with an error message.
                 message = "\n".join(
@@ -217,10 +298,12 @@ async def main(  # noqa: PLR0913
     catalog: AntaCatalog,
     devices: set[str] | None = None,
     tests: set[str] | None = None,
-    tags: set[str] | None = None,
+    tags: set[str] | TagExpression | None = None,
     *,
     established_only: bool = True,
     dry_run: bool = False,
+    merge_tests: bool = False,
+    unsupported_commands: UnsupportedCommands | None = None,
 ) -> None:
     """Run ANTA.
 
@@ -240,16 +323,21 @@ async def main(  # noqa: PLR0913
     tests
         Tests to run against devices. None means all tests. These may come from the `--test / -t` CLI option in NRFU.
     tags
-        Tags to filter devices from the inventory. These may come from the `--tags` CLI option in NRFU.
+        Tags or tag expression to filter devices from the inventory. These may come from the `--tags` CLI option in NRFU.
     established_only
         Include only established device(s).
     dry_run
         Build the list of coroutine to run and stop before test execution.
+    merge_tests
+        Merge the compatible test definitions of each device to reduce the number of tests and commands to run.
+    unsupported_commands
+        Memo of the commands not supported on a hardware platform, e.g. to share it between runs of the same inventory.
+        Default to a new memo for this run.
     """
     # Adjust the maximum number of open file descriptors for the ANTA process
     limits = adjust_rlimit_nofile()
 
-    if not catalog.tests:
+    if not catalog.tests and not catalog.parametrized_tests:
         logger.info("The list of tests is empty, exiting")
         return
 
@@ -260,7 +348,7 @@ async def main(  # noqa: PLR0913
             return
 
         with Catchtime(logger=logger, message="Preparing the tests"):
-            selected_tests = prepare_tests(selected_inventory, catalog, tests, tags)
+            selected_tests = prepare_tests(selected_inventory, catalog, tests, tags, merge_tests=merge_tests)
             if selected_tests is None:
                 return
             final_tests_count = sum(len(tests) for tests in selected_tests.values())
@@ -282,7 +370,7 @@ async def main(  # noqa: PLR0913
                 "Please consult the ANTA FAQ."
             )
 
-        coroutines = get_coroutines(selected_tests, manager)
+        coroutines = get_coroutines(selected_tests, manager, unsupported_commands if unsupported_commands is not None else UnsupportedCommands())
 
     if dry_run:
         logger.info("Dry-run mode, exiting before running the tests.")
@@ -0,0 +1,90 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""YAML and JSON loaders and dumpers used by ANTA to read and write its files.
+
+The libyaml based loader and dumper of PyYAML are used when PyYAML has been built with libyaml, and
+[orjson](https://github.com/ijl/orjson) is used to load JSON data when it is installed.
+Both are much faster than their pure Python equivalents and return the same data.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import IO, Any
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# The libyaml based classes are only available if PyYAML has been built with libyaml
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:  # noqa: ANN401
+    """Parse a YAML document using only standard YAML tags, like `yaml.safe_load()`.
+
+    Parameters
+    ----------
+    stream
+        YAML document or file object.
+
+    Returns
+    -------
+    Any
+        The Python object of the document.
+    """
+    return yaml.load(stream, Loader=SafeLoader)  # noqa: S506
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:  # noqa: ANN401
+    """Serialize a Python object to a YAML document using only standard YAML tags, like `yaml.safe_dump()`.
+
+    Parameters
+    ----------
+    data
+        Python object to serialize.
+    kwargs
+        Keyword arguments of `yaml.dump()`. A `width` of `math.inf` disables line wrapping.
+
+    Returns
+    -------
+    str
+        The YAML document.
+    """
+    if kwargs.get("width") == math.inf and SafeDumper is not yaml.SafeDumper:
+        # The libyaml emitter only accepts integers and disables line wrapping with a negative width
+        kwargs["width"] = -1
+    return yaml.dump(data, Dumper=SafeDumper, **kwargs)
+
+
+def load_json(data: str | bytes) -> Any:  # noqa: ANN401
+    """Parse a JSON document, like `json.loads()`.
+
+    Parameters
+    ----------
+    data
+        JSON document.
+
+    Returns
+    -------
+    Any
+        The Python object of the document.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module, e.g. it rejects NaN and Infinity
+            pass
+    return json.loads(data)
@@ -0,0 +1,346 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tag expressions used to select devices and tests.
+
+A tag expression combines tags with the `and`, `or` and `not` operators and parentheses, e.g. `(spine or leaf) and not lab and dc1`.
+A comma is an alias of `or` so that a list of tags like `spine,leaf` is also a valid expression. Operators are case-insensitive
+and `not` binds tighter than `and` which binds tighter than `or`.
+
+Expressions are compiled once when parsed, both to a function evaluating the expression on the tags of a single device
+and to a function evaluating the expression with bitwise operations on an index mapping each tag to an integer
+used as a bitset, for example of the positions of the devices having this tag in an inventory.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import reduce
+from operator import and_, or_
+from typing import TYPE_CHECKING, Any, Callable, NoReturn, Union
+
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from collections.abc import Set as AbstractSet
+
+    from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
+
+# Nodes of the syntax tree of an expression: a tag name or a tuple of an operator and its operands
+_Node = Union[str, tuple[str, tuple["_Node", ...]]]
+
+_TOKEN = re.compile(r"\s*(?:([(),])|([^\s(),]+))")
+_OPERATORS = {"and", "or", "not"}
+
+
+def to_bitset(positions: Iterable[int], size: int) -> int:
+    """Return the bitset of the given positions.
+
+    Parameters
+    ----------
+    positions
+        Positions of the bits to set.
+    size
+        Number of bits of the bitset. All positions must be lower than the size.
+
+    Returns
+    -------
+    int
+        The bitset as an integer.
+    """
+    bits = bytearray(size // 8 + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def from_bitset(bitset: int) -> list[int]:
+    """Return the sorted positions of the bits set in a bitset.
+
+    Parameters
+    ----------
+    bitset
+        The bitset as a non-negative integer.
+
+    Returns
+    -------
+    list[int]
+        The positions of the bits set.
+    """
+    return [position for position, bit in enumerate(f"{bitset:b}"[::-1]) if bit == "1"]
+
+
+class _Parser:
+    """Recursive descent parser of tag expressions."""
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens: list[str] = []
+        position = 0
+        while match := _TOKEN.match(expression, position):
+            token = match.group(1) or match.group(2)
+            self.tokens.append(token.lower() if token.lower() in _OPERATORS else token)
+            position = match.end()
+        if not self.tokens:
+            self.error("the expression is empty")
+        self.position = 0
+
+    def error(self, reason: str) -> NoReturn:
+        msg = f"Invalid tag expression '{self.expression}': {reason}"
+        raise ValueError(msg)
+
+    def peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def next(self) -> str:
+        if (token := self.peek()) is None:
+            self.error("unexpected end of expression")
+        self.position += 1
+        return token
+
+    def parse(self) -> _Node:
+        node = self.parse_or()
+        if (token := self.peek()) is not None:
+            self.error(f"unexpected '{token}'")
+        return node
+
+    def parse_or(self) -> _Node:
+        operands = [self.parse_and()]
+        while self.peek() in {"or", ","}:
+            self.next()
+            operands.append(self.parse_and())
+        return operands[0] if len(operands) == 1 else ("or", tuple(operands))
+
+    def parse_and(self) -> _Node:
+        operands = [self.parse_not()]
+        while self.peek() == "and":
+            self.next()
+            operands.append(self.parse_not())
+        return operands[0] if len(operands) == 1 else ("and", tuple(operands))
+
+    def parse_not(self) -> _Node:
+        symbol = self.next()
+        if symbol == "not":
+            return ("not", (self.parse_not(),))
+        if symbol == "(":
+            node = self.parse_or()
+            if self.next() != ")":
+                self.error("missing ')'")
+            return node
+        if symbol in {"and", "or", ",", ")"}:
+            self.error(f"unexpected '{symbol}'")
+        return symbol
+
+
+def _compile_match(node: _Node) -> Callable[[AbstractSet[str]], bool]:
+    """Compile a node to a function evaluating it on a set of tags."""
+    if isinstance(node, str):
+        return lambda tags: node in tags
+    operator, operands = node
+    functions = [_compile_match(operand) for operand in operands]
+    if operator == "not":
+        function = functions[0]
+        return lambda tags: not function(tags)
+    if operator == "and":
+        return lambda tags: all(function(tags) for function in functions)
+    return lambda tags: any(function(tags) for function in functions)
+
+
+def _compile_select(node: _Node) -> Callable[[Mapping[str, int], int], int]:
+    """Compile a node to a function evaluating it on an index of bitsets by tag."""
+    if isinstance(node, str):
+        return lambda index, _: index.get(node, 0)
+    operator, operands = node
+    functions = [_compile_select(operand) for operand in operands]
+    if operator == "not":
+        function = functions[0]
+        return lambda index, universe: universe & ~function(index, universe)
+    bitwise = and_ if operator == "and" else or_
+    return lambda index, universe: reduce(bitwise, (function(index, universe) for function in functions))
+
+
+def _render(node: _Node, parent: str | None = None) -> str:
+    """Return the normalized text of a node."""
+    if isinstance(node, str):
+        return node
+    operator, operands = node
+    if operator == "not":
+        return f"not {_render(operands[0], operator)}"
+    text = f" {operator} ".join(_render(operand, operator) for operand in operands)
+    # `not` binds tighter than `and` which binds tighter than `or`
+    return f"({text})" if parent == "not" or (parent == "and" and operator == "or") else text
+
+
+def _tags(node: _Node, *, negated: bool = False) -> tuple[set[str], set[str]]:
+    """Return the tags of a node and the tags not under a `not` operator."""
+    if isinstance(node, str):
+        return {node}, set() if negated else {node}
+    operator, operands = node
+    tags: set[str] = set()
+    positive_tags: set[str] = set()
+    for operand in operands:
+        operand_tags, operand_positive_tags = _tags(operand, negated=negated or operator == "not")
+        tags |= operand_tags
+        positive_tags |= operand_positive_tags
+    return tags, positive_tags
+
+
+class TagExpression:
+    """Compiled boolean expression of tags.
+
+    Examples
+    --------
+    ```python
+    >>> expression = TagExpression("(spine or leaf) and not lab and dc1")
+    >>> expression.match({"leaf", "dc1"})
+    True
+    >>> expression.match({"leaf", "dc1", "lab"})
+    False
+    >>> bin(expression.select({"spine": 0b0011, "leaf": 0b0100, "lab": 0b0001, "dc1": 0b1111}, universe=0b1111))
+    '0b110'
+    ```
+
+    Attributes
+    ----------
+    tags
+        All the tags of the expression.
+    positive_tags
+        The tags of the expression that are not negated by a `not` operator.
+    union_tags
+        The tags of the expression if it only uses the `or` operator, i.e. if it is equivalent to a set of tags, otherwise None.
+    """
+
+    __slots__ = ("_match", "_select", "_text", "positive_tags", "tags", "union_tags")
+
+    def __init__(self, expression: str) -> None:
+        """Parse and compile a tag expression.
+
+        Parameters
+        ----------
+        expression
+            Text of the expression.
+
+        Raises
+        ------
+        ValueError
+            If the expression is invalid.
+        """
+        node = _Parser(expression).parse()
+        self._text = _render(node)
+        self._match = _compile_match(node)
+        self._select = _compile_select(node)
+        tags, positive_tags = _tags(node)
+        self.tags: frozenset[str] = frozenset(tags)
+        self.positive_tags: frozenset[str] = frozenset(positive_tags)
+        # Expressions like `spine or leaf` select the same items as a set of tags
+        self.union_tags: frozenset[str] | None = (
+            self.tags if isinstance(node, str) or (node[0] == "or" and all(isinstance(operand, str) for operand in node[1])) else None
+        )
+
+    @staticmethod
+    def is_expression(value: str) -> bool:
+        """Return True if the value uses parentheses or operators and is not a simple list of tags separated by commas.
+
+        Parameters
+        ----------
+        value
+            Value to check.
+
+        Returns
+        -------
+        bool
+            Whether the value uses the syntax of tag expressions.
+        """
+        return any(punctuation in {"(", ")"} or word.lower() in _OPERATORS for punctuation, word in _TOKEN.findall(value))
+
+    def match(self, tags: AbstractSet[str]) -> bool:
+        """Evaluate the expression on a set of tags.
+
+        Parameters
+        ----------
+        tags
+            Tags of a device.
+
+        Returns
+        -------
+        bool
+            Whether the tags match the expression.
+        """
+        return self._match(tags)
+
+    def select(self, index: Mapping[str, int], universe: int) -> int:
+        """Evaluate the expression on an index of bitsets by tag.
+
+        Parameters
+        ----------
+        index
+            Bitset of the items having the tag, by tag. Missing tags are empty bitsets.
+        universe
+            Bitset of all the items, used to evaluate the `not` operator.
+
+        Returns
+        -------
+        int
+            Bitset of the items whose tags match the expression.
+        """
+        return self._select(index, universe)
+
+    def __str__(self) -> str:
+        """Return the normalized text of the expression."""
+        return self._text
+
+    def __repr__(self) -> str:
+        """Return the representation of the expression."""
+        return f"{self.__class__.__name__}({self._text!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the other expression has the same normalized text."""
+        if not isinstance(other, TagExpression):
+            return NotImplemented
+        return self._text == other._text
+
+    def __hash__(self) -> int:
+        """Return the hash of the normalized text of the expression."""
+        return hash(self._text)
+
+    def __reduce__(self) -> tuple[type[TagExpression], tuple[str]]:
+        """Pickle the expression as its text, the compiled functions cannot be pickled."""
+        return (self.__class__, (self._text,))
+
+    @classmethod
+    def validate(cls, value: Any) -> TagExpression:  # noqa: ANN401
+        """Return a tag expression from an expression or its text.
+
+        Parameters
+        ----------
+        value
+            A TagExpression instance or the text of an expression.
+
+        Returns
+        -------
+        TagExpression
+            The tag expression.
+
+        Raises
+        ------
+        ValueError
+            If the value is not a valid tag expression.
+        """
+        if isinstance(value, TagExpression):
+            return value
+        if not isinstance(value, str):
+            msg = "Input should be a valid tag expression string"
+            raise ValueError(msg)  # noqa: TRY004
+        return cls(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:  # noqa: ANN401
+        """Validate tag expressions from strings and serialize them to strings in pydantic models."""
+        return core_schema.no_info_plain_validator_function(cls.validate, serialization=core_schema.plain_serializer_function_ser_schema(str))
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        """Return the JSON schema of tag expressions."""
+        return {"type": "string", "format": "tag-expression"}
@@ -10,7 +10,7 @@ from __future__ import annotations
 from ipaddress import IPv4Address
 from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.decorators import skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
@@ -109,6 +109,7 @@ class VerifyAVTSpecificPath(AntaTest):
         class AVTPaths(BaseModel):
             """Model for the details of AVT paths."""
 
+            model_config = ConfigDict(frozen=True)
             vrf: str = "default"
             """The VRF for the AVT path. Defaults to 'default' if not provided."""
             avt_name: str
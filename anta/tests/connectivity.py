@@ -7,11 +7,15 @@
 # mypy: disable-error-code=attr-defined
 from __future__ import annotations
 
+import re
 from typing import ClassVar
 
-from anta.input_models.connectivity import Host, LLDPNeighbor, Neighbor
+from anta.input_models.connectivity import Host, LLDPNeighbor, Neighbor, PingBatch
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 
+RTT_REGEX = re.compile(r"rtt min/avg/max/mdev = (?P<min>[\d.]+)/(?P<avg>[\d.]+)/(?P<max>[\d.]+)/(?P<mdev>[\d.]+) ms")
+"""Regular expression matching the round-trip time statistics of the ping output."""
+
 
 class VerifyReachability(AntaTest):
     """Test network reachability to one or many destination IP(s).
@@ -37,13 +41,21 @@ class VerifyReachability(AntaTest):
               vrf: MGMT
               df_bit: True
               size: 100
+            - source: Management0
+              destination: 8.8.4.4
+              vrf: MGMT
+              interval: 0.2
+              timeout: 1
+          batch:
+            max_duration: 10
     ```
     """
 
     categories: ClassVar[list[str]] = ["connectivity"]
-    # Template uses '{size}{df_bit}' without space since df_bit includes leading space when enabled
+    mergeable_inputs: ClassVar[tuple[str, ...]] = ("hosts",)
+    # Template uses '{size}{df_bit}' and '{repeat}{options}' without space since df_bit and options include leading space when set
     commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
-        AntaTemplate(template="ping vrf {vrf} {destination} source {source} size {size}{df_bit} repeat {repeat}", revision=1)
+        AntaTemplate(template="ping vrf {vrf} {destination} source {source} size {size}{df_bit} repeat {repeat}{options}", revision=1)
     ]
 
     class Input(AntaTest.Input):
@@ -51,27 +63,63 @@ class VerifyReachability(AntaTest):
 
         hosts: list[Host]
         """List of host to ping."""
+        batch: PingBatch | None = None
+        """Send the pings in batches of several pings per eAPI request, within a latency budget per request.
+        By default, each ping is sent in its own request. Pings are not cached when this input is set."""
+        report_latency: bool = False
+        """Report the average round-trip time of the reachable hosts in the test result messages. Defaults to False."""
         Host: ClassVar[type[Host]] = Host
         """To maintain backward compatibility."""
 
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
         """Render the template for each host in the input list."""
         commands = []
+        batch = self.inputs.batch
         for host in self.inputs.hosts:
             # df_bit includes leading space when enabled, empty string when disabled
             df_bit = " df-bit" if host.df_bit else ""
-            command = template.render(destination=host.destination, source=host.source, vrf=host.vrf, repeat=host.repeat, size=host.size, df_bit=df_bit)
+            # Batched pings use the shorter interval and timeout of the batch unless set for the host
+            interval = host.interval if host.interval is not None or batch is None else batch.interval
+            timeout = host.timeout if host.timeout is not None or batch is None else batch.timeout
+            # options include leading space when set, empty string when not set
+            options = (f" interval {interval}" if interval is not None else "") + (f" timeout {timeout}" if timeout is not None else "")
+            command = template.render(
+                destination=host.destination, source=host.source, vrf=host.vrf, repeat=host.repeat, size=host.size, df_bit=df_bit, options=options
+            )
+            if batch is not None:
+                # Only the commands that do not use the cache can be batched
+                command.use_cache = False
             commands.append(command)
         return commands
 
+    def batch_commands(self) -> list[list[AntaCommand]] | None:
+        """Group the pings in batches whose worst-case duration does not exceed the latency budget of the `batch` input."""
+        if (batch := self.inputs.batch) is None:
+            return None
+        batches: list[list[AntaCommand]] = []
+        duration = 0.0
+        for command, host in zip(self.instance_commands, self.inputs.hosts):
+            ping_duration = batch.duration(host)
+            if not batches or duration + ping_duration > batch.max_duration:
+                batches.append([])
+                duration = 0.0
+            batches[-1].append(command)
+            duration += ping_duration
+        return batches
+
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyReachability."""
         self.result.is_success()
 
+        latencies = []
         for command, host in zip(self.instance_commands, self.inputs.hosts):
-            if f"{host.repeat} received" not in command.json_output["messages"][0]:
+            output = command.json_output["messages"][0]
+            if f"{host.repeat} received" not in output:
                 self.result.is_failure(f"{host} - Unreachable")
+            elif self.inputs.report_latency and (rtt := RTT_REGEX.search(output)) is not None:
+                latencies.append(f"{host} - Average latency: {rtt.group('avg')} ms")
+        self.result.messages.extend(latencies)
 
 
 class VerifyLLDPNeighbors(AntaTest):
@@ -106,6 +154,7 @@ class VerifyLLDPNeighbors(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["connectivity"]
+    mergeable_inputs: ClassVar[tuple[str, ...]] = ("neighbors",)
     commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show lldp neighbors detail", revision=1)]
 
     class Input(AntaTest.Input):
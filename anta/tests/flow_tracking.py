@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.decorators import skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
@@ -114,6 +114,7 @@ class VerifyHardwareFlowTrackerStatus(AntaTest):
         class FlowTracker(BaseModel):
             """Detail of a flow tracker."""
 
+            model_config = ConfigDict(frozen=True)
             name: str
             """Name of the flow tracker."""
 
@@ -126,6 +127,7 @@ class VerifyHardwareFlowTrackerStatus(AntaTest):
             class RecordExport(BaseModel):
                 """Record export configuration."""
 
+                model_config = ConfigDict(frozen=True)
                 on_inactive_timeout: int
                 """Timeout in milliseconds for exporting records when inactive."""
 
@@ -135,6 +137,7 @@ class VerifyHardwareFlowTrackerStatus(AntaTest):
             class Exporter(BaseModel):
                 """Detail of an exporter."""
 
+                model_config = ConfigDict(frozen=True)
                 name: str
                 """Name of the exporter."""
 
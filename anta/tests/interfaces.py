@@ -11,7 +11,7 @@ import re
 from ipaddress import IPv4Network
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_extra_types.mac_address import MacAddress
 
 from anta import GITHUB_SUGGESTION
@@ -22,6 +22,8 @@ from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.tools import custom_division, format_data, get_failed_logs, get_item, get_value
 
 BPS_GBPS_CONVERSIONS = 1000000000
+# `show ip interface` returns all the IP interfaces of the device: only use it when many interfaces are tested
+IP_INTERFACE_BULK_THRESHOLD = 50
 
 
 class VerifyInterfaceUtilization(AntaTest):
@@ -217,6 +219,7 @@ class VerifyInterfacesStatus(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["interfaces"]
+    mergeable_inputs: ClassVar[tuple[str, ...]] = ("interfaces",)
     commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show interfaces description", revision=1)]
 
     class Input(AntaTest.Input):
@@ -524,7 +527,9 @@ class VerifyIPProxyARP(AntaTest):
 
     description = "Verifies if Proxy ARP is enabled."
     categories: ClassVar[list[str]] = ["interfaces"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip interface {intf}", revision=2)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show ip interface {intf}", revision=2, bulk="show ip interface", bulk_threshold=IP_INTERFACE_BULK_THRESHOLD)
+    ]
 
     class Input(AntaTest.Input):
         """Input model for the VerifyIPProxyARP test."""
@@ -539,14 +544,20 @@ class VerifyIPProxyARP(AntaTest):
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyIPProxyARP."""
+        not_found = []
         disabled_intf = []
         for command in self.instance_commands:
-            intf = command.params.intf
-            if not command.json_output["interfaces"][intf]["proxyArp"]:
-                disabled_intf.append(intf)
+            for params in command.items_params:
+                intf = params.intf
+                if (interface_output := command.json_output["interfaces"].get(intf)) is None:
+                    not_found.append(intf)
+                elif not interface_output["proxyArp"]:
+                    disabled_intf.append(intf)
+        if not_found:
+            self.result.is_failure(f"The following interface(s) are not found: {not_found}")
         if disabled_intf:
             self.result.is_failure(f"The following interface(s) have Proxy-ARP disabled: {disabled_intf}")
-        else:
+        if not not_found and not disabled_intf:
             self.result.is_success()
 
 
@@ -638,7 +649,9 @@ class VerifyInterfaceIPv4(AntaTest):
 
     description = "Verifies the interface IPv4 addresses."
     categories: ClassVar[list[str]] = ["interfaces"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip interface {interface}", revision=2)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show ip interface {interface}", revision=2, bulk="show ip interface", bulk_threshold=IP_INTERFACE_BULK_THRESHOLD)
+    ]
 
     class Input(AntaTest.Input):
         """Input model for the VerifyInterfaceIPv4 test."""
@@ -649,6 +662,7 @@ class VerifyInterfaceIPv4(AntaTest):
         class InterfaceDetail(BaseModel):
             """Model for an interface detail."""
 
+            model_config = ConfigDict(frozen=True)
             name: Interface
             """Name of the interface."""
             primary_ip: IPv4Network
@@ -661,57 +675,60 @@ class VerifyInterfaceIPv4(AntaTest):
         return [template.render(interface=interface.name) for interface in self.inputs.interfaces]
 
     @AntaTest.anta_test
-    def test(self) -> None:
+    def test(self) -> None:  # noqa: C901  function is too complex - because of the interface lookups of bulk commands
         """Main test function for VerifyInterfaceIPv4."""
         self.result.is_success()
+        input_interfaces = {interface.name: interface for interface in self.inputs.interfaces}
         for command in self.instance_commands:
-            intf = command.params.interface
-            for interface in self.inputs.interfaces:
-                if interface.name == intf:
-                    input_interface_detail = interface
-                    break
-            else:
-                self.result.is_failure(f"Could not find `{intf}` in the input interfaces. {GITHUB_SUGGESTION}")
-                continue
+            for params in command.items_params:
+                intf = params.interface
+                if (input_interface_detail := input_interfaces.get(intf)) is None:
+                    self.result.is_failure(f"Could not find `{intf}` in the input interfaces. {GITHUB_SUGGESTION}")
+                    continue
 
-            input_primary_ip = str(input_interface_detail.primary_ip)
-            failed_messages = []
+                # Check if the interface is present in the output of a bulk command
+                if intf not in command.json_output["interfaces"]:
+                    self.result.is_failure(f"Interface `{intf}` is not found.")
+                    continue
 
-            # Check if the interface has an IP address configured
-            if not (interface_output := get_value(command.json_output, f"interfaces.{intf}.interfaceAddress")):
-                self.result.is_failure(f"For interface `{intf}`, IP address is not configured.")
-                continue
+                input_primary_ip = str(input_interface_detail.primary_ip)
+                failed_messages = []
+
+                # Check if the interface has an IP address configured
+                if not (interface_output := get_value(command.json_output, f"interfaces.{intf}.interfaceAddress")):
+                    self.result.is_failure(f"For interface `{intf}`, IP address is not configured.")
+                    continue
 
-            primary_ip = get_value(interface_output, "primaryIp")
+                primary_ip = get_value(interface_output, "primaryIp")
 
-            # Combine IP address and subnet for primary IP
-            actual_primary_ip = f"{primary_ip['address']}/{primary_ip['maskLen']}"
+                # Combine IP address and subnet for primary IP
+                actual_primary_ip = f"{primary_ip['address']}/{primary_ip['maskLen']}"
 
-            # Check if the primary IP address matches the input
-            if actual_primary_ip != input_primary_ip:
-                failed_messages.append(f"The expected primary IP address is `{input_primary_ip}`, but the actual primary IP address is `{actual_primary_ip}`.")
+                # Check if the primary IP address matches the input
+                if actual_primary_ip != input_primary_ip:
+                    failed_messages.append(f"The expected primary IP address is `{input_primary_ip}`, but the actual primary IP address is `{actual_primary_ip}`.")
 
-            if (param_secondary_ips := input_interface_detail.secondary_ips) is not None:
-                input_secondary_ips = sorted([str(network) for network in param_secondary_ips])
-                secondary_ips = get_value(interface_output, "secondaryIpsOrderedList")
+                if (param_secondary_ips := input_interface_detail.secondary_ips) is not None:
+                    input_secondary_ips = sorted([str(network) for network in param_secondary_ips])
+                    secondary_ips = get_value(interface_output, "secondaryIpsOrderedList")
 
-                # Combine IP address and subnet for secondary IPs
-                actual_secondary_ips = sorted([f"{secondary_ip['address']}/{secondary_ip['maskLen']}" for secondary_ip in secondary_ips])
+                    # Combine IP address and subnet for secondary IPs
+                    actual_secondary_ips = sorted([f"{secondary_ip['address']}/{secondary_ip['maskLen']}" for secondary_ip in secondary_ips])
 
-                # Check if the secondary IP address is configured
-                if not actual_secondary_ips:
-                    failed_messages.append(
-                        f"The expected secondary IP addresses are `{input_secondary_ips}`, but the actual secondary IP address is not configured."
-                    )
+                    # Check if the secondary IP address is configured
+                    if not actual_secondary_ips:
+                        failed_messages.append(
+                            f"The expected secondary IP addresses are `{input_secondary_ips}`, but the actual secondary IP address is not configured."
+                        )
 
-                # Check if the secondary IP addresses match the input
-                elif actual_secondary_ips != input_secondary_ips:
-                    failed_messages.append(
-                        f"The expected secondary IP addresses are `{input_secondary_ips}`, but the actual secondary IP addresses are `{actual_secondary_ips}`."
-                    )
+                    # Check if the secondary IP addresses match the input
+                    elif actual_secondary_ips != input_secondary_ips:
+                        failed_messages.append(
+                            f"The expected secondary IP addresses are `{input_secondary_ips}`, but the actual secondary IP addresses are `{actual_secondary_ips}`."
+                        )
 
-            if failed_messages:
-                self.result.is_failure(f"For interface `{intf}`, " + " ".join(failed_messages))
+                if failed_messages:
+                    self.result.is_failure(f"For interface `{intf}`, " + " ".join(failed_messages))
 
 
 class VerifyIpVirtualRouterMac(AntaTest):
@@ -794,6 +811,7 @@ class VerifyInterfacesSpeed(AntaTest):
         class InterfaceDetail(BaseModel):
             """Detail of an interface."""
 
+            model_config = ConfigDict(frozen=True)
             name: EthernetInterface
             """The name of the interface."""
             auto: bool
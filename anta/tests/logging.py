@@ -10,25 +10,28 @@ NOTE: The EOS command `show logging` does not support JSON output format.
 # mypy: disable-error-code=attr-defined
 from __future__ import annotations
 
+import logging
 import re
 from ipaddress import IPv4Address
 from typing import TYPE_CHECKING, ClassVar
 
 from anta.models import AntaCommand, AntaTest
+from anta.parsers import parser
 
 if TYPE_CHECKING:
-    import logging
-
     from anta.models import AntaTemplate
 
+logger = logging.getLogger(__name__)
+
 
-def _get_logging_states(logger: logging.Logger, command_output: str) -> str:
+@parser("logging_states")
+def _get_logging_states(command_output: str) -> str:
     """Parse `show logging` output and gets operational logging states used in the tests in this module.
 
+    Registered as the `logging_states` parser: the output is parsed once per device and shared by the tests.
+
     Parameters
     ----------
-    logger
-        The logger object.
     command_output
         The `show logging` output.
 
@@ -69,9 +72,9 @@ class VerifyLoggingPersistent(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyLoggingPersistent."""
         self.result.is_success()
-        log_output = self.instance_commands[0].text_output
+        log_states = self.device.parse(self.instance_commands[0], "logging_states")
         dir_flash_output = self.instance_commands[1].text_output
-        if "Persistent logging: disabled" in _get_logging_states(self.logger, log_output):
+        if "Persistent logging: disabled" in log_states:
             self.result.is_failure("Persistent logging is disabled")
             return
         pattern = r"-rw-\s+(\d+)"
@@ -112,9 +115,9 @@ class VerifyLoggingSourceIntf(AntaTest):
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyLoggingSourceIntf."""
-        output = self.instance_commands[0].text_output
+        log_states = self.device.parse(self.instance_commands[0], "logging_states")
         pattern = rf"Logging source-interface '{self.inputs.interface}'.*VRF {self.inputs.vrf}"
-        if re.search(pattern, _get_logging_states(self.logger, output)):
+        if re.search(pattern, log_states):
             self.result.is_success()
         else:
             self.result.is_failure(f"Source-interface '{self.inputs.interface}' is not configured in VRF {self.inputs.vrf}")
@@ -154,11 +157,11 @@ class VerifyLoggingHosts(AntaTest):
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyLoggingHosts."""
-        output = self.instance_commands[0].text_output
+        log_states = self.device.parse(self.instance_commands[0], "logging_states")
         not_configured = []
         for host in self.inputs.hosts:
             pattern = rf"Logging to '{host!s}'.*VRF {self.inputs.vrf}"
-            if not re.search(pattern, _get_logging_states(self.logger, output)):
+            if not re.search(pattern, log_states):
                 not_configured.append(str(host))
 
         if not not_configured:
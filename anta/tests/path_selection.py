@@ -10,7 +10,7 @@ from __future__ import annotations
 from ipaddress import IPv4Address
 from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.decorators import skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
@@ -108,6 +108,7 @@ class VerifySpecificPath(AntaTest):
         class RouterPath(BaseModel):
             """Detail of a router path."""
 
+            model_config = ConfigDict(frozen=True)
             peer: IPv4Address
             """Static peer IPv4 address."""
 
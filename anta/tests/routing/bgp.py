@@ -10,13 +10,14 @@ from __future__ import annotations
 from ipaddress import IPv4Address, IPv4Network
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.v1.utils import deep_update
 from pydantic_extra_types.mac_address import MacAddress
 
 from anta.custom_types import BgpDropStats, BgpUpdateError, MultiProtocolCaps, Vni
 from anta.input_models.routing.bgp import BgpAddressFamily, BgpAfi
 from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.parsers import parser
 from anta.tools import format_data, get_item, get_value
 
 if TYPE_CHECKING:
@@ -104,6 +105,51 @@ def _check_bgp_neighbor_capability(capability_status: dict[str, bool]) -> bool:
     return all(capability_status.get(state, False) for state in ("advertised", "received", "enabled"))
 
 
+@parser("bgp_peers")
+def _get_bgp_peers(command_output: dict[str, Any]) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index the peers of the `show bgp neighbors vrf all` output by VRF and peer address.
+
+    Registered as the `bgp_peers` parser: the index is built once per device and shared by the tests.
+    Like `get_item()`, peer addresses are compared ignoring case and the first peer is kept if a peer address is listed multiple times in a VRF.
+
+    Parameters
+    ----------
+    command_output
+        The `show bgp neighbors vrf all` output.
+
+    Returns
+    -------
+    dict[tuple[str, str], dict[str, Any]]
+        The peers indexed by VRF and case-folded peer address.
+    """
+    peers: dict[tuple[str, str], dict[str, Any]] = {}
+    for vrf, vrf_output in command_output.get("vrfs", {}).items():
+        for peer in vrf_output.get("peerList", []):
+            if isinstance(peer, dict) and isinstance(peer_address := peer.get("peerAddress"), str):
+                peers.setdefault((vrf, peer_address.casefold()), peer)
+    return peers
+
+
+def _get_bgp_peer(peers: dict[tuple[str, str], dict[str, Any]], vrf: str, peer: str) -> Any:  # noqa: ANN401
+    """Return a BGP peer from the index built by the `bgp_peers` parser or None if the peer is not found in the VRF.
+
+    Parameters
+    ----------
+    peers
+        The BGP peers indexed by the `bgp_peers` parser.
+    vrf
+        The VRF of the peer.
+    peer
+        The peer address.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The peer output or None if the peer is not found.
+    """
+    return peers.get((vrf, peer.casefold()))
+
+
 class VerifyBGPPeerCount(AntaTest):
     """Verifies the count of BGP peers for given address families.
 
@@ -358,10 +404,11 @@ class VerifyBGPSpecificPeers(AntaTest):
         self.result.is_success()
 
         output = self.instance_commands[0].json_output
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
 
         for address_family in self.inputs.address_families:
             # Check if the VRF is configured
-            if (vrf_output := get_value(output, f"vrfs.{address_family.vrf}")) is None:
+            if get_value(output, f"vrfs.{address_family.vrf}") is None:
                 self.result.is_failure(f"{address_family} - VRF not configured")
                 continue
 
@@ -369,7 +416,7 @@ class VerifyBGPSpecificPeers(AntaTest):
                 peer_ip = str(peer)
 
                 # Check if the peer is found
-                if (peer_data := get_item(vrf_output["peerList"], "peerAddress", peer_ip)) is None:
+                if (peer_data := _get_bgp_peer(peers, address_family.vrf, peer_ip)) is None:
                     self.result.is_failure(f"{address_family} Peer: {peer_ip} - Not configured")
                     continue
 
@@ -442,6 +489,7 @@ class VerifyBGPExchangedRoutes(AntaTest):
         class BgpNeighbor(BaseModel):
             """Model for a BGP neighbor."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -530,6 +578,7 @@ class VerifyBGPPeerMPCaps(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -544,6 +593,8 @@ class VerifyBGPPeerMPCaps(AntaTest):
         """Main test function for VerifyBGPPeerMPCaps."""
         failures: dict[str, Any] = {"bgp_peers": {}}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each bgp peer.
         for bgp_peer in self.inputs.bgp_peers:
             peer = str(bgp_peer.peer_address)
@@ -552,10 +603,7 @@ class VerifyBGPPeerMPCaps(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists.
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -624,6 +672,7 @@ class VerifyBGPPeerASNCap(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -634,6 +683,8 @@ class VerifyBGPPeerASNCap(AntaTest):
         """Main test function for VerifyBGPPeerASNCap."""
         failures: dict[str, Any] = {"bgp_peers": {}}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
             peer = str(bgp_peer.peer_address)
@@ -641,10 +692,7 @@ class VerifyBGPPeerASNCap(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -701,6 +749,7 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -711,6 +760,8 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
         """Main test function for VerifyBGPPeerRouteRefreshCap."""
         failures: dict[str, Any] = {"bgp_peers": {}}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
             peer = str(bgp_peer.peer_address)
@@ -718,10 +769,7 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -780,6 +828,7 @@ class VerifyBGPPeerMD5Auth(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of BGP peer."""
             vrf: str = "default"
@@ -790,6 +839,8 @@ class VerifyBGPPeerMD5Auth(AntaTest):
         """Main test function for VerifyBGPPeerMD5Auth."""
         failures: dict[str, Any] = {"bgp_peers": {}}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each command
         for bgp_peer in self.inputs.bgp_peers:
             peer = str(bgp_peer.peer_address)
@@ -797,10 +848,7 @@ class VerifyBGPPeerMD5Auth(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -853,6 +901,7 @@ class VerifyEVPNType2Route(AntaTest):
         class VxlanEndpoint(BaseModel):
             """Model for a VXLAN endpoint."""
 
+            model_config = ConfigDict(frozen=True)
             address: IPv4Address | MacAddress
             """IPv4 or MAC address of the VXLAN endpoint."""
             vni: Vni
@@ -929,6 +978,7 @@ class VerifyBGPAdvCommunities(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -939,6 +989,8 @@ class VerifyBGPAdvCommunities(AntaTest):
         """Main test function for VerifyBGPAdvCommunities."""
         failures: dict[str, Any] = {"bgp_peers": {}}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
             peer = str(bgp_peer.peer_address)
@@ -946,10 +998,7 @@ class VerifyBGPAdvCommunities(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Verify BGP peer
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -1005,6 +1054,7 @@ class VerifyBGPTimers(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -1019,6 +1069,8 @@ class VerifyBGPTimers(AntaTest):
         """Main test function for VerifyBGPTimers."""
         failures: dict[str, Any] = {}
 
+        peers = self.device.parse(self.instance_commands[0], "bgp_peers")
+
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
             peer_address = str(bgp_peer.peer_address)
@@ -1027,10 +1079,7 @@ class VerifyBGPTimers(AntaTest):
             keep_alive_time = bgp_peer.keep_alive_time
 
             # Verify BGP peer
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer_address)) is None
-            ):
+            if (bgp_output := _get_bgp_peer(peers, vrf, peer_address)) is None:
                 failures[peer_address] = {vrf: "Not configured"}
                 continue
 
@@ -1082,6 +1131,7 @@ class VerifyBGPPeerDropStats(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -1169,6 +1219,7 @@ class VerifyBGPPeerUpdateErrors(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -1252,6 +1303,7 @@ class VerifyBgpRouteMaps(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
@@ -1348,6 +1400,7 @@ class VerifyBGPPeerRouteLimit(AntaTest):
         class BgpPeer(BaseModel):
             """Model for a BGP peer."""
 
+            model_config = ConfigDict(frozen=True)
             peer_address: IPv4Address
             """IPv4 address of a BGP peer."""
             vrf: str = "default"
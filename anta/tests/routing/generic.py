@@ -136,8 +136,8 @@ class VerifyRoutingTableEntry(AntaTest):
 
     categories: ClassVar[list[str]] = ["routing"]
     commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
-        AntaTemplate(template="show ip route vrf {vrf} {route}", revision=4),
-        AntaTemplate(template="show ip route vrf {vrf}", revision=4),
+        # The bulk command returns the full routing table of the VRF: only use it when many routes are tested
+        AntaTemplate(template="show ip route vrf {vrf} {route}", revision=4, bulk="show ip route vrf {vrf}", bulk_threshold=100),
     ]
 
     class Input(AntaTest.Input):
@@ -151,14 +151,12 @@ class VerifyRoutingTableEntry(AntaTest):
         """Route collect behavior: one=one route per command, all=all routes in vrf per command. Defaults to `one`"""
 
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
-        """Render the template for the input vrf."""
-        if template == VerifyRoutingTableEntry.commands[0] and self.inputs.collect == "one":
-            return [template.render(vrf=self.inputs.vrf, route=route) for route in self.inputs.routes]
+        """Render the template for each route in the input list."""
+        return [template.render(vrf=self.inputs.vrf, route=route) for route in self.inputs.routes]
 
-        if template == VerifyRoutingTableEntry.commands[1] and self.inputs.collect == "all":
-            return [template.render(vrf=self.inputs.vrf)]
-
-        return []
+    def use_bulk(self, template: AntaTemplate, commands: list[AntaCommand]) -> bool:  # noqa: ARG002  the collect input decides, not the number of routes
+        """Collect all routes in vrf only if the `collect` input is `all`."""
+        return self.inputs.collect == "all"
 
     @staticmethod
     @cache
@@ -8,16 +8,19 @@
 from __future__ import annotations
 
 from ipaddress import IPv4Address, IPv4Network
-from typing import Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.custom_types import Interface
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.tools import get_value
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-def _count_isis_neighbor(isis_neighbor_json: dict[str, Any]) -> int:
+
+def _count_isis_neighbor(isis_neighbor_json: Mapping[str, Any]) -> int:
     """Count the number of isis neighbors.
 
     Parameters
@@ -38,7 +41,7 @@ def _count_isis_neighbor(isis_neighbor_json: dict[str, Any]) -> int:
     return count
 
 
-def _get_not_full_isis_neighbors(isis_neighbor_json: dict[str, Any]) -> list[dict[str, Any]]:
+def _get_not_full_isis_neighbors(isis_neighbor_json: Mapping[str, Any]) -> list[dict[str, Any]]:
     """Return the isis neighbors whose adjacency state is not `up`.
 
     Parameters
@@ -67,7 +70,7 @@ def _get_not_full_isis_neighbors(isis_neighbor_json: dict[str, Any]) -> list[dic
     ]
 
 
-def _get_full_isis_neighbors(isis_neighbor_json: dict[str, Any], neighbor_state: Literal["up", "down"] = "up") -> list[dict[str, Any]]:
+def _get_full_isis_neighbors(isis_neighbor_json: Mapping[str, Any], neighbor_state: Literal["up", "down"] = "up") -> list[dict[str, Any]]:
     """Return the isis neighbors whose adjacency state is `up`.
 
     Parameters
@@ -100,7 +103,7 @@ def _get_full_isis_neighbors(isis_neighbor_json: dict[str, Any], neighbor_state:
     ]
 
 
-def _get_isis_neighbors_count(isis_neighbor_json: dict[str, Any]) -> list[dict[str, Any]]:
+def _get_isis_neighbors_count(isis_neighbor_json: Mapping[str, Any]) -> list[dict[str, Any]]:
     """Count number of IS-IS neighbor of the device."""
     return [
         {"vrf": vrf, "interface": interface, "mode": mode, "count": int(level_data["numAdjacencies"]), "level": int(level)}
@@ -112,7 +115,7 @@ def _get_isis_neighbors_count(isis_neighbor_json: dict[str, Any]) -> list[dict[s
     ]
 
 
-def _get_interface_data(interface: str, vrf: str, command_output: dict[str, Any]) -> dict[str, Any] | None:
+def _get_interface_data(interface: str, vrf: str, command_output: Mapping[str, Any]) -> dict[str, Any] | None:
     """Extract data related to an IS-IS interface for testing."""
     if (vrf_data := get_value(command_output, f"vrfs.{vrf}")) is None:
         return None
@@ -126,7 +129,7 @@ def _get_interface_data(interface: str, vrf: str, command_output: dict[str, Any]
     return None
 
 
-def _get_adjacency_segment_data_by_neighbor(neighbor: str, instance: str, vrf: str, command_output: dict[str, Any]) -> dict[str, Any] | None:
+def _get_adjacency_segment_data_by_neighbor(neighbor: str, instance: str, vrf: str, command_output: Mapping[str, Any]) -> dict[str, Any] | None:
     """Extract data related to an IS-IS interface for testing."""
     search_path = f"vrfs.{vrf}.isisInstances.{instance}.adjacencySegments"
     if get_value(dictionary=command_output, key=search_path, default=None) is None:
@@ -214,6 +217,7 @@ class VerifyISISNeighborCount(AntaTest):
         class InterfaceCount(BaseModel):
             """Input model for the VerifyISISNeighborCount test."""
 
+            model_config = ConfigDict(frozen=True)
             name: Interface
             """Interface name to check."""
             level: int = 2
@@ -286,6 +290,7 @@ class VerifyISISInterfaceMode(AntaTest):
         class InterfaceState(BaseModel):
             """Input model for the VerifyISISNeighborCount test."""
 
+            model_config = ConfigDict(frozen=True)
             name: Interface
             """Interface name to check."""
             level: Literal[1, 2] = 2
@@ -363,6 +368,7 @@ class VerifyISISSegmentRoutingAdjacencySegments(AntaTest):
         class IsisInstance(BaseModel):
             """ISIS Instance model definition."""
 
+            model_config = ConfigDict(frozen=True)
             name: str
             """ISIS instance name."""
             vrf: str = "default"
@@ -373,6 +379,7 @@ class VerifyISISSegmentRoutingAdjacencySegments(AntaTest):
             class Segment(BaseModel):
                 """Segment model definition."""
 
+                model_config = ConfigDict(frozen=True)
                 interface: Interface
                 """Interface name to check."""
                 level: Literal[1, 2] = 2
@@ -468,6 +475,7 @@ class VerifyISISSegmentRoutingDataplane(AntaTest):
         class IsisInstance(BaseModel):
             """ISIS Instance model definition."""
 
+            model_config = ConfigDict(frozen=True)
             name: str
             """ISIS instance name."""
             vrf: str = "default"
@@ -559,6 +567,7 @@ class VerifyISISSegmentRoutingTunnels(AntaTest):
         class Entry(BaseModel):
             """Definition of a tunnel entry."""
 
+            model_config = ConfigDict(frozen=True)
             endpoint: IPv4Network
             """Endpoint IP of the tunnel."""
             vias: list[Vias] | None = None
@@ -567,6 +576,7 @@ class VerifyISISSegmentRoutingTunnels(AntaTest):
             class Vias(BaseModel):
                 """Definition of a tunnel path."""
 
+                model_config = ConfigDict(frozen=True)
                 nexthop: IPv4Address | None = None
                 """Nexthop of the tunnel. If None, then it is not tested. Default: None"""
                 type: Literal["ip", "tunnel"] | None = None
@@ -12,10 +12,12 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from anta.models import AntaCommand, AntaTest
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from anta.models import AntaTemplate
 
 
-def _count_ospf_neighbor(ospf_neighbor_json: dict[str, Any]) -> int:
+def _count_ospf_neighbor(ospf_neighbor_json: Mapping[str, Any]) -> int:
     """Count the number of OSPF neighbors.
 
     Parameters
@@ -36,7 +38,7 @@ def _count_ospf_neighbor(ospf_neighbor_json: dict[str, Any]) -> int:
     return count
 
 
-def _get_not_full_ospf_neighbors(ospf_neighbor_json: dict[str, Any]) -> list[dict[str, Any]]:
+def _get_not_full_ospf_neighbors(ospf_neighbor_json: Mapping[str, Any]) -> list[dict[str, Any]]:
     """Return the OSPF neighbors whose adjacency state is not `full`.
 
     Parameters
@@ -64,7 +66,7 @@ def _get_not_full_ospf_neighbors(ospf_neighbor_json: dict[str, Any]) -> list[dic
     ]
 
 
-def _get_ospf_max_lsa_info(ospf_process_json: dict[str, Any]) -> list[dict[str, Any]]:
+def _get_ospf_max_lsa_info(ospf_process_json: Mapping[str, Any]) -> list[dict[str, Any]]:
     """Return information about OSPF instances and their LSAs.
 
     Parameters
@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, ClassVar, get_args
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from anta.custom_types import EcdsaKeySize, EncryptionAlgorithm, PositiveInteger, RsaKeySize
 from anta.input_models.security import IPSecPeer, IPSecPeers
@@ -397,6 +397,7 @@ class VerifyAPISSLCertificate(AntaTest):
         class APISSLCertificate(BaseModel):
             """Model for an API SSL certificate."""
 
+            model_config = ConfigDict(frozen=True)
             certificate_name: str
             """The name of the certificate to be verified."""
             expiry_threshold: int
@@ -586,7 +587,7 @@ class VerifyIPv4ACL(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["security"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip access-lists {acl}", revision=1)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip access-lists {acl}", revision=1, bulk="show ip access-lists")]
 
     class Input(AntaTest.Input):
         """Input model for the VerifyIPv4ACL test."""
@@ -597,6 +598,7 @@ class VerifyIPv4ACL(AntaTest):
         class IPv4ACL(BaseModel):
             """Model for an IPv4 ACL."""
 
+            model_config = ConfigDict(frozen=True)
             name: str
             """Name of IPv4 ACL."""
 
@@ -606,6 +608,7 @@ class VerifyIPv4ACL(AntaTest):
             class IPv4ACLEntry(BaseModel):
                 """Model for an IPv4 ACL entry."""
 
+                model_config = ConfigDict(frozen=True)
                 sequence: int = Field(ge=1, le=4294967295)
                 """Sequence number of an ACL entry."""
                 action: str
@@ -619,15 +622,16 @@ class VerifyIPv4ACL(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyIPv4ACL."""
         self.result.is_success()
-        for command_output, acl in zip(self.instance_commands, self.inputs.ipv4_access_lists):
-            # Collecting input ACL details
-            acl_name = command_output.params.acl
+        # The commands return the ACLs in the order of the inputs, a bulk command returns all the ACLs of the device
+        acl_commands = ((command, params.acl) for command in self.instance_commands for params in command.items_params)
+        for (command, acl_name), acl in zip(acl_commands, self.inputs.ipv4_access_lists):
             # Retrieve the expected entries from the inputs
             acl_entries = acl.entries
 
             # Check if ACL is configured
-            ipv4_acl_list = command_output.json_output["aclList"]
-            if not ipv4_acl_list:
+            ipv4_acl_list = command.json_output["aclList"]
+            ipv4_acl = get_item(ipv4_acl_list, "name", acl_name, case_sensitive=True) if command.bulk_params else next(iter(ipv4_acl_list), None)
+            if ipv4_acl is None:
                 self.result.is_failure(f"{acl_name}: Not found")
                 continue
 
@@ -636,7 +640,7 @@ class VerifyIPv4ACL(AntaTest):
             for acl_entry in acl_entries:
                 acl_seq = acl_entry.sequence
                 acl_action = acl_entry.action
-                if (actual_entry := get_item(ipv4_acl_list[0]["sequence"], "sequenceNumber", acl_seq)) is None:
+                if (actual_entry := get_item(ipv4_acl["sequence"], "sequenceNumber", acl_seq)) is None:
                     failed_log += f"Sequence number `{acl_seq}` is not found.\n"
                     continue
 
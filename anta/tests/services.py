@@ -9,7 +9,7 @@ from __future__ import annotations
 # mypy: disable-error-code=attr-defined
 from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from anta.custom_types import ErrDisableInterval, ErrDisableReasons
 from anta.input_models.services import DnsServer
@@ -199,6 +199,7 @@ class VerifyErrdisableRecovery(AntaTest):
         class ErrDisableReason(BaseModel):
             """Model for an errdisable reason."""
 
+            model_config = ConfigDict(frozen=True)
             reason: ErrDisableReasons
             """Type or name of the errdisable reason."""
             interval: ErrDisableInterval
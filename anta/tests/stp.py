@@ -101,9 +101,9 @@ class VerifySTPBlockedPorts(AntaTest):
         if not (stp_instances := command_output["spanningTreeInstances"]):
             self.result.is_success()
         else:
-            for key, value in stp_instances.items():
-                stp_instances[key] = value.pop("spanningTreeBlockedPorts")
-            self.result.is_failure(f"The following ports are blocked by STP: {stp_instances}")
+            # The command output is shared with other tests: build a new mapping instead of modifying it
+            blocked_ports = {key: value["spanningTreeBlockedPorts"] for key, value in stp_instances.items()}
+            self.result.is_failure(f"The following ports are blocked by STP: {blocked_ports}")
 
 
 class VerifySTPCounters(AntaTest):
@@ -285,10 +285,8 @@ class VerifyStpTopologyChanges(AntaTest):
         failures: dict[str, Any] = {"topologies": {}}
 
         command_output = self.instance_commands[0].json_output
-        stp_topologies = command_output.get("topologies", {})
-
         # verifies all available topologies except the "NoStp" topology.
-        stp_topologies.pop("NoStp", None)
+        stp_topologies = {topology: details for topology, details in command_output.get("topologies", {}).items() if topology != "NoStp"}
 
         # Verify the STP topology(s).
         if not stp_topologies:
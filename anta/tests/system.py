@@ -127,9 +127,7 @@ class VerifyCoredump(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyCoredump."""
         command_output = self.instance_commands[0].json_output
-        core_files = command_output["coreFiles"]
-        if "minidump" in core_files:
-            core_files.remove("minidump")
+        core_files = [core_file for core_file in command_output["coreFiles"] if core_file != "minidump"]
         if not core_files:
             self.result.is_success()
         else:
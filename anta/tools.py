@@ -9,7 +9,9 @@ import cProfile
 import os
 import pstats
 import re
-from functools import wraps
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from time import perf_counter
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
@@ -19,6 +21,7 @@ from anta.logger import format_td
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Iterable, Iterator, Mapping
     from logging import Logger
     from types import TracebackType
 
@@ -132,7 +135,9 @@ def get_dict_superset(
             raise ValueError(error_msg)
         return default
 
-    for list_item in list_of_dicts:
+    # Only check the items matching one of the input values
+    key, value = next(iter(input_dict.items()))
+    for list_item in _candidates(list_of_dicts, key, value, case_sensitive=True):
         if isinstance(list_item, dict) and input_dict.items() <= list_item.items():
             return list_item
 
@@ -143,8 +148,122 @@ def get_dict_superset(
     return default
 
 
+class ValuePath:
+    """Compiled path to get a value from nested dictionaries.
+
+    The path is parsed once and can then be used to get values from many dictionaries.
+    Use `compile_path()` to get cached instances.
+
+    Examples
+    --------
+    ```python
+    >>> path = ValuePath("vrfs.*.peerList")
+    >>> path.get({"vrfs": {"default": {"peerList": [1]}, "MGMT": {"peerList": [2]}}})
+    [[1], [2]]
+    ```
+
+    Attributes
+    ----------
+    key
+        The path, supporting dot-notation like "foo.bar" for nested dictionaries.
+    separator
+        String used to split the path. Useful when the keys can contain "." (e.g. hostnames).
+    keys
+        The keys of the path.
+    wildcard
+        Key matching all the values of a dictionary. None disables wildcards.
+    """
+
+    __slots__ = ("has_wildcard", "key", "keys", "separator", "wildcard")
+
+    def __init__(self, key: str, separator: str = ".", wildcard: str | None = "*") -> None:
+        self.key = key
+        self.separator = separator
+        self.keys: tuple[str, ...] = tuple(key.split(separator))
+        self.wildcard = wildcard
+        self.has_wildcard = wildcard is not None and wildcard in self.keys
+
+    def __repr__(self) -> str:
+        """Return the representation of the ValuePath."""
+        return f"ValuePath({self.key!r}, separator={self.separator!r}, wildcard={self.wildcard!r})"
+
+    def get(self, dictionary: Mapping[Any, Any], default: Any | None = None, org_key: str | None = None, *, required: bool = False) -> Any:
+        """Get the value of the path from a dictionary.
+
+        If the path contains wildcards, return the list of all the matching values or the default value if there is no match.
+
+        Parameters
+        ----------
+        dictionary
+            Dictionary to get the value from.
+        default
+            Default value returned if the path is not found.
+        org_key
+            Key name used in the exception message. Default to the path.
+        required
+            Fail if the path is not found.
+
+        Returns
+        -------
+        Any
+            Value or default value.
+
+        Raises
+        ------
+        ValueError
+            If the path is not found and required is True.
+        """
+        if self.has_wildcard:
+            values = self._get_all(dictionary, 0)
+            if values:
+                return values
+        else:
+            value: Any = dictionary
+            for key in self.keys:
+                value = value.get(key)
+                if value is None:
+                    break
+            else:
+                return value
+        if required:
+            raise ValueError(org_key or self.key)
+        return default
+
+    def _get_all(self, value: Any, index: int) -> list[Any]:
+        """Return the values matching the keys of the path starting at `index`, expanding wildcards."""
+        for position in range(index, len(self.keys)):
+            key = self.keys[position]
+            if key == self.wildcard:
+                return [match for item in value.values() if item is not None for match in self._get_all(item, position + 1)]
+            value = value.get(key)
+            if value is None:
+                return []
+        return [value]
+
+
+@lru_cache(maxsize=4096)
+def compile_path(key: str, separator: str = ".", wildcard: str | None = "*") -> ValuePath:
+    """Return a compiled path to get values from nested dictionaries. Compiled paths are cached.
+
+    Parameters
+    ----------
+    key
+        The path, supporting dot-notation like "foo.bar" for nested dictionaries.
+    separator
+        String used to split the path.
+    wildcard
+        Key matching all the values of a dictionary. None disables wildcards.
+
+    Returns
+    -------
+    ValuePath
+        The compiled path.
+    """
+    return ValuePath(key, separator, wildcard)
+
+
 def get_value(
-    dictionary: dict[Any, Any],
+    dictionary: Mapping[Any, Any],
     key: str,
     default: Any | None = None,
     org_key: str | None = None,
@@ -154,13 +273,13 @@ def get_value(
 ) -> Any:
     """Get a value from a dictionary or nested dictionaries.
 
-    Key supports dot-notation like "foo.bar" to do deeper lookups.
+    Key supports dot-notation like "foo.bar" to do deeper lookups. The key is compiled once, see `compile_path()`.
 
     Returns the supplied default value or None if the key is not found and required is False.
 
     Parameters
     ----------
-    dictionary : dict
+    dictionary : Mapping
         Dictionary to get key from
     key : str
         Dictionary Key - supporting dot-notation for nested dictionaries
@@ -185,18 +304,205 @@ def get_value(
         If the key is not found and required == True.
 
     """
-    if org_key is None:
-        org_key = key
-    keys = key.split(separator)
-    value = dictionary.get(keys[0])
-    if value is None:
-        if required:
-            raise ValueError(org_key)
-        return default
+    return compile_path(key, separator, None).get(dictionary, default, org_key, required=required)
+
+
+def get_values(
+    dictionary: Mapping[Any, Any],
+    keys: Iterable[str],
+    default: Any | None = None,
+    separator: str = ".",
+    *,
+    required: bool = False,
+) -> list[Any]:
+    """Get multiple values from a dictionary or nested dictionaries.
+
+    Keys support dot-notation like "foo.bar" and "*" wildcards matching all the values of a dictionary, see `ValuePath`.
+
+    Parameters
+    ----------
+    dictionary
+        Dictionary to get the values from.
+    keys
+        Dictionary keys.
+    default
+        Default value returned for each key that is not found.
+    separator
+        String used to split the keys.
+    required
+        Fail if a key is not found.
+
+    Returns
+    -------
+    list[Any]
+        Values or default values, in the order of the keys.
+
+    Raises
+    ------
+    ValueError
+        If a key is not found and required is True.
+    """
+    return [compile_path(key, separator).get(dictionary, default, required=required) for key in keys]
 
-    if len(keys) > 1:
-        return get_value(value, separator.join(keys[1:]), default=default, required=required, org_key=org_key, separator=separator)
-    return value
+
+ITEM_INDEX_MIN_SIZE = 16
+"""Minimum length of a list of dictionaries for `get_item()` and `get_dict_superset()` to look it up with an `ItemIndex`."""
+
+
+class ItemIndex:
+    """Hashed index of a list of dictionaries, keyed by one or more fields.
+
+    Looking up a value in the index is O(1) and returns the same items as a linear scan of the list:
+    items that are not dictionaries are skipped and, if there are multiple matching items, the first one is returned.
+    Use `index_items()` to get an index memoized per list within an `item_indexes()` context.
+
+    Examples
+    --------
+    ```python
+    >>> index = ItemIndex([{"peerAddress": "10.0.0.1", "vrf": "default"}], "peerAddress")
+    >>> index.get("10.0.0.1")
+    {'peerAddress': '10.0.0.1', 'vrf': 'default'}
+    >>> index = ItemIndex([{"peerAddress": "10.0.0.1", "vrf": "default"}], ("peerAddress", "vrf"))
+    >>> index.get(("10.0.0.1", "DEFAULT"))
+    {'peerAddress': '10.0.0.1', 'vrf': 'default'}
+    ```
+
+    Attributes
+    ----------
+    key
+        Dictionary key to index the items on. A tuple of keys indexes the items on the tuple of their values.
+    case_sensitive
+        If False, string values are compared ignoring case.
+    source
+        The indexed list.
+    length
+        Length of the list when the index was built.
+    """
+
+    __slots__ = ("_items", "case_sensitive", "key", "length", "source")
+
+    def __init__(self, list_of_dicts: list[Any], key: Any, *, case_sensitive: bool = False) -> None:
+        self.key = key
+        self.case_sensitive = case_sensitive
+        self.source = list_of_dicts
+        self.length = len(list_of_dicts)
+        self._items: dict[Any, list[dict[Any, Any]]] = {}
+        for list_item in list_of_dicts:
+            if not isinstance(list_item, dict):
+                continue
+            value = tuple(list_item.get(k) for k in key) if isinstance(key, tuple) else list_item.get(key)
+            try:
+                self._items.setdefault(self._normalize(value), []).append(list_item)
+            except TypeError:
+                # Unhashable values (lists or dictionaries) cannot match a hashable value
+                continue
+
+    def __repr__(self) -> str:
+        """Return the representation of the ItemIndex."""
+        return f"ItemIndex({self.key!r}, case_sensitive={self.case_sensitive!r}, length={self.length!r})"
+
+    def __len__(self) -> int:
+        """Return the number of distinct indexed values."""
+        return len(self._items)
+
+    def _normalize(self, value: Any) -> Any:
+        """Return the indexed form of a value."""
+        if self.case_sensitive:
+            return value
+        if isinstance(value, str):
+            return value.casefold()
+        if isinstance(self.key, tuple) and isinstance(value, tuple):
+            return tuple(v.casefold() if isinstance(v, str) else v for v in value)
+        return value
+
+    def get(self, value: Any, default: Any | None = None) -> Any:
+        """Return the first item matching the value or the default value if there is no match.
+
+        Raises
+        ------
+        TypeError
+            If the value is not hashable.
+        """
+        items = self._items.get(self._normalize(value))
+        return items[0] if items else default
+
+    def get_all(self, value: Any) -> list[dict[Any, Any]]:
+        """Return all the items matching the value, in the order of the list.
+
+        Raises
+        ------
+        TypeError
+            If the value is not hashable.
+        """
+        return self._items.get(self._normalize(value), [])
+
+
+_ITEM_INDEXES: ContextVar[dict[tuple[int, Any, bool], ItemIndex] | None] = ContextVar("_ITEM_INDEXES", default=None)
+
+
+@contextmanager
+def item_indexes(memo: dict[tuple[int, Any, bool], ItemIndex] | None = None) -> Iterator[None]:
+    """Memoize the indexes built by `index_items()` until the context exits.
+
+    `AntaTest` runs its `test()` method in this context with the memo of its device for the outputs of its commands,
+    see `AntaDevice.item_index_memo()`: the tests using the same cached outputs share their indexes.
+
+    Parameters
+    ----------
+    memo
+        Dictionary storing the indexes, kept by the caller. A new dictionary, discarded when the context exits, if None.
+    """
+    token = _ITEM_INDEXES.set({} if memo is None else memo)
+    try:
+        yield
+    finally:
+        _ITEM_INDEXES.reset(token)
+
+
+def index_items(list_of_dicts: list[Any], key: Any, *, case_sensitive: bool = False) -> ItemIndex:
+    """Return an `ItemIndex` of a list of dictionaries, memoized per list within an `item_indexes()` context.
+
+    Within the context, the list is identified by its identity: the index holds a reference to the list so its id cannot be
+    reused by another list before the context exits. The index is rebuilt if the length of the list has changed.
+    Outside of an `item_indexes()` context, a new index is built on each call.
+
+    Parameters
+    ----------
+    list_of_dicts
+        List of dictionaries to index.
+    key
+        Dictionary key to index the items on. A tuple of keys indexes the items on the tuple of their values.
+    case_sensitive
+        If False, string values are compared ignoring case.
+
+    Returns
+    -------
+    ItemIndex
+        The index of the list.
+    """
+    if (indexes := _ITEM_INDEXES.get()) is None:
+        return ItemIndex(list_of_dicts, key, case_sensitive=case_sensitive)
+    cache_key = (id(list_of_dicts), key, case_sensitive)
+    index = indexes.get(cache_key)
+    if index is None or index.source is not list_of_dicts or index.length != len(list_of_dicts):
+        index = indexes[cache_key] = ItemIndex(list_of_dicts, key, case_sensitive=case_sensitive)
+    return index
+
+
+def _candidates(list_of_dicts: list[Any], key: Any, value: Any, *, case_sensitive: bool) -> list[Any]:
+    """Return the items of a list that can have the given value for the key.
+
+    Lists shorter than `ITEM_INDEX_MIN_SIZE` and lists looked up outside of an `item_indexes()` context are returned as is.
+    Longer lists are looked up with an index memoized by `index_items()`.
+    """
+    # A tuple key is a single dictionary key here while it is a composite key for an ItemIndex
+    if len(list_of_dicts) < ITEM_INDEX_MIN_SIZE or isinstance(key, tuple) or _ITEM_INDEXES.get() is None:
+        return list_of_dicts
+    try:
+        return index_items(list_of_dicts, key, case_sensitive=case_sensitive).get_all(value)
+    except TypeError:
+        # Key or value is not hashable, fall back to a linear scan
+        return list_of_dicts
 
 
 def get_item(
@@ -254,7 +560,7 @@ def get_item(
             raise ValueError(custom_error_msg or var_name)
         return default
 
-    for list_item in list_of_dicts:
+    for list_item in _candidates(list_of_dicts, key, value, case_sensitive=case_sensitive):
         if not isinstance(list_item, dict):
             # List item is not a dict as required. Skip this item
             continue
@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Generates anta/registry.json."""
+
+from pathlib import Path
+from sys import path
+
+# Override global path to load anta from pwd instead of any installed version.
+path.insert(0, str(Path(__file__).parents[2]))
+
+from anta.registry import REGISTRY_FILE, build_registry, dump_registry
+
+REGISTRY_FILE.write_text(dump_registry(build_registry()), encoding="UTF-8")
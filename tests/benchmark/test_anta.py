@@ -4,7 +4,10 @@
 """Benchmark tests for ANTA."""
 
 import asyncio
+import importlib
 import logging
+import pkgutil
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -22,6 +25,30 @@ from .utils import collect, collect_commands
 logger = logging.getLogger(__name__)
 
 
+def test_anta_tests_import(benchmark: BenchmarkFixture) -> None:
+    """Benchmark the import time of the ANTA tests library."""
+    import anta.tests  # pylint: disable=import-outside-toplevel
+
+    modules = [module.name for module in pkgutil.walk_packages(anta.tests.__path__, "anta.tests.")]
+    for name in modules:
+        importlib.import_module(name)
+    # Keep the imported modules to restore them after the benchmark: other benchmarks use the test classes
+    imported = {name: module for name, module in sys.modules.items() if name.startswith(("anta.tests.", "anta.input_models"))}
+
+    def _() -> None:
+        for name in imported:
+            sys.modules.pop(name, None)
+        for name in modules:
+            importlib.import_module(name)
+
+    try:
+        benchmark(_)
+    finally:
+        sys.modules.update(imported)
+    bench_info = "\n--- ANTA Tests Import Benchmark Information ---\n" f"Module count: {len(modules)}\n" "------------------------------------------------"
+    logger.info(bench_info)
+
+
 def test_anta_dry_run(benchmark: BenchmarkFixture, event_loop: asyncio.AbstractEventLoop, catalog: AntaCatalog, inventory: AntaInventory) -> None:
     """Benchmark ANTA in Dry-Run Mode."""
     # Disable logging during ANTA execution to avoid having these function time in benchmarks
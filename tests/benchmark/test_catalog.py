@@ -0,0 +1,64 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for anta.catalog."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+from anta.catalog import AntaCatalog
+
+logger = logging.getLogger(__name__)
+
+
+def generate_catalog(path: Path, count: int) -> None:
+    """Write a machine-generated JSON catalog with `count` test definitions."""
+    definitions = [
+        {"VerifyReachability": {"hosts": [{"source": "Management0", "destination": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", "vrf": "MGMT"}]}}
+        for i in range(count)
+    ]
+    path.write_text(json.dumps({"anta.tests.connectivity": definitions}), encoding="UTF-8")
+
+
+@pytest.mark.parametrize("count", [pytest.param(10_000, id="10k"), pytest.param(100_000, id="100k"), pytest.param(1_000_000, id="1M")])
+@pytest.mark.parametrize("trusted", [pytest.param(False, id="validated"), pytest.param(True, id="trusted")])
+def test_anta_catalog_parse(benchmark: BenchmarkFixture, tmp_path: Path, count: int, *, trusted: bool) -> None:
+    """Benchmark AntaCatalog.parse() on a JSON catalog."""
+    path = tmp_path / "catalog.json"
+    generate_catalog(path, count)
+
+    def _() -> AntaCatalog:
+        return AntaCatalog.parse(path, file_format="json", trusted=trusted)
+
+    catalog = benchmark(_)
+
+    if len(catalog.tests) != count:
+        pytest.fail(f"Expected {count} tests in the catalog but got {len(catalog.tests)}", pytrace=False)
+    bench_info = (
+        "\n--- AntaCatalog.parse() Benchmark Information ---\n"
+        f"Test definition count: {count}\n"
+        f"Trusted: {trusted}\n"
+        "-------------------------------------------------"
+    )
+    logger.info(bench_info)
+
+
+@pytest.mark.parametrize("count", [pytest.param(10_000, id="10k"), pytest.param(100_000, id="100k"), pytest.param(1_000_000, id="1M")])
+def test_anta_catalog_check(benchmark: BenchmarkFixture, tmp_path: Path, count: int) -> None:
+    """Benchmark AntaCatalog.check() on a JSON catalog using all the processors."""
+    path = tmp_path / "catalog.json"
+    generate_catalog(path, count)
+
+    def _() -> int:
+        return AntaCatalog.check(path, file_format="json")
+
+    checked = benchmark(_)
+
+    if checked != count:
+        pytest.fail(f"Expected {count} checked tests but got {checked}", pytrace=False)
+    bench_info = "\n--- AntaCatalog.check() Benchmark Information ---\n" f"Test definition count: {count}\n" "-------------------------------------------------"
+    logger.info(bench_info)
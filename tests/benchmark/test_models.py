@@ -0,0 +1,45 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for anta.models."""
+
+import logging
+from typing import Any
+
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+from anta.models import AntaCommand, AntaTemplate
+
+logger = logging.getLogger(__name__)
+
+RENDER_COUNT = 100_000
+
+
+@pytest.mark.parametrize(
+    ("template", "params"),
+    [
+        pytest.param(
+            AntaTemplate(template="ping vrf {vrf} {destination} source {source} size {size} repeat {repeat}{df_bit}", revision=1),
+            {"vrf": "default", "destination": "10.0.0.1", "source": "Loopback0", "size": 100, "repeat": 2, "df_bit": ""},
+            id="ping",
+        ),
+        pytest.param(
+            AntaTemplate(template="show bgp neighbors {peer} vrf {vrf}", revision=3),
+            {"peer": "10.1.0.1", "vrf": "default"},
+            id="bgp-neighbor",
+        ),
+    ],
+)
+def test_anta_template_render(benchmark: BenchmarkFixture, template: AntaTemplate, params: dict[str, Any]) -> None:
+    """Benchmark AntaTemplate.render() throughput."""
+
+    def _() -> list[AntaCommand]:
+        return [template.render(**params) for _ in range(RENDER_COUNT)]
+
+    commands = benchmark(_)
+
+    if len(commands) != RENDER_COUNT:
+        pytest.fail(f"Expected {RENDER_COUNT} rendered commands but got {len(commands)}", pytrace=False)
+    bench_info = "\n--- AntaTemplate.render() Benchmark Information ---\n" f"Render count: {RENDER_COUNT}\n" "----------------------------------------------------"
+    logger.info(bench_info)
@@ -11,11 +11,9 @@ from anta.result_manager import ResultManager
 from anta.runner import get_coroutines, prepare_tests
 
 if TYPE_CHECKING:
-    from collections import defaultdict
-
     from pytest_codspeed import BenchmarkFixture
 
-    from anta.catalog import AntaCatalog, AntaTestDefinition
+    from anta.catalog import AntaCatalog, AntaTestDefinition, AntaUnresolvedTestDefinition
     from anta.device import AntaDevice
     from anta.inventory import AntaInventory
 
@@ -23,7 +21,7 @@ if TYPE_CHECKING:
 def test_prepare_tests(benchmark: BenchmarkFixture, catalog: AntaCatalog, inventory: AntaInventory) -> None:
     """Benchmark `anta.runner.prepare_tests`."""
 
-    def _() -> defaultdict[AntaDevice, set[AntaTestDefinition]] | None:
+    def _() -> dict[AntaDevice, tuple[AntaTestDefinition | AntaUnresolvedTestDefinition, ...]] | None:
         catalog.clear_indexes()
         return prepare_tests(inventory=inventory, catalog=catalog, tests=None, tags=None)
 
@@ -4,6 +4,7 @@
 """Tests for anta.tests module."""
 
 import asyncio
+from copy import deepcopy
 from typing import Any
 
 from anta.device import AntaDevice
@@ -18,8 +19,12 @@ def test(device: AntaDevice, data: dict[str, Any]) -> None:
     """
     # Instantiate the AntaTest subclass
     test_instance = data["test"](device, inputs=data["inputs"], eos_data=data["eos_data"])
+    # Keep a copy of the outputs, shared with other tests through the device cache
+    eos_data = deepcopy(data["eos_data"])
     # Run the test() method
     asyncio.run(test_instance.test())
+    # The test must not mutate the command outputs
+    assert data["eos_data"] == eos_data, "The test has mutated the command outputs"
     # Assert expected result
     assert test_instance.result.result == data["expected"]["result"], f"Expected '{data['expected']['result']}' result, got '{test_instance.result.result}'"
     if "messages" in data["expected"]:
@@ -28,6 +28,8 @@ from anta.tests.routing.bgp import (
     VerifyBGPTimers,
     VerifyEVPNType2Route,
     _check_bgp_neighbor_capability,
+    _get_bgp_peer,
+    _get_bgp_peers,
 )
 from tests.units.anta_tests import test
 
@@ -48,6 +50,23 @@ def test_check_bgp_neighbor_capability(input_dict: dict[str, bool], expected: bo
     assert _check_bgp_neighbor_capability(input_dict) == expected
 
 
+def test_get_bgp_peers() -> None:
+    """Test the bgp_peers parser."""
+    output: dict[str, Any] = {
+        "vrfs": {
+            "default": {"peerList": [{"peerAddress": "fd00::A", "state": "Established"}, {"peerAddress": "fd00::a", "state": "Idle"}, "not a dict"]},
+            "MGMT": {"peerList": [{"peerAddress": "10.1.0.1"}]},
+            "DEV": {},
+        }
+    }
+    peers = _get_bgp_peers(output)
+    assert len(peers) == 2
+    assert _get_bgp_peer(peers, "default", "fd00::a") is output["vrfs"]["default"]["peerList"][0]
+    assert _get_bgp_peer(peers, "MGMT", "10.1.0.1") is output["vrfs"]["MGMT"]["peerList"][0]
+    assert _get_bgp_peer(peers, "default", "10.1.0.1") is None
+    assert _get_bgp_peers({}) == {}
+
+
 DATA: list[dict[str, Any]] = [
     {
         "name": "success",
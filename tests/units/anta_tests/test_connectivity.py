@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from anta.tests.connectivity import VerifyLLDPNeighbors, VerifyReachability
 from tests.units.anta_tests import test
 
+if TYPE_CHECKING:
+    from anta.device import AntaDevice
+
 DATA: list[dict[str, Any]] = [
     {
         "name": "success-ip",
@@ -189,6 +192,51 @@ DATA: list[dict[str, Any]] = [
         ],
         "expected": {"result": "failure", "messages": ["Host 10.0.0.11 (src: Management0, vrf: default, size: 100B, repeat: 2) - Unreachable"]},
     },
+    {
+        "name": "failure-latency",
+        "test": VerifyReachability,
+        "inputs": {
+            "hosts": [
+                {"destination": "10.0.0.11", "source": "Management0", "interval": 0.2, "timeout": 1},
+                {"destination": "10.0.0.2", "source": "Management0", "interval": 0.2, "timeout": 1},
+            ],
+            "batch": {"max_duration": 5},
+            "report_latency": True,
+        },
+        "eos_data": [
+            {
+                "messages": [
+                    """PING 10.0.0.11 (10.0.0.11) from 10.0.0.5 : 72(100) bytes of data.
+
+                --- 10.0.0.11 ping statistics ---
+                2 packets transmitted, 0 received, 100% packet loss, time 210ms
+
+
+                """,
+                ],
+            },
+            {
+                "messages": [
+                    """PING 10.0.0.2 (10.0.0.2) from 10.0.0.5 : 72(100) bytes of data.
+                80 bytes from 10.0.0.2: icmp_seq=1 ttl=64 time=0.247 ms
+                80 bytes from 10.0.0.2: icmp_seq=2 ttl=64 time=0.072 ms
+
+                --- 10.0.0.2 ping statistics ---
+                2 packets transmitted, 2 received, 0% packet loss, time 200ms
+                rtt min/avg/max/mdev = 0.072/0.159/0.247/0.088 ms, ipg/ewma 0.370/0.225 ms
+
+                """,
+                ],
+            },
+        ],
+        "expected": {
+            "result": "failure",
+            "messages": [
+                "Host 10.0.0.11 (src: Management0, vrf: default, size: 100B, repeat: 2) - Unreachable",
+                "Host 10.0.0.2 (src: Management0, vrf: default, size: 100B, repeat: 2) - Average latency: 0.159 ms",
+            ],
+        },
+    },
     {
         "name": "failure-size",
         "test": VerifyReachability,
@@ -502,3 +550,32 @@ DATA: list[dict[str, Any]] = [
         },
     },
 ]
+
+
+class TestVerifyReachability:
+    """Test anta.tests.connectivity.VerifyReachability."""
+
+    def test_batch_commands(self, device: AntaDevice) -> None:
+        """Test that the pings are grouped in batches within the latency budget."""
+        hosts: list[dict[str, Any]] = [{"destination": f"10.0.0.{i}", "source": "Management0"} for i in range(4)]
+        hosts.insert(1, {"destination": "10.0.1.1", "source": "Management0", "repeat": 20, "timeout": 2})
+        test_instance = VerifyReachability(device, inputs={"hosts": hosts, "batch": {"max_duration": 2.5}})
+        assert test_instance.instance_commands[0].command == "ping vrf default 10.0.0.0 source Management0 size 100 repeat 2 interval 0.2 timeout 1"
+        assert test_instance.instance_commands[1].command == "ping vrf default 10.0.1.1 source Management0 size 100 repeat 20 interval 0.2 timeout 2"
+        assert not any(command.use_cache for command in test_instance.instance_commands)
+        batches = test_instance.batch_commands()
+        assert batches is not None
+        # A ping lasts up to 1.2s, except the one to 10.0.1.1 which exceeds the budget and is sent in its own request
+        assert [[command.command.split()[3] for command in batch] for batch in batches] == [
+            ["10.0.0.0"],
+            ["10.0.1.1"],
+            ["10.0.0.1", "10.0.0.2"],
+            ["10.0.0.3"],
+        ]
+
+    def test_no_batch(self, device: AntaDevice) -> None:
+        """Test that the pings are not batched by default."""
+        test_instance = VerifyReachability(device, inputs={"hosts": [{"destination": "10.0.0.1", "source": "Management0"}]})
+        assert test_instance.instance_commands[0].command == "ping vrf default 10.0.0.1 source Management0 size 100 repeat 2"
+        assert test_instance.instance_commands[0].use_cache
+        assert test_instance.batch_commands() is None
@@ -1961,6 +1961,47 @@ DATA: list[dict[str, Any]] = [
         "inputs": {"interfaces": ["Ethernet1", "Ethernet2"]},
         "expected": {"result": "failure", "messages": ["The following interface(s) have Proxy-ARP disabled: ['Ethernet2']"]},
     },
+    {
+        "name": "failure-bulk",
+        "test": VerifyIPProxyARP,
+        "eos_data": [
+            {
+                "interfaces": {
+                    f"Ethernet{index}": {"name": f"Ethernet{index}", "interfaceStatus": "connected", "proxyArp": index not in (4, 7), "vrf": "default"}
+                    for index in range(1, 53)
+                },
+            },
+        ],
+        "inputs": {"interfaces": [f"Ethernet{index}" for index in range(1, 51)]},
+        "expected": {"result": "failure", "messages": ["The following interface(s) have Proxy-ARP disabled: ['Ethernet4', 'Ethernet7']"]},
+    },
+    {
+        "name": "failure-bulk-interface-not-found",
+        "test": VerifyIPProxyARP,
+        "eos_data": [
+            {
+                "interfaces": {
+                    f"Ethernet{index}": {"name": f"Ethernet{index}", "interfaceStatus": "connected", "proxyArp": True, "vrf": "default"} for index in range(1, 50)
+                },
+            },
+        ],
+        "inputs": {"interfaces": [f"Ethernet{index}" for index in range(1, 51)]},
+        "expected": {"result": "failure", "messages": ["The following interface(s) are not found: ['Ethernet50']"]},
+    },
+    {
+        "name": "failure-bulk-interface-not-found",
+        "test": VerifyInterfaceIPv4,
+        "eos_data": [
+            {
+                "interfaces": {
+                    f"Ethernet{index}": {"interfaceAddress": {"primaryIp": {"address": f"172.30.{index}.0", "maskLen": 31}, "secondaryIpsOrderedList": []}}
+                    for index in range(1, 50)
+                },
+            },
+        ],
+        "inputs": {"interfaces": [{"name": f"Ethernet{index}", "primary_ip": f"172.30.{index}.0/31"} for index in range(1, 51)]},
+        "expected": {"result": "failure", "messages": ["Interface `Ethernet50` is not found."]},
+    },
     {
         "name": "success",
         "test": VerifyInterfaceIPv4,
@@ -754,6 +754,28 @@ DATA: list[dict[str, Any]] = [
         },
         "expected": {"result": "success"},
     },
+    {
+        "name": "failure-bulk",
+        "test": VerifyIPv4ACL,
+        "eos_data": [
+            {
+                "aclList": [
+                    {"name": f"ACL{index}", "sequence": [{"text": "permit icmp any any" if index != 4 else "deny ip any any", "sequenceNumber": 10}]}
+                    for index in range(1, 10)
+                ]
+                # ACL names are case-sensitive
+                + [{"name": "acl10", "sequence": [{"text": "permit icmp any any", "sequenceNumber": 10}]}]
+            },
+        ],
+        "inputs": {"ipv4_access_lists": [{"name": f"ACL{index}", "entries": [{"sequence": 10, "action": "permit icmp any any"}]} for index in range(1, 11)]},
+        "expected": {
+            "result": "failure",
+            "messages": [
+                "ACL4:\nExpected `permit icmp any any` as sequence number 10 action but found `deny ip any any` instead.\n",
+                "ACL10: Not found",
+            ],
+        },
+    },
     {
         "name": "failure-acl-not-found",
         "test": VerifyIPv4ACL,
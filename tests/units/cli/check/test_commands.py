@@ -32,3 +32,18 @@ def test_catalog(click_runner: CliRunner, catalog_path: Path, expected_exit: int
     result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / catalog_path)])
     assert result.exit_code == expected_exit
     assert expected_output in result.output
+
+
+@pytest.mark.parametrize(
+    ("catalog_path", "expected_exit", "expected_output"),
+    [
+        pytest.param("test_catalog_with_undefined_module.yml", ExitCode.USAGE_ERROR, "Test catalog is invalid!", id="catalog is not valid"),
+        pytest.param("test_catalog_with_undefined_tests.yml", ExitCode.USAGE_ERROR, "FakeTest is not defined", id="test is not defined"),
+        pytest.param("test_catalog.yml", ExitCode.OK, "Catalog contains 1 tests", id="catalog valid"),
+    ],
+)
+def test_catalog_workers(click_runner: CliRunner, catalog_path: Path, expected_exit: int, expected_output: str) -> None:
+    """Test `anta check catalog -c catalog --workers 2."""
+    result = click_runner.invoke(anta, ["check", "catalog", "-c", str(DATA_DIR / catalog_path), "--workers", "2"])
+    assert result.exit_code == expected_exit
+    assert expected_output in result.output
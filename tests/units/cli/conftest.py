@@ -14,6 +14,7 @@ import pytest
 from click.testing import CliRunner, Result
 
 import asynceapi
+from anta.cache import PERSISTENT_CACHE_FINGERPRINT_COMMAND
 from anta.cli.console import console
 
 if TYPE_CHECKING:
@@ -47,6 +48,7 @@ MOCK_CLI_TEXT: dict[str, asynceapi.EapiCommandError | str] = {
     "bash timeout 10 ls -1t /mnt/flash/schedule/tech-support": "dummy_tech-support_2023-12-01.1115.log.gz\ndummy_tech-support_2023-12-01.1015.log.gz",
     "bash timeout 10 ls -1t /mnt/flash/schedule/tech-support | head -1": "dummy_tech-support_2023-12-01.1115.log.gz",
     "show running-config | include aaa authorization exec default": "aaa authorization exec default local",
+    PERSISTENT_CACHE_FINGERPRINT_COMMAND: "hostname leaf1",
 }
 
 
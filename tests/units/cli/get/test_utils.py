@@ -13,9 +13,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
-from anta.cli.get.utils import create_inventory_from_ansible, create_inventory_from_cvp, extract_examples, find_tests_examples, get_cv_token, print_test
+from anta.cli.get.utils import (
+    create_inventory_from_ansible,
+    create_inventory_from_cvp,
+    explore_package,
+    find_tests_examples,
+    get_cv_token,
+    print_test,
+)
 from anta.inventory import AntaInventory
 from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.registry import RegisteredTest, extract_examples
 
 DATA_DIR: Path = Path(__file__).parents[3].resolve() / "data"
 
@@ -237,6 +245,27 @@ def test_print_test() -> None:
         print_test(MissingExampleTest)
     with pytest.raises(LookupError, match="is missing an Example"):
         print_test(EmptyExampleTest)
+    with pytest.raises(LookupError, match="Test MissingExampleTest in module tests.units.cli.get.test_utils is missing an Example"):
+        print_test(RegisteredTest.from_test(MissingExampleTest))
+
+
+@pytest.mark.parametrize(
+    ("module", "test_name", "expected"),
+    [
+        pytest.param("anta.tests", None, 158, id="all"),
+        pytest.param("anta.tests.routing", None, 27, id="package"),
+        pytest.param("anta.tests.stun", "VerifyStunClient", 2, id="test-name"),
+    ],
+)
+def test_explore_package_registry(capsys: pytest.CaptureFixture[str], module: str, test_name: str | None, expected: int) -> None:
+    """Test explore_package returns the same tests with or without the static registry of ANTA tests."""
+    assert explore_package(module, test_name=test_name) == expected
+    output = capsys.readouterr().out
+    with patch("anta.cli.get.utils.find_tests", return_value=None):
+        assert explore_package(module, test_name=test_name) == expected
+    assert capsys.readouterr().out == output
+    assert explore_package(module, test_name=test_name, count=True) == expected
+    assert capsys.readouterr().out == ""
 
 
 def test_extract_examples() -> None:
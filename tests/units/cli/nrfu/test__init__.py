@@ -5,14 +5,20 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+from anta.cache import CATALOG_CACHE_DIRNAME, PERSISTENT_CACHE_FILENAME, PersistentCache
+from anta.catalog import AntaCatalog
 from anta.cli import anta
 from anta.cli.utils import ExitCode
 
 if TYPE_CHECKING:
     from click.testing import CliRunner
 
+DATA_DIR: Path = Path(__file__).parents[3].resolve() / "data"
+
 # TODO: write unit tests for ignore-status and ignore-error
 
 
@@ -48,6 +54,50 @@ def test_anta_nrfu_dry_run(click_runner: CliRunner) -> None:
     assert "Dry-run" in result.output
 
 
+def test_anta_nrfu_merge_tests(click_runner: CliRunner) -> None:
+    """Test anta nrfu --merge-tests, catalog is given via env."""
+    result = click_runner.invoke(anta, ["nrfu", "--merge-tests", "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    assert "Merged compatible tests: 3 tests reduced to 3" in result.output
+
+
+def test_anta_nrfu_trusted_catalog(click_runner: CliRunner) -> None:
+    """Test anta nrfu --trusted-catalog, catalog is given via env."""
+    with patch("anta.cli.utils.AntaCatalog.parse", wraps=AntaCatalog.parse) as parse:
+        result = click_runner.invoke(anta, ["nrfu", "--trusted-catalog", "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    assert "Tests catalog contains 1 tests" in result.output
+    assert parse.call_args.kwargs["trusted"] is True
+
+
+def test_anta_nrfu_tag_expression(click_runner: CliRunner) -> None:
+    """Test anta nrfu --tags with a tag expression, catalog is given via env."""
+    result = click_runner.invoke(anta, ["nrfu", "--tags", "(leaf OR spine) and not dc1", "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    assert "There are no tests matching the tags (leaf or spine) and not dc1 to run" in result.output
+
+
+def test_anta_nrfu_invalid_tag_expression(click_runner: CliRunner) -> None:
+    """Test anta nrfu --tags with an invalid tag expression."""
+    result = click_runner.invoke(anta, ["nrfu", "--tags", "(leaf or spine", "--dry-run"])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "Invalid tag expression '(leaf or spine': unexpected end of expression" in result.output
+
+
+def test_anta_nrfu_inventory_variables(click_runner: CliRunner) -> None:
+    """Test anta nrfu --inventory-variables, catalog is given via env."""
+    result = click_runner.invoke(anta, ["nrfu", "--inventory-variables", str(DATA_DIR / "test_inventory_variables.yml"), "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    assert "of the variables file" in result.output
+
+
+def test_anta_nrfu_parametrized_catalog(click_runner: CliRunner) -> None:
+    """Test anta nrfu --catalog with parametrized tests."""
+    result = click_runner.invoke(anta, ["nrfu", "--catalog", str(DATA_DIR / "test_catalog_parametrized.yml"), "--dry-run"])
+    assert result.exit_code == ExitCode.OK
+    assert "Tests catalog contains 3 tests" in result.output
+
+
 def test_anta_nrfu_wrong_catalog_format(click_runner: CliRunner) -> None:
     """Test anta nrfu --dry-run, catalog is given via env."""
     result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--catalog-format", "toto"])
@@ -119,6 +169,17 @@ def test_disable_cache(click_runner: CliRunner) -> None:
     assert result.exit_code == ExitCode.OK
 
 
+def test_cache_dir(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test that cache_dir creates the persistent cache database and compiles the catalog."""
+    with patch.object(PersistentCache, "close", autospec=True, side_effect=PersistentCache.close) as close_mock:
+        result = click_runner.invoke(anta, ["nrfu", "--cache-dir", str(tmp_path / "cache")])
+    assert result.exit_code == ExitCode.OK
+    assert (tmp_path / "cache" / PERSISTENT_CACHE_FILENAME).exists()
+    # The persistent cache is closed at the end of the run
+    close_mock.assert_called_once()
+    assert len(list((tmp_path / "cache" / CATALOG_CACHE_DIRNAME).glob("*.pickle"))) == 1
+
+
 def test_hide(click_runner: CliRunner) -> None:
     """Test the `--hide` option of the `anta nrfu` command."""
     result = click_runner.invoke(anta, ["nrfu", "--hide", "success", "text"])
@@ -9,15 +9,21 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
+from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
+from anta.tags import TagExpression
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from _pytest.mark.structures import ParameterSet
 
 FILE_DIR: Path = Path(__file__).parent.parent.resolve() / "data" / "inventory"
+DATA_DIR: Path = Path(__file__).parents[2].resolve() / "data"
 
 
 INIT_VALID_PARAMS: list[ParameterSet] = [
@@ -76,3 +82,69 @@ class TestAntaInventory:
         """Parse invalid YAML file to create ANTA inventory."""
         with pytest.raises((InventoryIncorrectSchemaError, InventoryRootKeyError, ValidationError)):
             AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+
+    @pytest.mark.parametrize(
+        ("tags", "expected"),
+        [
+            pytest.param({"leaf"}, ["leaf1", "leaf2"], id="set"),
+            pytest.param({"spine", "dc1"}, ["leaf1", "spine1"], id="set-union"),
+            pytest.param(frozenset({"spine"}), ["spine1"], id="frozenset"),
+            pytest.param(["leaf", "unknown"], ["leaf1", "leaf2"], id="list"),
+            pytest.param(set(), [], id="empty-set"),
+            pytest.param(TagExpression("leaf and not dc1"), ["leaf2"], id="expression"),
+            pytest.param(TagExpression("not leaf"), ["spine1"], id="expression-not"),
+            pytest.param(TagExpression("(spine or leaf) and not unknown"), ["leaf1", "leaf2", "spine1"], id="expression-unknown-tag"),
+            pytest.param(TagExpression("spine and dc1"), [], id="expression-no-devices"),
+        ],
+    )
+    def test_get_inventory_tags(self, tags: Iterable[str] | TagExpression, expected: list[str]) -> None:
+        """Test AntaInventory.get_inventory() with tags and tag expressions."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="arista", password="arista123")
+        assert list(inventory.get_inventory(tags=tags)) == expected
+
+    def test_get_inventory_tag_index(self) -> None:
+        """Test the index used to evaluate tag expressions is reused and rebuilt when the devices of the inventory change."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="arista", password="arista123")
+        expression = TagExpression("leaf")
+        assert list(inventory.get_inventory(tags=expression)) == ["leaf1", "leaf2"]
+        index = inventory._tag_index
+        assert list(inventory.get_inventory(tags=TagExpression("spine"))) == ["spine1"]
+        assert inventory._tag_index is index
+        leaf3 = AsyncEOSDevice(name="leaf3", host="leaf3.example.com", username="arista", password="arista123", tags={"leaf"})
+        inventory.add_device(leaf3)
+        assert list(inventory.get_inventory(tags=expression)) == ["leaf1", "leaf2", "leaf3"]
+        del inventory["leaf1"]
+        assert list(inventory.get_inventory(tags=expression)) == ["leaf2", "leaf3"]
+
+    def test_parse_variables(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaInventory.parse() with device variables."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_variables.yml", username="arista", password="arista123")
+        assert inventory["leaf1"].variables == inventory["leaf2"].variables
+        assert inventory["leaf1"].variables["lldp_neighbors"]["neighbors"][0]["neighbor_port"] == "Ethernet1"
+        assert inventory["spine1"].variables == {}
+        inventory = AntaInventory.parse(
+            filename=DATA_DIR / "test_inventory_with_variables.yml",
+            username="arista",
+            password="arista123",
+            variables=DATA_DIR / "test_inventory_variables.yml",
+        )
+        assert inventory["leaf1"].variables["lldp_neighbors"]["neighbors"][0]["neighbor_port"] == "Ethernet1"
+        assert inventory["leaf2"].variables["lldp_neighbors"]["neighbors"][0]["neighbor_port"] == "Ethernet2"
+        assert inventory["leaf3"].variables["lldp_neighbors"]["neighbors"][0]["neighbor_port"] == "Ethernet3"
+        assert "Device spine2 of the variables file" in caplog.text
+
+    @pytest.mark.parametrize(
+        ("content", "expected_exception"),
+        [
+            pytest.param("- leaf1\n", InventoryIncorrectSchemaError, id="not-a-dict"),
+            pytest.param("leaf1: 42\n", InventoryIncorrectSchemaError, id="not-a-dict-of-variables"),
+            pytest.param("leaf1: [\n", yaml.YAMLError, id="invalid-yaml"),
+        ],
+    )
+    def test_load_variables_invalid(self, tmp_path: Path, content: str, expected_exception: type[Exception]) -> None:
+        """Test AntaInventory.load_variables() with invalid files."""
+        file = tmp_path / "variables.yml"
+        file.write_text(content, encoding="UTF-8")
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_variables.yml", username="arista", password="arista123")
+        with pytest.raises(expected_exception):
+            inventory.load_variables(file)
@@ -0,0 +1,205 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""test anta.cache.py."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+
+from anta.cache import CATALOG_CACHE_DIRNAME, PERSISTENT_CACHE_FILENAME, CatalogCache, PersistentCache, UnsupportedCommands
+from anta.catalog import AntaTestDefinition
+from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.tests.software import VerifyEOSVersion
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from anta.device import AntaDevice
+
+
+class TestPersistentCache:
+    """Test for anta.cache.PersistentCache."""
+
+    def test__init__(self, tmp_path: Path) -> None:
+        """Test the PersistentCache constructor."""
+        cache = PersistentCache(tmp_path / "cache")
+        assert cache.path == tmp_path / "cache" / PERSISTENT_CACHE_FILENAME
+        assert cache.path.exists()
+        assert repr(cache) == f"PersistentCache({tmp_path / 'cache'!r})"
+        cache.close()
+
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            pytest.param("show running-config", False, id="running-config"),
+            pytest.param("show running-config diffs", False, id="running-config-diffs"),
+            pytest.param("show hostname", True, id="hostname"),
+            pytest.param("show aaa methods accounting", True, id="aaa-methods"),
+            pytest.param("show snmp ipv4 access-list summary", True, id="snmp-acl"),
+            pytest.param("show management api http-commands", True, id="http-commands"),
+            pytest.param("show interfaces counters", False, id="counters"),
+        ],
+    )
+    def test_is_cacheable(self, tmp_path: Path, command: str, expected: bool) -> None:
+        """Test PersistentCache.is_cacheable()."""
+        cache = PersistentCache(tmp_path)
+        assert cache.is_cacheable(AntaCommand(command=command)) is expected
+        cache.close()
+
+    def test_is_cacheable_no_commands(self, tmp_path: Path) -> None:
+        """Test PersistentCache.is_cacheable() when no command can be cached."""
+        cache = PersistentCache(tmp_path, commands=[])
+        assert cache.is_cacheable(AntaCommand(command="show hostname")) is False
+        cache.close()
+
+    def test_get_set(self, tmp_path: Path) -> None:
+        """Test PersistentCache.get() and PersistentCache.set() across instances."""
+        cache = PersistentCache(tmp_path)
+        assert cache.get("leaf1", "uid", "fingerprint1") is None
+        cache.set("leaf1", "uid", "fingerprint1", {"key": "value"})
+        cache.set("leaf1", "text_uid", "fingerprint1", "text output")
+        assert cache.get("leaf1", "uid", "fingerprint1") == {"key": "value"}
+        assert cache.get("leaf2", "uid", "fingerprint1") is None
+        cache.close()
+
+        # The outputs are persisted
+        cache = PersistentCache(tmp_path)
+        assert cache.get("leaf1", "uid", "fingerprint1") == {"key": "value"}
+        assert cache.get("leaf1", "text_uid", "fingerprint1") == "text output"
+        # A different fingerprint means the device state has changed
+        assert cache.get("leaf1", "uid", "fingerprint2") is None
+        cache.set("leaf1", "uid", "fingerprint2", {"key": "new_value"})
+        assert cache.get("leaf1", "uid", "fingerprint1") is None
+        assert cache.get("leaf1", "uid", "fingerprint2") == {"key": "new_value"}
+        cache.close()
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test PersistentCache.clear()."""
+        cache = PersistentCache(tmp_path)
+        cache.set("leaf1", "uid", "fingerprint", "output")
+        cache.set("leaf2", "uid", "fingerprint", "output")
+        cache.clear("leaf1")
+        assert cache.get("leaf1", "uid", "fingerprint") is None
+        assert cache.get("leaf2", "uid", "fingerprint") == "output"
+        cache.clear()
+        assert cache.get("leaf2", "uid", "fingerprint") is None
+        cache.close()
+
+
+CATALOG = "anta.tests.software:\n  - VerifyEOSVersion:\n      versions: [4.31.1F]\n"
+
+
+class TestCatalogCache:
+    """Test for anta.cache.CatalogCache."""
+
+    @pytest.fixture
+    def tests(self) -> list[AntaTestDefinition]:
+        """Return the test definitions of CATALOG."""
+        return [AntaTestDefinition(test=VerifyEOSVersion, inputs={"versions": ["4.31.1F"]})]
+
+    def test__init__(self, tmp_path: Path) -> None:
+        """Test the CatalogCache constructor."""
+        cache = CatalogCache(tmp_path / "cache")
+        assert cache.directory == tmp_path / "cache" / CATALOG_CACHE_DIRNAME
+        assert cache.directory.is_dir()
+        assert repr(cache) == f"CatalogCache({tmp_path / 'cache'!r})"
+
+    def test_path(self, tmp_path: Path) -> None:
+        """Test CatalogCache.path()."""
+        cache = CatalogCache(tmp_path)
+        assert cache.path(CATALOG, "yaml").parent == cache.directory
+        assert cache.path(CATALOG, "yaml") == cache.path(CATALOG, "yaml")
+        assert cache.path(CATALOG, "yaml") != cache.path(CATALOG, "json")
+        assert cache.path(CATALOG, "yaml") != cache.path(CATALOG.replace("4.31.1F", "4.31.2F"), "yaml")
+
+    def test_load_store(self, tmp_path: Path, tests: list[AntaTestDefinition]) -> None:
+        """Test CatalogCache.load() and CatalogCache.store() across instances."""
+        assert CatalogCache(tmp_path).load(CATALOG, "yaml") is None
+        CatalogCache(tmp_path).store(CATALOG, "yaml", tests)
+        assert CatalogCache(tmp_path).load(CATALOG, "yaml") == tests
+        assert CatalogCache(tmp_path).load(CATALOG, "json") is None
+        assert list(CatalogCache(tmp_path).directory.iterdir()) == [CatalogCache(tmp_path).path(CATALOG, "yaml")]
+
+    def test_load_outdated(self, tmp_path: Path, tests: list[AntaTestDefinition], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that CatalogCache.load() does not return a catalog compiled with other versions."""
+        cache = CatalogCache(tmp_path)
+        cache.store(CATALOG, "yaml", tests)
+        with monkeypatch.context() as m:
+            m.setattr("anta.cache.CATALOG_CACHE_VERSION", 0)
+            assert cache.load(CATALOG, "yaml") is None
+        with monkeypatch.context() as m:
+            m.setattr("anta.cache.__version__", "v0.0.0")
+            assert cache.load(CATALOG, "yaml") is None
+        with monkeypatch.context() as m:
+            # The test module has been modified since the catalog has been compiled
+            m.setattr("anta.tests.software.__version__", "modified", raising=False)
+            assert cache.load(CATALOG, "yaml") is None
+        assert cache.load(CATALOG, "yaml") == tests
+
+    def test_load_invalid(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that CatalogCache.load() ignores a compiled catalog that cannot be loaded."""
+        caplog.set_level(logging.DEBUG)
+        cache = CatalogCache(tmp_path)
+        cache.path(CATALOG, "yaml").write_bytes(b"not a compiled catalog")
+        assert cache.load(CATALOG, "yaml") is None
+        assert "cannot be loaded" in caplog.text
+
+    def test_store_error(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that CatalogCache.store() logs test definitions that cannot be compiled."""
+
+        class LocalTest(AntaTest):
+            """ANTA test defined in a function."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+
+        cache = CatalogCache(tmp_path)
+        cache.store(CATALOG, "yaml", [AntaTestDefinition(test=LocalTest, inputs=None)])
+        assert "Catalog cannot be compiled" in caplog.text
+        assert list(cache.directory.iterdir()) == []
+
+
+class TestUnsupportedCommands:
+    """Test for anta.cache.UnsupportedCommands."""
+
+    @pytest.mark.parametrize(
+        ("errors", "expected"),
+        [
+            pytest.param(["Unavailable command (not supported on this hardware platform)"], True, id="unsupported"),
+            pytest.param(["Invalid input (at token 1: 'foo')"], False, id="other error"),
+            pytest.param([], False, id="no error"),
+        ],
+    )
+    def test_add(self, device: AntaDevice, errors: list[str], expected: bool) -> None:
+        """Test that UnsupportedCommands only memoizes commands that are not supported."""
+        memo = UnsupportedCommands()
+        cmd = AntaCommand(command="show hardware counter drop", errors=errors, output=None if errors else {})
+        memo.add(device, cmd)
+        assert (memo.get(device, cmd) == errors) is expected
+        assert len(memo) == int(expected)
+        memo.clear()
+        assert len(memo) == 0
+
+    def test_get(self, device: AntaDevice) -> None:
+        """Test that UnsupportedCommands lookups depend on the hardware model and EOS version."""
+        memo = UnsupportedCommands()
+        errors = ["Unavailable command (not supported on this hardware platform)"]
+        memo.add(device, AntaCommand(command="show hardware counter drop", errors=errors))
+        errors.clear()
+        cmd = AntaCommand(command="show hardware counter drop")
+        assert memo.get(device, cmd) == ["Unavailable command (not supported on this hardware platform)"]
+        assert memo.get(device, AntaCommand(command="show hardware counter drop", revision=1)) is None
+        device.eos_version = "4.31.1F"
+        assert memo.get(device, cmd) is None
+        device.hw_model = None
+        memo.add(device, AntaCommand(command="show hardware counter drop", errors=["Unavailable command (not supported on this hardware platform)"]))
+        assert memo.get(device, cmd) is None
+        assert len(memo) == 1
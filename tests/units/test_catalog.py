@@ -5,16 +5,28 @@
 
 from __future__ import annotations
 
+import logging
 from json import load as json_load
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from unittest.mock import patch
 
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 from yaml import safe_load
 
-from anta.catalog import AntaCatalog, AntaCatalogFile, AntaTestDefinition
-from anta.models import AntaTest
+from anta.catalog import (
+    AntaCatalog,
+    AntaCatalogFile,
+    AntaParametrizedTestDefinition,
+    AntaTestDefinition,
+    AntaUnresolvedTestDefinition,
+    merge_test_definitions,
+)
+from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.serialization import load_yaml
+from anta.tags import TagExpression
+from anta.tests.connectivity import VerifyLLDPNeighbors, VerifyReachability
 from anta.tests.interfaces import VerifyL3MTU
 from anta.tests.mlag import VerifyMlagStatus
 from anta.tests.software import VerifyEOSVersion
@@ -35,6 +47,32 @@ if TYPE_CHECKING:
 
 DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
 
+
+class FakeMergeableTest(AntaTest):
+    """ANTA test with a mergeable input limited to 2 items."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+    mergeable_inputs: ClassVar[tuple[str, ...]] = ("items",)
+
+    class Input(AntaTest.Input):
+        """Inputs for FakeMergeableTest."""
+
+        items: list[int] = Field(max_length=2)
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+
+
+def _reachability(*destinations: str, **inputs: Any) -> AntaTestDefinition:  # noqa: ANN401
+    """Return a VerifyReachability test definition pinging the destinations from Management0."""
+    return AntaTestDefinition(
+        test=VerifyReachability, inputs={"hosts": [{"source": "Management0", "destination": destination} for destination in destinations], **inputs}
+    )
+
+
 INIT_CATALOG_PARAMS: list[ParameterSet] = [
     pytest.param("test_catalog.yml", "yaml", [(VerifyEOSVersion, VerifyEOSVersion.Input(versions=["4.31.1F"]))], id="test_catalog_yaml"),
     pytest.param("test_catalog.json", "json", [(VerifyEOSVersion, VerifyEOSVersion.Input(versions=["4.31.1F"]))], id="test_catalog_json"),
@@ -153,6 +191,125 @@ class TestAntaCatalog:
                 inputs = test.Input(**inputs_data) if isinstance(inputs_data, dict) else inputs_data
                 assert inputs == catalog.tests[test_id].inputs
 
+    @pytest.mark.parametrize(("filename", "file_format", "tests"), INIT_CATALOG_PARAMS)
+    def test_parse_cache_dir(
+        self, tmp_path: Path, filename: str, file_format: Literal["yaml", "json"], tests: list[tuple[type[AntaTest], AntaTest.Input | dict[str, Any] | None]]
+    ) -> None:
+        """Instantiate AntaCatalog from a file compiled in a cache directory."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / filename, file_format=file_format, cache_dir=tmp_path)
+        # The compiled catalog is loaded without validating the file content again, empty catalogs are not compiled
+        with patch("anta.catalog.AntaCatalog.from_dict", wraps=AntaCatalog.from_dict) as from_dict:
+            compiled_catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / filename, file_format=file_format, cache_dir=tmp_path)
+        assert from_dict.called == (not tests)
+
+        assert compiled_catalog.filename == DATA_DIR / filename
+        assert len(compiled_catalog.tests) == len(tests)
+        assert compiled_catalog.tests == catalog.tests
+
+    @pytest.mark.parametrize(("filename", "file_format", "tests"), INIT_CATALOG_PARAMS)
+    def test_parse_trusted(
+        self, filename: str, file_format: Literal["yaml", "json"], tests: list[tuple[type[AntaTest], AntaTest.Input | dict[str, Any] | None]]
+    ) -> None:
+        """Instantiate a trusted AntaCatalog from a file."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / filename, file_format=file_format, trusted=True)
+
+        assert catalog.tests == AntaCatalog.parse(DATA_DIR / filename, file_format=file_format).tests
+        assert len(catalog.tests) == len(tests)
+        for test_id, (test, inputs_data) in enumerate(tests):
+            assert catalog.tests[test_id].test == test
+            if inputs_data is not None:
+                inputs = test.Input(**inputs_data) if isinstance(inputs_data, dict) else inputs_data
+                assert inputs == catalog.tests[test_id].inputs
+
+    @pytest.mark.parametrize(
+        ("filename", "error"),
+        [
+            pytest.param("test_catalog_with_undefined_tests.yml", "FakeTest is not defined in Python module anta.tests.software", id="undefined_tests"),
+            pytest.param("test_catalog_with_undefined_module.yml", "Module named anta.tests.undefined cannot be imported", id="undefined_module"),
+            pytest.param("test_catalog_wrong_type.yml", "Wrong input type for catalog data", id="wrong_type"),
+            pytest.param("test_catalog_not_a_list.yml", "It must be a list of ANTA tests", id="not_a_list"),
+            pytest.param("test_catalog_test_definition_not_a_dict.yml", "It must be a dictionary. Check the test catalog.", id="test_definition_not_a_dict"),
+            pytest.param("test_catalog_test_definition_multiple_dicts.yml", "It must be a dictionary with a single entry", id="test_definition_multiple_dicts"),
+        ],
+    )
+    def test_parse_trusted_fail(self, caplog: pytest.LogCaptureFixture, filename: str, error: str) -> None:
+        """Errors when instantiating a trusted AntaCatalog from an invalid file."""
+        with pytest.raises((TypeError, ValueError), match=error):
+            AntaCatalog.parse(DATA_DIR / filename, trusted=True)
+        if filename != "test_catalog_wrong_type.yml":
+            assert "Test catalog is invalid!" in caplog.text
+
+    def test_from_dict_trusted_identical_inputs(self) -> None:
+        """Test that identical inputs of a trusted AntaCatalog are validated once."""
+        data: dict[str, Any] = {"anta.tests.software": [{"VerifyEOSVersion": {"versions": ["4.31.1F"]}}, {"VerifyEOSVersion": {"versions": ["4.31.1F"]}}]}
+        with patch.object(VerifyEOSVersion.Input, "model_validate", wraps=VerifyEOSVersion.Input.model_validate) as validate_mock:
+            catalog = AntaCatalog.from_dict(data, trusted=True)
+        validate_mock.assert_called_once()
+        assert catalog.tests[0].inputs is catalog.tests[1].inputs
+
+    def test_from_dict_trusted_invalid_inputs(self) -> None:
+        """Test that inputs are validated when instantiating a trusted AntaCatalog."""
+        with pytest.raises(ValidationError):
+            AntaCatalog.from_dict({"anta.tests.software": [{"VerifyEOSVersion": {"versions": 42}}]}, trusted=True)
+
+    @pytest.mark.parametrize(("filename", "file_format", "tests"), INIT_CATALOG_PARAMS)
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_check(
+        self,
+        filename: str,
+        file_format: Literal["yaml", "json"],
+        tests: list[tuple[type[AntaTest], AntaTest.Input | dict[str, Any] | None]],
+        workers: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Check a valid catalog file."""
+        monkeypatch.setattr("anta.catalog.CATALOG_CHECK_CHUNK_SIZE", 1)
+        assert AntaCatalog.check(DATA_DIR / filename, file_format=file_format, workers=workers) == len(tests)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_check_fail(self, tmp_path: Path, workers: int, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+        """Check that all the errors of an invalid catalog file are reported with their location."""
+        monkeypatch.setattr("anta.catalog.CATALOG_CHECK_CHUNK_SIZE", 2)
+        file = tmp_path / "catalog.yml"
+        file.write_text(
+            "anta.tests:\n"
+            "  software:\n"
+            "    - VerifyEOSVersion:\n"
+            "        versions: [4.31.1F]\n"
+            "    - VerifyEOSVersion:\n"
+            "        versions: 42\n"
+            "    - FakeTest:\n"
+            "    - VerifyEOSVersion:\n"
+            "      VerifyTerminAttrVersion:\n"
+            "  system:\n"
+            "    - VerifyUptime:\n"
+            "        minimum: -1\n",
+            encoding="UTF-8",
+        )
+        with pytest.raises(ValidationError) as exec_info:
+            AntaCatalog.check(file, workers=workers)
+        assert [(error["loc"], error["type"]) for error in exec_info.value.errors()] == [
+            (("anta.tests.software", 1, "VerifyEOSVersion", "versions"), "list_type"),
+            (("anta.tests.software", 2, "FakeTest"), "value_error"),
+            (("anta.tests.software", 3), "value_error"),
+            (("anta.tests.system", 0, "VerifyUptime", "minimum"), "greater_than_equal"),
+        ]
+        assert "FakeTest is not defined in Python module anta.tests.software" in exec_info.value.errors()[1]["msg"]
+        assert "Test catalog is invalid!" in caplog.text
+
+    @pytest.mark.parametrize(("filename", "file_format", "error"), CATALOG_PARSE_FAIL_PARAMS)
+    def test_check_fail_parsing(self, filename: str, file_format: Literal["yaml", "json"], error: str) -> None:
+        """Errors when checking a catalog file that cannot be parsed."""
+        if filename in {"test_catalog_not_a_list.yml", "test_catalog_test_definition_not_a_dict.yml", "test_catalog_test_definition_multiple_dicts.yml"}:
+            pytest.skip("Test definitions errors are reported by location")
+        with pytest.raises((ValidationError, TypeError, ValueError, OSError)) as exec_info:
+            AntaCatalog.check(DATA_DIR / filename, file_format=file_format)
+        if isinstance(exec_info.value, ValidationError):
+            assert error in exec_info.value.errors()[0]["msg"]
+        else:
+            # Import errors are raised before checking the test definitions, not by pydantic
+            assert error.removeprefix("Value error, ") in str(exec_info)
+
     @pytest.mark.parametrize(("filename", "file_format", "tests"), INIT_CATALOG_PARAMS)
     def test_from_list(
         self, filename: str, file_format: Literal["yaml", "json"], tests: list[tuple[type[AntaTest], AntaTest.Input | dict[str, Any] | None]]
@@ -291,16 +448,173 @@ class TestAntaCatalog:
         tests = catalog.get_tests_by_tags(tags={"leaf", "spine"}, strict=True)
         assert len(tests) == 1
 
+    def test_get_test_plan(self) -> None:
+        """Test AntaCatalog.get_test_plan()."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        with pytest.raises(ValueError, match="Indexes have not been built yet"):
+            catalog.get_test_plan({"leaf"})
+        catalog.build_indexes()
+        plan = catalog.get_test_plan({"leaf", "leaf1"}, selected_tags={"leaf"})
+        assert set(plan) == catalog.get_tests_by_tags({"leaf"})
+        # Tests are in the catalog order
+        assert list(plan) == [test for test in catalog.tests if test in plan]
+        # Plans are shared by devices matching the same tags of the catalog
+        assert catalog.get_test_plan({"leaf", "leaf2"}, selected_tags={"leaf", "spine"}) is plan
+        plan = catalog.get_test_plan({"leaf", "spine"})
+        assert set(plan) == catalog.get_tests_by_tags({"leaf", "spine"}) | catalog.tag_to_tests[None]
+        assert len(plan) == len(set(plan))
+        assert catalog.get_test_plan({"unknown"}, selected_tags={"unknown"}) == ()
+        assert set(catalog.get_test_plan({"unknown"})) == catalog.tag_to_tests[None]
+
+    @pytest.mark.parametrize(
+        ("device_tags", "selected_tags", "expected"),
+        [
+            pytest.param({"spine"}, None, [0, 1, 3], id="spine"),
+            pytest.param({"spine", "lab"}, None, [0, 3], id="spine-lab"),
+            pytest.param({"leaf", "dc1"}, None, [0, 1, 2], id="leaf-dc1"),
+            pytest.param({"border"}, None, [0, 3], id="border"),
+            pytest.param({"leaf", "dc1"}, {"dc1"}, [2], id="selected-dc1"),
+            pytest.param({"leaf", "dc1"}, {"lab"}, [], id="selected-negated-tag"),
+            pytest.param({"spine"}, {"spine"}, [1, 3], id="selected-spine"),
+        ],
+    )
+    def test_get_test_plan_tag_expressions(self, device_tags: set[str], selected_tags: set[str] | None, expected: list[int]) -> None:
+        """Test AntaCatalog.get_test_plan() with tests filtered by tag expressions."""
+        catalog = AntaCatalog.from_list(
+            [
+                (VerifyUptime, VerifyUptime.Input(minimum=1)),
+                (VerifyUptime, VerifyUptime.Input(minimum=2, filters=VerifyUptime.Input.Filters(tags=TagExpression("(spine or leaf) and not lab")))),
+                (VerifyUptime, VerifyUptime.Input(minimum=3, filters=VerifyUptime.Input.Filters(tags=TagExpression("leaf and dc1")))),
+                (VerifyUptime, VerifyUptime.Input(minimum=4, filters=VerifyUptime.Input.Filters(tags=TagExpression("spine or border")))),
+            ]
+        )
+        catalog.build_indexes()
+        plan = catalog.get_test_plan(device_tags, selected_tags=selected_tags)
+        assert [catalog.tests.index(test) for test in plan if isinstance(test, AntaTestDefinition)] == expected
+        assert len(plan) == len(expected)
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            pytest.param("leaf and spine", 1, id="and"),
+            pytest.param("leaf", 3, id="tag"),
+            pytest.param("leaf and not spine", 2, id="not"),
+            pytest.param("not leaf", 2, id="not-only"),
+            pytest.param("unknown", 0, id="unknown"),
+        ],
+    )
+    def test_get_tests_by_tags_expression(self, expression: str, expected: int) -> None:
+        """Test AntaCatalog.get_tests_by_tags() with a tag expression."""
+        catalog: AntaCatalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        catalog.build_indexes()
+        tests = catalog.get_tests_by_tags(TagExpression(expression))
+        assert len(tests) == expected
+        for test in tests:
+            assert test.inputs.filters is not None
+            assert isinstance(test.inputs.filters.tags, set)
+            assert TagExpression(expression).match(test.inputs.filters.tags)
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_parse_parametrized(self, tmp_path: Path, *, trusted: bool) -> None:
+        """Instantiate AntaCatalog from a file with parametrized tests."""
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_parametrized.yml", cache_dir=tmp_path, trusted=trusted)
+        assert len(catalog.tests) == 2
+        assert catalog.parametrized_tests == [
+            AntaParametrizedTestDefinition(test=VerifyLLDPNeighbors, inputs_from="lldp_neighbors", inputs={"filters": {"tags": ["leaf"]}})
+        ]
+        assert catalog.parametrized_tests[0].filters == AntaTest.Input.Filters(tags={"leaf"})
+        # Catalogs with parametrized tests are not compiled
+        assert not any(tmp_path.rglob("*.pickle"))
+        # The parametrized tests are dumped like in the catalog file
+        dumped_catalog = AntaCatalog.from_dict(load_yaml(catalog.dump().yaml()))
+        assert dumped_catalog.tests == catalog.tests
+        assert dumped_catalog.parametrized_tests == catalog.parametrized_tests
+        assert '"inputs_from": "lldp_neighbors"' in catalog.dump().to_json()
+
+    @pytest.mark.parametrize(
+        ("inputs", "error"),
+        [
+            pytest.param({"inputs_from": "lldp", "neighbor": []}, "VerifyLLDPNeighbors has no input named neighbor", id="unknown-input"),
+            pytest.param({"inputs_from": "lldp", "filters": {"tags": 42}}, "Input should be a valid set", id="invalid-filters"),
+            pytest.param({"inputs_from": 42}, "Input should be a valid string", id="invalid-variable"),
+        ],
+    )
+    def test_parametrized_fail(self, inputs: dict[str, Any], error: str) -> None:
+        """Errors when instantiating an AntaCatalog with invalid parametrized tests."""
+        data = {"anta.tests.connectivity": [{"VerifyLLDPNeighbors": inputs}]}
+        with pytest.raises(ValidationError, match=error):
+            AntaCatalog.from_dict(data)  # type: ignore[arg-type]
+        with pytest.raises(ValidationError, match=error):
+            AntaCatalog.from_dict(data, trusted=True)  # type: ignore[arg-type]
+
+    def test_check_parametrized(self, tmp_path: Path) -> None:
+        """Check a catalog file with parametrized tests."""
+        assert AntaCatalog.check(DATA_DIR / "test_catalog_parametrized.yml", workers=1) == 3
+        file = tmp_path / "catalog.yml"
+        file.write_text("anta.tests.connectivity:\n  - VerifyLLDPNeighbors:\n      inputs_from: lldp\n      neighbor: []\n", encoding="UTF-8")
+        with pytest.raises(ValidationError) as exec_info:
+            AntaCatalog.check(file, workers=1)
+        assert exec_info.value.errors()[0]["loc"] == ("anta.tests.connectivity", 0, "VerifyLLDPNeighbors")
+
+    def test_get_test_plan_parametrized(self) -> None:
+        """Test AntaCatalog.get_test_plan() with parametrized tests."""
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_parametrized.yml")
+        catalog.build_indexes()
+        neighbors = [{"port": "Ethernet1", "neighbor_device": "spine1", "neighbor_port": "Ethernet1"}]
+
+        leaf1_plan = catalog.get_test_plan({"leaf", "leaf1"}, variables={"lldp_neighbors": {"neighbors": neighbors}})
+        assert leaf1_plan[:-1] == (catalog.tests[0],)
+        assert leaf1_plan[-1] == AntaTestDefinition(test=VerifyLLDPNeighbors, inputs={"filters": {"tags": ["leaf"]}, "neighbors": neighbors})
+        # Devices with the same inputs share the same test definition
+        leaf2_plan = catalog.get_test_plan({"leaf", "leaf2"}, variables={"lldp_neighbors": {"neighbors": [neighbor.copy() for neighbor in neighbors]}})
+        assert leaf2_plan[-1] is leaf1_plan[-1]
+        leaf3_plan = catalog.get_test_plan({"leaf", "leaf3"}, variables={"lldp_neighbors": {"neighbors": [{**neighbors[0], "neighbor_port": "Ethernet3"}]}})
+        assert leaf3_plan[-1] != leaf1_plan[-1]
+        leaf3_test = leaf3_plan[-1]
+        assert isinstance(leaf3_test, AntaTestDefinition)
+        assert leaf3_test.inputs.neighbors[0].neighbor_port == "Ethernet3"  # type: ignore[attr-defined]
+        # Parametrized tests are not part of the plan of the devices not matching their tags
+        assert catalog.get_test_plan({"spine"}) == tuple(catalog.tests)
+        # Parametrized tests are not returned by get_tests_by_tags()
+        assert catalog.get_tests_by_tags({"leaf"}) == set()
+        assert catalog.get_tests_by_tags(TagExpression("leaf or spine")) == {catalog.tests[1]}
+
+    @pytest.mark.parametrize(
+        ("variables", "error"),
+        [
+            pytest.param(None, "variable 'lldp_neighbors' is not defined", id="missing"),
+            pytest.param({"lldp_neighbors": ["Ethernet1"]}, "variable 'lldp_neighbors' must be a dictionary, got list", id="not-a-dict"),
+            pytest.param({"lldp_neighbors": {"neighbors": [], "filters": None}}, "variable 'lldp_neighbors' cannot define the filters", id="filters"),
+            pytest.param({"lldp_neighbors": {"neighbors": 42}}, "VerifyLLDPNeighbors test inputs are not valid", id="invalid-inputs"),
+        ],
+    )
+    def test_get_test_plan_parametrized_fail(self, variables: dict[str, Any] | None, error: str) -> None:
+        """Errors when resolving parametrized tests with invalid device variables."""
+        catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_parametrized.yml")
+        catalog.build_indexes()
+        plan = catalog.get_test_plan({"leaf"}, variables=variables)
+        # The other tests of the device are kept
+        assert plan[:-1] == (catalog.tests[0],)
+        unresolved_test = plan[-1]
+        assert isinstance(unresolved_test, AntaUnresolvedTestDefinition)
+        assert unresolved_test.test is VerifyLLDPNeighbors
+        assert error in unresolved_test.error
+        # Unresolved tests are memoized like resolved tests
+        assert catalog.get_test_plan({"leaf"}, variables=variables)[-1] is unresolved_test
+        assert catalog.get_test_plan({"leaf"}, variables=variables, merge_tests=True)[-1] == unresolved_test
+
     def test_merge_catalogs(self) -> None:
         """Test the merge_catalogs function."""
         # Load catalogs of different sizes
         small_catalog = AntaCatalog.parse(DATA_DIR / "test_catalog.yml")
         medium_catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_medium.yml")
         tagged_catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_with_tags.yml")
+        parametrized_catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_parametrized.yml")
 
         # Merge the catalogs and check the number of tests
-        final_catalog = AntaCatalog.merge_catalogs([small_catalog, medium_catalog, tagged_catalog])
-        assert len(final_catalog.tests) == len(small_catalog.tests) + len(medium_catalog.tests) + len(tagged_catalog.tests)
+        final_catalog = AntaCatalog.merge_catalogs([small_catalog, medium_catalog, tagged_catalog, parametrized_catalog])
+        assert len(final_catalog.tests) == len(small_catalog.tests) + len(medium_catalog.tests) + len(tagged_catalog.tests) + len(parametrized_catalog.tests)
+        assert final_catalog.parametrized_tests == parametrized_catalog.parametrized_tests
 
     def test_merge(self) -> None:
         """Test AntaCatalog.merge()."""
@@ -336,6 +650,82 @@ class TestAntaCatalog:
         assert sum(len(tests) for tests in file.root.values()) == 228
 
 
+class TestMergeTestDefinitions:
+    """Test for anta.catalog.merge_test_definitions."""
+
+    def test_merge(self) -> None:
+        """Compatible definitions are merged at the position of the first one, without duplicated items."""
+        uptime = AntaTestDefinition(test=VerifyUptime, inputs={"minimum": 10})
+        tests = [
+            _reachability("1.1.1.1"),
+            uptime,
+            _reachability("8.8.8.8", "1.1.1.1"),
+            _reachability("9.9.9.9", report_latency=True),
+            uptime,
+        ]
+        merged = merge_test_definitions(tests)
+        assert merged == [_reachability("1.1.1.1", "8.8.8.8"), uptime, tests[3], uptime]
+        # Single definitions are kept as is
+        assert merged[2] is tests[3]
+        assert merge_test_definitions([]) == []
+
+    def test_merge_filters(self) -> None:
+        """Definitions with different filters are only merged with ignore_filters."""
+        tests = [_reachability("1.1.1.1", filters={"tags": ["leaf"]}), _reachability("8.8.8.8", filters={"tags": ["spine"]})]
+        assert merge_test_definitions(tests) == tests
+        assert merge_test_definitions(tests, ignore_filters=True) == [_reachability("1.1.1.1", "8.8.8.8", filters={"tags": ["leaf"]})]
+
+    def test_merge_invalid(self) -> None:
+        """Definitions whose merged inputs are not valid are not merged."""
+        tests = [AntaTestDefinition(test=FakeMergeableTest, inputs={"items": [1, 2]}), AntaTestDefinition(test=FakeMergeableTest, inputs={"items": [3]})]
+        assert merge_test_definitions(tests) == tests
+        tests.append(AntaTestDefinition(test=FakeMergeableTest, inputs={"items": [2]}))
+        assert merge_test_definitions(tests[::2]) == [tests[0]]
+
+    def test_merge_catalogs(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaCatalog.merge_catalogs() with merge_tests."""
+        caplog.set_level(logging.INFO)
+        catalogs = [AntaCatalog(tests=[_reachability("1.1.1.1")]), AntaCatalog(tests=[_reachability("8.8.8.8"), _reachability("8.8.8.8")])]
+        assert len(AntaCatalog.merge_catalogs(catalogs).tests) == 3
+        assert AntaCatalog.merge_catalogs(catalogs, merge_tests=True).tests == [_reachability("1.1.1.1", "8.8.8.8")]
+        assert "Merged compatible test definitions: 3 test definitions reduced to 1" in caplog.messages
+
+    def test_get_test_plan(self) -> None:
+        """Test AntaCatalog.get_test_plan() with merge_tests."""
+        catalog = AntaCatalog(
+            tests=[
+                _reachability("1.1.1.1", filters={"tags": ["leaf"]}),
+                _reachability("8.8.8.8", filters={"tags": ["spine"]}),
+                _reachability("9.9.9.9"),
+            ]
+        )
+        catalog.build_indexes()
+        assert len(catalog.get_test_plan({"leaf"})) == 2
+        with pytest.raises(ValueError, match="The merged test plan has not been computed yet"):
+            catalog.get_unmerged_test_count({"leaf"})
+        plan = catalog.get_test_plan({"leaf"}, merge_tests=True)
+        assert plan == (_reachability("1.1.1.1", "9.9.9.9", filters={"tags": ["leaf"]}),)
+        assert catalog.get_unmerged_test_count({"leaf"}) == 2
+        # Merged plans are memoized separately
+        assert catalog.get_test_plan({"leaf"}, merge_tests=True) is plan
+        assert len(catalog.get_test_plan({"leaf"})) == 2
+        assert catalog.get_test_plan({"leaf", "spine"}, merge_tests=True)[0] == _reachability("1.1.1.1", "8.8.8.8", "9.9.9.9", filters={"tags": ["leaf"]})
+
+    def test_get_test_plan_parametrized(self) -> None:
+        """Test AntaCatalog.get_test_plan() with merge_tests and parametrized tests."""
+        neighbors = [{"port": "Ethernet1", "neighbor_device": "spine1", "neighbor_port": "Ethernet1"}]
+        catalog = AntaCatalog(
+            tests=[AntaTestDefinition(test=VerifyLLDPNeighbors, inputs={"neighbors": [{**neighbors[0], "port": "Ethernet2"}]})],
+            parametrized_tests=[AntaParametrizedTestDefinition(test=VerifyLLDPNeighbors, inputs_from="lldp")],
+        )
+        catalog.build_indexes()
+        plan = catalog.get_test_plan(set(), variables={"lldp": {"neighbors": neighbors}}, merge_tests=True)
+        assert len(plan) == 1
+        assert catalog.get_unmerged_test_count(set()) == 2
+        assert isinstance(plan[0], AntaTestDefinition)
+        assert [neighbor.port for neighbor in plan[0].inputs.neighbors] == ["Ethernet2", "Ethernet1"]  # type: ignore[attr-defined]
+
+
 class TestAntaCatalogFile:  # pylint: disable=too-few-public-methods
     """Test for anta.catalog.AntaCatalogFile."""
 
@@ -75,3 +75,13 @@ async def test_skip_on_platforms(device: AntaDevice, platforms: list[str], devic
     await test_instance.test()
 
     assert test_instance.result.result == expected_result
+
+
+def test_skip_on_platforms_metadata() -> None:
+    """Test that stacked skip_on_platforms decorators expose all the platforms."""
+
+    async def function() -> None:
+        pass
+
+    decorated = skip_on_platforms(["vEOS"])(skip_on_platforms(["cEOSLab"])(function))
+    assert decorated.skipped_platforms == {"vEOS", "cEOSLab"}  # type: ignore[attr-defined]
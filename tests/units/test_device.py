@@ -6,17 +6,20 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import pytest
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError
+from httpx import ConnectError, HTTPError, TimeoutException
 from rich import print as rprint
 
+from anta.cache import PERSISTENT_CACHE_FINGERPRINT_COMMAND, PersistentCache, UnsupportedCommands
 from anta.device import AntaDevice, AsyncEOSDevice
 from anta.models import AntaCommand
+from anta.parsers import PARSERS
 from asynceapi import EapiCommandError
 from tests.units.conftest import COMMAND_OUTPUT
 
@@ -519,6 +522,237 @@ class TestAntaDevice:
             assert device.cache is None
             device._collect.assert_called_once_with(command=cmd, collection_id=None)  # type: ignore[attr-defined]
 
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    async def test_collect_cache_consumers(self, device: AntaDevice) -> None:
+        """Test that AntaDevice.collect evicts the cached output once all registered consumers have collected it."""
+        assert device.cache is not None
+        assert device.cache_consumers is not None
+        cmds = [AntaCommand(command="show version") for _ in range(2)]
+        device.register_cache_consumers([*cmds, AntaCommand(command="show version", use_cache=False)])
+        assert device.cache_consumers[cmds[0].uid] == 2
+
+        await device.collect(cmds[0])
+        assert device.cache_consumers[cmds[0].uid] == 1
+        assert await device.cache.get(cmds[0].uid) == COMMAND_OUTPUT
+
+        await device.collect(cmds[1])
+        assert cmds[1].output == COMMAND_OUTPUT
+        assert cmds[1].uid not in device.cache_consumers
+        assert await device.cache.get(cmds[1].uid) is None
+        device._collect.assert_called_once()  # type: ignore[attr-defined]
+
+        # Commands without registered consumers rely on the cache TTL
+        cmd = AntaCommand(command="show hostname")
+        await device.collect(cmd)
+        assert await device.cache.get(cmd.uid) == COMMAND_OUTPUT
+
+        device.register_cache_consumers([cmd])
+        device.clear_cache_consumers()
+        assert not device.cache_consumers
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    async def test_collect_cache_consumers_released(self, device: AntaDevice) -> None:
+        """Test that the registered cache consumers are released when their command is not collected."""
+        assert device.cache_consumers is not None
+        cmds = [AntaCommand(command="show version") for _ in range(4)]
+        device.register_cache_consumers(cmds)
+
+        # The collection raises
+        with patch.object(device, "_collect", side_effect=RuntimeError), pytest.raises(RuntimeError):
+            await device.collect(cmds[0])
+        assert device.cache_consumers[cmds[0].uid] == 3
+
+        # The command is known to be unsupported
+        device.unsupported_commands = UnsupportedCommands()
+        device.unsupported_commands.add(device, AntaCommand(command="show version", errors=["Unavailable command (not supported on this hardware platform)"]))
+        await device.collect(cmds[1])
+        assert not cmds[1].supported
+        assert device.cache_consumers[cmds[0].uid] == 2
+
+        # The test does not collect its commands
+        await device.release_cache_consumers([*cmds[2:], AntaCommand(command="show version", use_cache=False)])
+        assert cmds[0].uid not in device.cache_consumers
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    async def test_parse(self, device: AntaDevice, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that AntaDevice.parse memoizes the parsed outputs for the registered cache consumers."""
+        calls = 0
+
+        def _parse(output: dict[str, Any]) -> list[str]:
+            nonlocal calls
+            calls += 1
+            return sorted(output)
+
+        monkeypatch.setitem(PARSERS, "keys", _parse)
+        # The third consumer does not use the parser
+        cmds = [AntaCommand(command="show version") for _ in range(3)]
+        device.register_cache_consumers(cmds)
+        for cmd in cmds:
+            await device.collect(cmd)
+        # The parsed output is kept after all the consumers have collected the command
+        assert cmds[0].uid not in device.cache_consumers  # type: ignore[operator]
+        for cmd in cmds[:2]:
+            assert device.parse(cmd, "keys") == sorted(COMMAND_OUTPUT)
+            device.release_parse_consumers([cmd])
+        assert calls == 1
+        assert cmds[0].uid in device.parsed_outputs
+
+        # The parsed output is released once all the consumers have finished, whether they have used the parser or not
+        device.release_parse_consumers([cmds[2], AntaCommand(command="show version", use_cache=False)])
+        assert not device.parsed_outputs
+        assert not device.parse_consumers
+
+        # Outputs of unregistered or uncached commands are parsed every time
+        for cmd in (AntaCommand(command="show hostname"), AntaCommand(command="show version", use_cache=False)):
+            cmd.output = COMMAND_OUTPUT
+            device.parse(cmd, "keys")
+            device.parse(cmd, "keys")
+        assert calls == 5
+
+        with pytest.raises(ValueError, match="There is no parser named 'unknown'"):
+            device.parse(cmds[0], "unknown")
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    async def test_collect_cache_locks(self, device: AntaDevice) -> None:
+        """Test that concurrent collections of the same command are sent once and that the cache locks are discarded after use."""
+
+        async def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            await asyncio.sleep(0)
+            command.output = COMMAND_OUTPUT
+
+        assert device.cache_locks is not None
+        cmds = [AntaCommand(command="show version") for _ in range(3)]
+        with patch.object(device, "_collect", side_effect=_collect) as collect_mock:
+            await asyncio.gather(*(device.collect(cmd) for cmd in cmds))
+        collect_mock.assert_awaited_once()
+        assert all(cmd.output == COMMAND_OUTPUT for cmd in cmds)
+        assert len(device.cache_locks) == 0
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": True}], indirect=True)
+    async def test_collect_coalesced(self, device: AntaDevice) -> None:
+        """Test that concurrent collections of the same command are coalesced when the device cache is disabled."""
+
+        async def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            await asyncio.sleep(0)
+            command.output = COMMAND_OUTPUT
+            command.errors = ["error"]
+
+        cmds = [AntaCommand(command="show version") for _ in range(3)]
+        with patch.object(device, "_collect", side_effect=_collect) as collect_mock:
+            await asyncio.gather(*(device.collect(cmd) for cmd in cmds))
+            collect_mock.assert_awaited_once()
+            assert all(cmd.output == COMMAND_OUTPUT and cmd.errors == ["error"] for cmd in cmds)
+            assert cmds[1].errors is not cmds[0].errors
+
+            # Commands that must not use the cache are never coalesced
+            cmds = [AntaCommand(command="show version", use_cache=False) for _ in range(2)]
+            await asyncio.gather(*(device.collect(cmd) for cmd in cmds))
+            assert collect_mock.await_count == 3
+
+            # Once completed, the command is collected again
+            await device.collect(AntaCommand(command="show version"))
+            assert collect_mock.await_count == 4
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": True}], indirect=True)
+    async def test_collect_coalesced_exception(self, device: AntaDevice) -> None:
+        """Test that coalesced commands are collected again if the in-flight collection raises an exception."""
+        calls = 0
+
+        async def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            if calls == 1:
+                msg = "Unexpected failure"
+                raise RuntimeError(msg)
+            command.output = COMMAND_OUTPUT
+
+        cmds = [AntaCommand(command="show version") for _ in range(2)]
+        with patch.object(device, "_collect", side_effect=_collect):
+            results = await asyncio.gather(*(device.collect(cmd) for cmd in cmds), return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+        assert cmds[1].output == COMMAND_OUTPUT
+        assert calls == 2
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": True}], indirect=True)
+    def test_register_cache_consumers_without_cache(self, device: AntaDevice) -> None:
+        """Test that registering cache consumers is a no-op when the device cache is disabled."""
+        device.register_cache_consumers([AntaCommand(command="show version")])
+        device.clear_cache_consumers()
+        assert device.cache_consumers is None
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    async def test_collect_persistent_cache(self, device: AntaDevice, tmp_path: Path) -> None:
+        """Test that AntaDevice.collect uses the persistent cache for configuration-derived commands."""
+        device.persistent_cache = PersistentCache(tmp_path)
+        cmd = AntaCommand(command="show hostname", ofmt="text")
+
+        # No fingerprint, the persistent cache is not used
+        await device.collect(cmd)
+        assert device.persistent_cache.get(device.name, cmd.uid, "fingerprint") is None
+
+        device.fingerprint = "fingerprint"
+        device.persistent_cache.set(device.name, cmd.uid, device.fingerprint, "persisted")
+        cmd = AntaCommand(command="show hostname", ofmt="text", use_cache=True)
+        assert device.cache is not None
+        await device.cache.clear()
+        await device.collect(cmd)
+        assert cmd.output == "persisted"
+        device._collect.assert_called_once()  # type: ignore[attr-defined]
+
+        # The output is stored with the new fingerprint
+        device.fingerprint = "new_fingerprint"
+        await device.cache.clear()
+        cmd = AntaCommand(command="show hostname", ofmt="text")
+        await device.collect(cmd)
+        assert cmd.output == COMMAND_OUTPUT
+        assert device.persistent_cache.get(device.name, cmd.uid, "new_fingerprint") == COMMAND_OUTPUT
+
+        # Operational commands are never stored
+        cmd = AntaCommand(command="show interfaces counters")
+        await device.collect(cmd)
+        assert device.persistent_cache.get(device.name, cmd.uid, "new_fingerprint") is None
+        device.persistent_cache.close()
+
+    async def test_collect_unsupported_commands(self, device: AntaDevice) -> None:
+        """Test that AntaDevice.collect does not send commands known to be unsupported on the device platform."""
+        error = "Unavailable command (not supported on this hardware platform)"
+
+        def _collect(command: AntaCommand, **_kwargs: Any) -> None:  # noqa: ANN401
+            command.errors = [error]
+
+        device.unsupported_commands = UnsupportedCommands()
+        device.eos_version = "4.31.1F"
+        with patch.object(device, "_collect", side_effect=_collect) as collect_mock:
+            await device.collect(AntaCommand(command="show hardware counter drop"))
+            cmd = AntaCommand(command="show hardware counter drop")
+            await device.collect(cmd)
+            collect_mock.assert_called_once()
+            assert cmd.errors == [error]
+            assert not cmd.supported
+
+            # The memo is specific to the EOS version
+            device.eos_version = "4.32.1F"
+            await device.collect(AntaCommand(command="show hardware counter drop"))
+            assert collect_mock.call_count == 2
+        assert len(device.unsupported_commands) == 2
+
+    async def test_collect_batch(self, device: AntaDevice) -> None:
+        """Test that AntaDevice.collect_batch collects the commands in a single batch, except the ones known to be unsupported."""
+        error = "Unavailable command (not supported on this hardware platform)"
+        device.unsupported_commands = UnsupportedCommands()
+        device.eos_version = "4.31.1F"
+        device.unsupported_commands.add(device, AntaCommand(command="ping 10.0.0.0", errors=[error]))
+        cmds = [AntaCommand(command=f"ping 10.0.0.{i}", use_cache=False) for i in range(3)]
+        with patch.object(device, "_collect_batch", wraps=device._collect_batch) as batch_mock:
+            await device.collect_batch(cmds, collection_id="pytest")
+        batch_mock.assert_called_once_with(cmds[1:], collection_id="pytest")
+        assert cmds[0].errors == [error]
+        assert all(cmd.output == COMMAND_OUTPUT for cmd in cmds[1:])
+
+        with pytest.raises(ValueError, match="Commands using the cache cannot be collected in a batch: show version"):
+            await device.collect_batch([AntaCommand(command="show version")])
+
     @pytest.mark.parametrize(("device", "expected"), CACHE_STATS_PARAMS, indirect=["device"])
     def test_cache_statistics(self, device: AntaDevice, expected: dict[str, Any] | None) -> None:
         """Verify that when cache statistics attribute does not exist.
@@ -548,6 +782,15 @@ class TestAsyncEOSDevice:
         with patch("anta.device.__DEBUG__", new=True):
             rprint(dev)
 
+    def test__init__persistent_cache(self, tmp_path: Path) -> None:
+        """Test that the persistent cache is ignored when caching is disabled."""
+        persistent_cache = PersistentCache(tmp_path)
+        dev = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", persistent_cache=persistent_cache)
+        assert dev.persistent_cache is persistent_cache
+        dev = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", persistent_cache=persistent_cache, disable_cache=True)
+        assert dev.persistent_cache is None
+        persistent_cache.close()
+
     @pytest.mark.parametrize(("device1", "device2", "expected"), EQUALITY_PARAMS)
     def test__eq(self, device1: dict[str, Any], device2: dict[str, Any], expected: bool) -> None:
         """Test the AsyncEOSDevice equality."""
@@ -574,6 +817,52 @@ class TestAsyncEOSDevice:
             assert async_device.established == expected["established"]
             assert async_device.hw_model == expected["hw_model"]
 
+    @pytest.mark.parametrize(
+        ("config", "expected_fingerprint"),
+        [
+            pytest.param(["hostname leaf1"], hashlib.sha256(b"DCS-7280CR3-32P4-F\n4.31.1F\nhostname leaf1").hexdigest(), id="fingerprint"),
+            pytest.param(HTTPError("404"), None, id="no fingerprint"),
+        ],
+    )
+    async def test_refresh_fingerprint(self, async_device: AsyncEOSDevice, tmp_path: Path, config: list[str] | HTTPError, expected_fingerprint: str | None) -> None:
+        """Test that AsyncEOSDevice.refresh() computes the device fingerprint when a persistent cache is used."""
+        async_device.persistent_cache = PersistentCache(tmp_path)
+        show_version = [{"modelName": "DCS-7280CR3-32P4-F", "version": "4.31.1F"}]
+        with (
+            patch.object(async_device._session, "check_connection", return_value=True),
+            patch.object(async_device._session, "cli", side_effect=[show_version, config]) as cli_mock,
+        ):
+            await async_device.refresh()
+        assert async_device.established is True
+        assert async_device.fingerprint == expected_fingerprint
+        # The fingerprint is computed from the configuration sections of the cached commands, which is not cached
+        assert cli_mock.call_args_list[1].kwargs["commands"] == [{"cmd": PERSISTENT_CACHE_FINGERPRINT_COMMAND}]
+        assert async_device.cache is not None
+        assert not await async_device.cache.exists(AntaCommand(command=PERSISTENT_CACHE_FINGERPRINT_COMMAND, ofmt="text").uid)
+        async_device.persistent_cache.close()
+
+    @pytest.mark.parametrize(("async_device"), [{"enable": True}], indirect=True)
+    async def test__collect_batch(self, async_device: AsyncEOSDevice) -> None:
+        """Test AsyncEOSDevice._collect_batch()."""
+        cmds = [AntaCommand(command=f"ping 10.0.0.{i}", use_cache=False) for i in range(3)]
+        text_cmd = AntaCommand(command="show hostname", ofmt="text", use_cache=False)
+        error = EapiCommandError(passed=["enable", "output0"], failed=cmds[1].command, errors=["error"], errmsg="error", not_exec=[{"cmd": cmds[2].command}])
+        with patch.object(async_device._session, "cli", side_effect=[error, ["enable", "output2"], ["enable", "hostname"]]) as cli_mock:
+            await async_device._collect_batch([*cmds, text_cmd], collection_id="pytest")
+        assert cli_mock.call_count == 3
+        assert cli_mock.call_args_list[0].kwargs["commands"] == [{"cmd": "enable"}, *({"cmd": cmd.command} for cmd in cmds)]
+        assert cli_mock.call_args_list[1].kwargs["commands"] == [{"cmd": "enable"}, {"cmd": cmds[2].command}]
+        assert cli_mock.call_args_list[2].kwargs["ofmt"] == "text"
+        assert [cmd.output for cmd in [*cmds, text_cmd]] == ["output0", None, "output2", "hostname"]
+        assert cmds[1].errors == ["error"]
+
+        # Requests failing for another reason are collected individually
+        cmds = [AntaCommand(command=f"ping 10.0.0.{i}", use_cache=False) for i in range(2)]
+        with patch.object(async_device._session, "cli", side_effect=[TimeoutException("Test"), ["enable", "output0"], ["enable", "output1"]]) as cli_mock:
+            await async_device._collect_batch(cmds)
+        assert cli_mock.call_count == 3
+        assert [cmd.output for cmd in cmds] == ["output0", "output1"]
+
     @pytest.mark.parametrize(
         ("async_device", "command", "expected"),
         ASYNCEAPI_COLLECT_PARAMS,
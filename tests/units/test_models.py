@@ -8,14 +8,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import pickle
 import sys
 from typing import TYPE_CHECKING, Any, ClassVar
+from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel, ValidationError
 
 from anta.decorators import deprecated_test, skip_on_platforms
-from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.models import AntaCommand, AntaTemplate, AntaTemplateRenderError, AntaTest
 from anta.result_manager.models import AntaTestStatus
+from anta.tools import ItemIndex, index_items
 from tests.units.anta_tests.conftest import build_test_id
 from tests.units.conftest import DEVICE_HW_MODEL
 
@@ -102,6 +107,51 @@ class FakeTestWithTemplate(AntaTest):
         self.result.is_success(self.instance_commands[0].command)
 
 
+class FakeTestWithBulkTemplate(AntaTest):
+    """ANTA test with a template having a bulk command that always succeed."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show ip route vrf {vrf} {route}", bulk="show ip route vrf {vrf}", bulk_threshold=3)
+    ]
+
+    class Input(AntaTest.Input):
+        """Inputs for FakeTestWithBulkTemplate test."""
+
+        routes: list[tuple[str, str]]
+
+    def render(self, template: AntaTemplate) -> list[AntaCommand]:
+        """Render function."""
+        return [template.render(vrf=vrf, route=route) for vrf, route in self.inputs.routes]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success(", ".join(f"{command.command}: {len(command.items_params)}" for command in self.instance_commands))
+
+
+class FakeTestWithBadBulkTemplate(AntaTest):
+    """ANTA test with a template having a bulk command with an unknown variable."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show interface {interface}", bulk="show interface {wrong_template}", bulk_threshold=1)
+    ]
+
+    class Input(AntaTest.Input):
+        """Inputs for FakeTestWithBadBulkTemplate test."""
+
+        interface: str
+
+    def render(self, template: AntaTemplate) -> list[AntaCommand]:
+        """Render function."""
+        return [template.render(interface=self.inputs.interface)]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+
+
 class FakeTestWithTemplateNoRender(AntaTest):
     """ANTA test with template that miss the render() method."""
 
@@ -248,6 +298,19 @@ class SkipOnPlatformTestWithInput(AntaTest):
         self.result.is_success(self.inputs.string)
 
 
+class FakeTestMutatingOutput(AntaTest):
+    """ANTA test that mutates the output of its command."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.instance_commands[0].json_output["modelName"]["name"] = "mutated"
+        self.result.is_success()
+
+
 class DeprecatedTestWithoutNewTest(AntaTest):
     """ANTA test that is deprecated without new test."""
 
@@ -415,6 +478,36 @@ ANTATEST_DATA: list[dict[str, Any]] = [
             "test": {"result": "error", "messages": ["AttributeError: 'AntaParams' object has no attribute 'wrong_template_param'"]},
         },
     },
+    {
+        "name": "bulk template below threshold",
+        "test": FakeTestWithBulkTemplate,
+        "inputs": {"routes": [("default", "10.0.0.1"), ("default", "10.0.0.2")]},
+        "expected": {
+            "__init__": {"result": "unset"},
+            "test": {"result": "success", "messages": ["show ip route vrf default 10.0.0.1: 1, show ip route vrf default 10.0.0.2: 1"]},
+        },
+    },
+    {
+        "name": "bulk template above threshold",
+        "test": FakeTestWithBulkTemplate,
+        "inputs": {"routes": [("default", "10.0.0.1"), ("MGMT", "10.0.0.2"), ("default", "10.0.0.3")]},
+        "expected": {
+            "__init__": {"result": "unset"},
+            "test": {"result": "success", "messages": ["show ip route vrf default: 2, show ip route vrf MGMT: 1"]},
+        },
+    },
+    {
+        "name": "wrong bulk template",
+        "test": FakeTestWithBadBulkTemplate,
+        "inputs": {"interface": "Ethernet1"},
+        "expected": {
+            "__init__": {
+                "result": "error",
+                "messages": ["Cannot render template {template='show interface {wrong_template}' version='latest' revision=None ofmt='json' use_cache=True}"],
+            },
+            "test": {"result": "error"},
+        },
+    },
     {
         "name": "unskip on platforms",
         "test": UnSkipOnPlatformTest,
@@ -535,6 +628,22 @@ class TestAntaTest:
                 def test(self) -> None:
                     self.result.is_success()
 
+        with pytest.raises(
+            AttributeError,
+            match="Class tests.units.test_models._WrongTestMergeableInputs has mergeable inputs that are not defined in its Input model: hosts",
+        ):
+
+            class _WrongTestMergeableInputs(AntaTest):
+                """ANTA test declaring an unknown mergeable input."""
+
+                commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+                categories: ClassVar[list[str]] = []
+                mergeable_inputs: ClassVar[tuple[str, ...]] = ("hosts",)
+
+                @AntaTest.anta_test
+                def test(self) -> None:
+                    self.result.is_success()
+
         class _TestOverwriteNameAndDescription(AntaTest):
             """ANTA test where both the test name and description are overwritten in the class definition."""
 
@@ -598,11 +707,71 @@ class TestAntaTest:
                 self.result.is_success()
 
         test = FakeTestWithBlacklist(device)
-        asyncio.run(test.test())
+        with patch.object(device, "release_cache_consumers") as release_mock:
+            asyncio.run(test.test())
+        release_mock.assert_called_once_with(test.instance_commands)
         assert test.result.result == AntaTestStatus.ERROR
         assert f"<{command}> is blocked for security reason" in test.result.messages
         assert test.instance_commands[0].collected is False
 
+    @pytest.mark.parametrize(
+        ("test_class", "expected"),
+        [pytest.param(FakeTest, AntaTestStatus.SUCCESS, id="success"), pytest.param(FakeTestWithFailedCommand, AntaTestStatus.ERROR, id="failed-command")],
+    )
+    def test_release_parse_consumers(self, device: AntaDevice, test_class: type[AntaTest], expected: AntaTestStatus) -> None:
+        """Test that the parse consumers of a test are released when the test finishes, whatever its result."""
+        test = test_class(device)
+        with patch.object(device, "release_parse_consumers") as release_mock:
+            asyncio.run(test.test())
+        assert test.result.result == expected
+        release_mock.assert_called_once_with(test.instance_commands)
+
+    def test_item_indexes(self, device: AntaDevice) -> None:
+        """Test that the indexes of the command outputs are only memoized while the test is running."""
+        data = [{"name": f"Ethernet{i}"} for i in range(10)]
+
+        class FakeTestWithItemIndexes(AntaTest):
+            """Fake Test looking up items of a list."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                if index_items(data, "name") is index_items(data, "name"):
+                    self.result.is_success()
+
+        test = FakeTestWithItemIndexes(device)
+        asyncio.run(test.test())
+        assert test.result.result == AntaTestStatus.SUCCESS
+        assert index_items(data, "name") is not index_items(data, "name")
+
+    @pytest.mark.parametrize(("device"), [{"disable_cache": False}], indirect=True)
+    def test_item_indexes_shared(self, device: AntaDevice) -> None:
+        """Test that the indexes of the cached outputs are shared by the tests using them until the last one has finished."""
+        data = [{"name": f"Ethernet{i}"} for i in range(20)]
+        indexes: list[ItemIndex] = []
+
+        class FakeTestSharingItemIndexes(AntaTest):
+            """Fake Test looking up items of a list of a cached output."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show interfaces")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                indexes.append(index_items(data, "name"))
+                self.result.is_success()
+
+        tests = [FakeTestSharingItemIndexes(device, eos_data=[{}]) for _ in range(2)]
+        for test in tests:
+            device.register_cache_consumers(test.instance_commands)
+        asyncio.run(tests[0].test())
+        assert list(device.item_index_memos) == [(tests[0].instance_commands[0].uid,)]
+        asyncio.run(tests[1].test())
+        assert indexes[0] is indexes[1]
+        assert not device.item_index_memos
+
     def test_result_overwrite(self, device: AntaDevice) -> None:
         """Test the AntaTest.Input.ResultOverwrite model."""
         test = FakeTest(device, inputs={"result_overwrite": {"categories": ["hardware"], "description": "a description", "custom_field": "a custom field"}})
@@ -612,6 +781,93 @@ class TestAntaTest:
         assert test.result.description == "a description"
         assert test.result.custom_field == "a custom field"
 
+    @pytest.mark.parametrize(
+        ("test", "hw_model", "expected"),
+        [
+            pytest.param(SkipOnPlatformTest, DEVICE_HW_MODEL, True, id="skipped"),
+            pytest.param(UnSkipOnPlatformTest, DEVICE_HW_MODEL, False, id="not skipped"),
+            pytest.param(SkipOnPlatformTest, None, False, id="unknown hw_model"),
+            pytest.param(FakeTest, DEVICE_HW_MODEL, False, id="no decorator"),
+        ],
+    )
+    def test_is_skipped_on_platform(self, test: type[AntaTest], hw_model: str | None, expected: bool) -> None:
+        """Test AntaTest.is_skipped_on_platform."""
+        assert test.is_skipped_on_platform(hw_model) is expected
+
+    @pytest.mark.parametrize(("debug", "expected"), [pytest.param(True, True, id="debug"), pytest.param(False, False, id="no debug")])
+    def test_output_mutation(self, device: AntaDevice, caplog: pytest.LogCaptureFixture, debug: bool, expected: bool) -> None:
+        """Test that tests mutating the command outputs are detected in debug mode."""
+        test = FakeTestMutatingOutput(device)
+        with patch("anta.models.__DEBUG__", new=debug):
+            asyncio.run(test.test(eos_data=[{"modelName": {"name": "DCS-7280CR3-32P4-F"}}]))
+        assert test.result.result == AntaTestStatus.SUCCESS
+        assert ("has mutated the output of command 'show version'" in caplog.text) is expected
+
+
+class HashInput(AntaTest.Input):
+    """Inputs used to test the hash of AntaTest.Input."""
+
+    hosts: list[str] | None = None
+    counters: dict[str, int] | None = None
+
+
+class MutableModelInput(AntaTest.Input):
+    """Inputs including a model that is not frozen."""
+
+    class Peer(BaseModel):
+        """Model that is not frozen."""
+
+        name: str
+
+    peers: list[Peer]
+
+
+class TestAntaTestInput:
+    """Test for anta.models.AntaTest.Input."""
+
+    @pytest.mark.parametrize(
+        ("inputs", "other_inputs", "expected"),
+        [
+            pytest.param({"hosts": ["a", "b"]}, {"hosts": ["a", "b"]}, True, id="equal"),
+            pytest.param({"filters": {"tags": ["a", "b", "c"]}}, {"filters": {"tags": ["c", "b", "a"]}}, True, id="set-order"),
+            pytest.param({"counters": {"a": 1, "b": 2}}, {"counters": {"b": 2, "a": 1}}, True, id="dict-order"),
+            pytest.param({"hosts": ["a", "b"]}, {"hosts": ["b", "a"]}, False, id="list-order"),
+            pytest.param({"hosts": ["a"]}, {"hosts": ["b"]}, False, id="different"),
+        ],
+    )
+    def test__hash__(self, inputs: dict[str, Any], other_inputs: dict[str, Any], expected: bool) -> None:
+        """Test AntaTest.Input.__hash__ is consistent with equality."""
+        first, second = HashInput(**inputs), HashInput(**other_inputs)
+        assert (first == second) is expected
+        assert (hash(first) == hash(second)) is expected
+        assert len({first, second}) == (1 if expected else 2)
+
+    def test_frozen(self) -> None:
+        """Test AntaTest.Input cannot be modified once validated."""
+        inputs = HashInput(hosts=["a"])
+        with pytest.raises(ValidationError, match="Instance is frozen"):
+            inputs.hosts = ["b"]  # type: ignore[misc]
+
+    def test_hash_cache(self) -> None:
+        """Test the cached hash of AntaTest.Input is not pickled nor kept in updated copies."""
+        inputs = HashInput(hosts=["a"])
+        hash(inputs)
+        assert "_hash" in inputs.__dict__
+        unpickled = pickle.loads(pickle.dumps(inputs))  # noqa: S301
+        assert "_hash" not in unpickled.__dict__
+        assert unpickled == inputs
+        copied = inputs.model_copy(update={"hosts": ["b"]})
+        assert hash(copied) == hash(HashInput(hosts=["b"]))
+
+    def test_hash_mutable_model(self) -> None:
+        """Test the hash of AntaTest.Input is not cached when the inputs include models that are not frozen."""
+        inputs = MutableModelInput(peers=[MutableModelInput.Peer(name="a")])
+        first_hash = hash(inputs)
+        assert "_hash" not in inputs.__dict__
+        inputs.peers[0].name = "b"
+        assert hash(inputs) != first_hash
+        assert hash(inputs) == hash(MutableModelInput(peers=[MutableModelInput.Peer(name="b")]))
+
 
 class TestAntaComamnd:
     """Test for anta.models.AntaCommand."""
@@ -657,6 +913,31 @@ class TestAntaComamnd:
             command.supported
         assert exec_info.value.args[0] == "Command 'show hardware counter drop' has not been collected and has not returned an error. Call AntaDevice.collect()."
 
+    def test_json_output(self) -> None:
+        """Test that the json_output property returns a read-only view of the output."""
+        output = {"modelName": "DCS-7280CR3-32P4-F"}
+        command = AntaCommand(command="show version", output=output)
+        assert command.json_output == output
+        assert command.json_output["modelName"] == "DCS-7280CR3-32P4-F"
+        with pytest.raises(TypeError):
+            command.json_output["modelName"] = "mutated"  # type: ignore[index]
+        assert command.output == {"modelName": "DCS-7280CR3-32P4-F"}
+
+    def test_uid(self) -> None:
+        """Test the uid property."""
+        command = AntaCommand(command="show version")
+        assert command.uid == hashlib.sha1(b"show version_latest_NA_json").hexdigest()  # noqa: S324
+        assert command.uid is AntaCommand(command="show version").uid
+        assert command.uid != AntaCommand(command="show version", revision=1).uid
+        # The identifier is computed once per instance
+        with patch("anta.models.hashlib.sha1") as sha1_mock:
+            assert command.uid == command.model_copy().uid
+        sha1_mock.assert_not_called()
+        # The identifier follows the modifications of the command
+        command.ofmt = "text"
+        assert command.uid == AntaCommand(command="show version", ofmt="text").uid
+        assert command.model_copy(update={"revision": 1}).uid == AntaCommand(command="show version", revision=1, ofmt="text").uid
+
     def test_requires_privileges(self) -> None:
         """Test the requires_privileges property."""
         command = AntaCommand(command="show aaa methods accounting", errors=["Invalid input (privileged mode required)"])
@@ -675,3 +956,56 @@ class TestAntaComamnd:
         with pytest.raises(RuntimeError) as exec_info:
             command.requires_privileges
         assert exec_info.value.args[0] == "Command 'show aaa methods accounting' has not been collected and has not returned an error. Call AntaDevice.collect()."
+
+
+class TestAntaTemplate:
+    """Test for anta.models.AntaTemplate."""
+
+    def test_render(self) -> None:
+        """Test AntaTemplate.render()."""
+        template = AntaTemplate(template="show interface {interface}", revision=2)
+        command1 = template.render(interface="Ethernet1")
+        command2 = template.render(interface="Ethernet2")
+        params = template.params_schema.model_validate({"interface": "Ethernet1"})
+        assert command1 == AntaCommand(command="show interface Ethernet1", revision=2, template=template, params=params)
+        assert command2.command == "show interface Ethernet2"
+        assert command2.params.interface == "Ethernet2"
+        assert command1.errors is not command2.errors
+
+        # Missing and unexpected parameters
+        with pytest.raises(AntaTemplateRenderError, match="interface"):
+            template.render()
+        with pytest.raises(ValidationError, match="extra"):
+            template.render(interface="Ethernet1", extra="blah")
+
+        # Modified template attributes are validated again
+        template.revision = 3
+        assert template.render(interface="Ethernet1").revision == 3
+        template.ofmt = "xml"  # type: ignore[assignment]
+        with pytest.raises(ValidationError):
+            template.render(interface="Ethernet1")
+
+    def test_render_bulk(self) -> None:
+        """Test AntaTemplate.render_bulk()."""
+        template = AntaTemplate(template="show ip route vrf {vrf} {route}", revision=4, bulk="show ip route vrf {vrf}")
+        commands = [template.render(vrf=vrf, route=route) for vrf, route in [("default", "10.0.0.1"), ("MGMT", "10.0.0.2"), ("default", "10.0.0.3")]]
+        bulk_commands = template.render_bulk(commands)
+        assert [command.command for command in bulk_commands] == ["show ip route vrf default", "show ip route vrf MGMT"]
+        assert all(command.revision == 4 and command.template is template for command in bulk_commands)
+        assert [params.route for params in bulk_commands[0].items_params] == ["10.0.0.1", "10.0.0.3"]
+        assert [params.route for params in bulk_commands[1].items_params] == ["10.0.0.2"]
+        assert commands[0].items_params == [commands[0].params]
+        assert bulk_commands[0].uid == AntaCommand(command="show ip route vrf default", revision=4).uid
+        assert "bulk='show ip route vrf {vrf}' bulk_threshold=10" in repr(template)
+
+        with pytest.raises(ValueError, match="has no bulk command"):
+            AntaTemplate(template="show interface {interface}").render_bulk([])
+
+    def test_params_schema(self) -> None:
+        """Test that the AntaParams model is created on first use and shared by templates with the same variables."""
+        template = AntaTemplate(template="show interface {interface} {detail}")
+        assert template._params_schema is None
+        assert list(template.params_schema.model_fields) == ["interface", "detail"]
+        assert template.params_schema is AntaTemplate(template="show vlan {interface} {detail}").params_schema
+        assert template.params_schema is not AntaTemplate(template="show vlan {detail} {interface}").params_schema
+        assert "params_schema" not in repr(template)
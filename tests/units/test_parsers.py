@@ -0,0 +1,42 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.parsers."""
+
+from __future__ import annotations
+
+import pytest
+
+from anta.parsers import PARSERS, get_parser, parser
+
+
+def test_parser(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the registration of parsers."""
+    monkeypatch.setattr("anta.parsers.PARSERS", dict(PARSERS))
+
+    @parser("upper")
+    def _upper(output: str) -> str:
+        return output.upper()
+
+    assert get_parser("upper") is _upper
+    assert _upper("text") == "TEXT"
+
+    # Registering a parser with an existing name replaces the previous parser
+    @parser("upper")
+    def _new_upper(output: str) -> str:
+        return output.upper()
+
+    assert get_parser("upper") is _new_upper
+
+
+def test_get_parser_unknown() -> None:
+    """Test get_parser with an unknown parser."""
+    with pytest.raises(ValueError, match="There is no parser named 'unknown'"):
+        get_parser("unknown")
+
+
+def test_logging_states_parser() -> None:
+    """Test that the logging tests register the logging_states parser."""
+    import anta.tests.logging  # noqa: F401  # pylint: disable=import-outside-toplevel, unused-import
+
+    assert get_parser("logging_states")("Syslog logging: enabled\n\nExternal configuration:\n    active:") == "Syslog logging: enabled"
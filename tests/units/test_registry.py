@@ -0,0 +1,106 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.registry.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from anta.registry import REGISTRY_FILE, RegisteredTest, build_registry, dump_registry, find_tests, load_registry
+from anta.tests.system import VerifyUptime
+from tests.units.test_models import FakeTestWithTemplate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def registry_file(tmp_path: Path) -> Iterator[Path]:
+    """Return a registry file path used by load_registry() instead of the registry of the anta package."""
+    file = tmp_path / "registry.json"
+    load_registry.cache_clear()
+    with patch("anta.registry.REGISTRY_FILE", file):
+        yield file
+    load_registry.cache_clear()
+
+
+def test_registry_up_to_date() -> None:
+    """Test the registry file describes the current anta.tests package.
+
+    Run `docs/scripts/generate_test_registry.py` to update it.
+    """
+    assert REGISTRY_FILE.read_text(encoding="UTF-8") == dump_registry(build_registry())
+
+
+def test_registered_test() -> None:
+    """Test RegisteredTest.from_test() and RegisteredTest.load()."""
+    registered_test = RegisteredTest.from_test(VerifyUptime)
+    assert registered_test.name == registered_test.class_name == "VerifyUptime"
+    assert registered_test.module == "anta.tests.system"
+    assert registered_test.description == VerifyUptime.description
+    assert registered_test.categories == ("system",)
+    assert registered_test.commands == ("show uptime",)
+    assert registered_test.example is not None
+    assert "minimum: 86400" in registered_test.example
+    assert registered_test.input_schema == VerifyUptime.Input.model_json_schema()
+    assert registered_test.load() is VerifyUptime
+    # Templates are described by their template
+    assert RegisteredTest.from_test(FakeTestWithTemplate).commands == ("show interface {interface}",)
+
+
+@pytest.mark.parametrize(
+    ("module", "test_name", "expected"),
+    [
+        pytest.param("anta.tests.stun", None, ["VerifyStunClient", "VerifyStunClientTranslation", "VerifyStunServer"], id="module"),
+        pytest.param("anta.tests.stun", "VerifyStunClient", ["VerifyStunClient", "VerifyStunClientTranslation"], id="test-name"),
+        pytest.param("anta.tests.stun", "VerifyUptime", [], id="unknown-test-name"),
+        pytest.param("anta.tests.routing", "VerifyRoutingTable", ["VerifyRoutingTableEntry", "VerifyRoutingTableSize"], id="package"),
+        pytest.param("anta.tests.unknown", None, None, id="unknown-module"),
+        pytest.param("anta.tests.stu", None, None, id="module-prefix"),
+        pytest.param("custom.tests", None, None, id="custom-module"),
+    ],
+)
+def test_find_tests(module: str, test_name: str | None, expected: list[str] | None) -> None:
+    """Test find_tests()."""
+    tests = find_tests(module, test_name)
+    assert (None if tests is None else [test.name for test in tests]) == expected
+
+
+def test_find_tests_all() -> None:
+    """Test find_tests() returns all the tests of the anta.tests package grouped by module."""
+    tests = find_tests()
+    assert tests is not None
+    assert tests == list(load_registry() or ())
+    modules = [test.module for test in tests]
+    assert modules == sorted(modules)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param("[\n{invalid\n]\n", id="invalid-json"),
+        pytest.param('[{"name": "VerifyUptime"}]', id="invalid-entry"),
+    ],
+)
+def test_load_registry_fail(registry_file: Path, content: str | None) -> None:
+    """Test load_registry() and find_tests() without a valid registry file."""
+    if content is not None:
+        registry_file.write_text(content, encoding="UTF-8")
+    assert load_registry() is None
+    assert find_tests("anta.tests.system") is None
+
+
+def test_load_registry(registry_file: Path) -> None:
+    """Test load_registry() loads the tests dumped by dump_registry()."""
+    registered_test = RegisteredTest.from_test(VerifyUptime)
+    registry_file.write_text(dump_registry([registered_test]), encoding="UTF-8")
+    registry = load_registry()
+    assert registry == (registered_test,)
+    assert registry is not None
+    assert registry[0].input_schema == registered_test.input_schema
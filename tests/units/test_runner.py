@@ -13,12 +13,16 @@ from unittest.mock import patch
 
 import pytest
 
-from anta.catalog import AntaCatalog
+from anta.cache import UnsupportedCommands
+from anta.catalog import AntaCatalog, AntaTestDefinition, AntaUnresolvedTestDefinition
 from anta.inventory import AntaInventory
+from anta.models import AntaCommand
 from anta.result_manager import ResultManager
-from anta.runner import adjust_rlimit_nofile, main, prepare_tests
+from anta.runner import adjust_rlimit_nofile, get_coroutines, main, prepare_tests
+from anta.tags import TagExpression
 
-from .test_models import FakeTest, FakeTestWithMissingTest
+from .conftest import DEVICE_HW_MODEL
+from .test_models import FakeTest, FakeTestWithMissingTest, FakeTestWithTemplate, SkipOnPlatformTest, UnSkipOnPlatformTest
 
 DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
 FAKE_CATALOG: AntaCatalog = AntaCatalog.from_list([(FakeTest, None)])
@@ -139,11 +143,14 @@ def test_adjust_rlimit_nofile_invalid_env(caplog: pytest.LogCaptureFixture) -> N
         pytest.param({"filename": "test_inventory_with_tags.yml"}, {"leaf"}, {"VerifyMlagStatus", "VerifyUptime"}, 2, 4, id="1-tag-filtered-tests"),
         pytest.param({"filename": "test_inventory_with_tags.yml"}, {"invalid"}, None, 0, 0, id="invalid-tag"),
         pytest.param({"filename": "test_inventory_with_tags.yml"}, {"dc1"}, None, 0, 0, id="device-tag-no-tests"),
+        pytest.param({"filename": "test_inventory_with_tags.yml"}, TagExpression("leaf and not dc1"), None, 1, 3, id="tag-expression"),
+        pytest.param({"filename": "test_inventory_with_tags.yml"}, TagExpression("spine or dc1"), None, 2, 3, id="tag-expression-union"),
+        pytest.param({"filename": "test_inventory_with_tags.yml"}, TagExpression("not leaf and dc1"), None, 0, 0, id="tag-expression-no-devices"),
     ],
     indirect=["inventory"],
 )
 async def test_prepare_tests(
-    caplog: pytest.LogCaptureFixture, inventory: AntaInventory, tags: set[str], tests: set[str], devices_count: int, tests_count: int
+    caplog: pytest.LogCaptureFixture, inventory: AntaInventory, tags: set[str] | TagExpression, tests: set[str], devices_count: int, tests_count: int
 ) -> None:
     """Test the runner prepare_tests function with specific tests."""
     caplog.set_level(logging.WARNING)
@@ -158,6 +165,142 @@ async def test_prepare_tests(
     assert sum(len(tests) for tests in selected_tests.values()) == tests_count
 
 
+def test_prepare_tests_parametrized(caplog: pytest.LogCaptureFixture) -> None:
+    """Test the runner prepare_tests function with parametrized tests."""
+    inventory = AntaInventory.parse(
+        filename=DATA_DIR / "test_inventory_with_variables.yml", username="anta", password="anta", variables=DATA_DIR / "test_inventory_variables.yml"
+    )
+    del inventory["leaf3"].variables["lldp_neighbors"]
+    catalog = AntaCatalog.parse(DATA_DIR / "test_catalog_parametrized.yml")
+    selected_tests = prepare_tests(inventory=inventory, catalog=catalog, tags=None, tests=None)
+    assert selected_tests is not None
+    assert {device.name: [test.test.name for test in tests] for device, tests in selected_tests.items()} == {
+        "leaf1": ["VerifyUptime", "VerifyLLDPNeighbors"],
+        "leaf2": ["VerifyUptime", "VerifyLLDPNeighbors"],
+        "leaf3": ["VerifyUptime", "VerifyLLDPNeighbors"],
+        "spine1": ["VerifyUptime", "VerifyReloadCause"],
+    }
+    # leaf3 has no inputs for VerifyLLDPNeighbors
+    unresolved_test = selected_tests[inventory["leaf3"]][1]
+    assert isinstance(unresolved_test, AntaUnresolvedTestDefinition)
+    assert "variable 'lldp_neighbors' is not defined" in unresolved_test.error
+    # The inputs of leaf2 are overridden by the variables file
+    leaf2_test = selected_tests[inventory["leaf2"]][1]
+    assert isinstance(leaf2_test, AntaTestDefinition)
+    assert leaf2_test.inputs.neighbors[0].neighbor_port == "Ethernet2"  # type: ignore[attr-defined]
+
+    # The unresolved test is reported with an error and the other tests of leaf3 run
+    manager = ResultManager()
+    coroutines = get_coroutines({inventory["leaf3"]: selected_tests[inventory["leaf3"]]}, manager)
+    for coroutine in coroutines:
+        coroutine.close()
+    assert len(coroutines) == 1
+    assert [(result.test, result.result) for result in manager.results] == [("VerifyUptime", "unset"), ("VerifyLLDPNeighbors", "error")]
+    assert "variable 'lldp_neighbors' is not defined" in manager.results[1].messages[0]
+    assert "Unable to prepare test VerifyLLDPNeighbors on device leaf3" in caplog.text
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2}], indirect=True)
+def test_prepare_tests_merge_tests(caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+    """Test the runner prepare_tests function merging compatible tests."""
+    caplog.set_level(logging.INFO)
+    catalog = AntaCatalog.from_dict(
+        {
+            "anta.tests.connectivity": [
+                {"VerifyReachability": {"hosts": [{"source": "Management0", "destination": "1.1.1.1"}]}},
+                {"VerifyReachability": {"hosts": [{"source": "Management0", "destination": "8.8.8.8"}]}},
+            ],
+            "anta.tests.system": [{"VerifyUptime": {"minimum": 10}}],
+        }
+    )
+    selected_tests = prepare_tests(inventory=inventory, catalog=catalog, tags=None, tests=None, merge_tests=True)
+    assert selected_tests is not None
+    for tests in selected_tests.values():
+        assert [test.test.name for test in tests] == ["VerifyReachability", "VerifyUptime"]
+        assert isinstance(tests[0], AntaTestDefinition)
+        assert len(tests[0].inputs.hosts) == 2  # type: ignore[attr-defined]
+    assert "Merged compatible tests: 6 tests reduced to 4" in caplog.messages
+
+
+@pytest.mark.parametrize("inventory", [{"count": 2, "disable_cache": False}], indirect=True)
+def test_get_coroutines_cache_consumers(inventory: AntaInventory) -> None:
+    """Test that get_coroutines registers the commands of each test instance as cache consumers of their device."""
+    catalog = AntaCatalog.from_list(
+        [
+            (FakeTest, None),
+            (FakeTestWithTemplate, {"interface": "Ethernet1"}),
+            (FakeTestWithTemplate, {"interface": "Ethernet1", "result_overwrite": {"description": "second"}}),
+        ]
+    )
+    selected_tests = prepare_tests(inventory=inventory, catalog=catalog, tests=None, tags=None)
+    assert selected_tests is not None
+    coroutines = get_coroutines(selected_tests, ResultManager())
+    for coro in coroutines:
+        coro.close()
+    for device in inventory.devices:
+        assert device.cache_consumers is not None
+        assert sum(device.cache_consumers.values()) == 2
+
+    # A new plan replaces the previous one
+    coroutines = get_coroutines(selected_tests, ResultManager())
+    for coro in coroutines:
+        coro.close()
+    for device in inventory.devices:
+        assert device.cache_consumers is not None
+        assert sum(device.cache_consumers.values()) == 2
+
+
+def test_get_coroutines_unsupported_commands(inventory: AntaInventory) -> None:
+    """Test that get_coroutines shares the memo of unsupported commands with the devices instead of skipping tests up front."""
+    catalog = AntaCatalog.from_list([(FakeTest, None), (FakeTestWithTemplate, {"interface": "Ethernet1"})])
+    selected_tests = prepare_tests(inventory=inventory, catalog=catalog, tests=None, tags=None)
+    assert selected_tests is not None
+    unsupported_commands = UnsupportedCommands()
+    device = inventory.devices[0]
+    unsupported_commands.add(device, AntaCommand(command="show interface Ethernet1", errors=["Unavailable command (not supported on this hardware platform)"]))
+    manager = ResultManager()
+    coroutines = get_coroutines(selected_tests, manager, unsupported_commands)
+    for coro in coroutines:
+        coro.close()
+    # The devices consult the memo when the tests collect their commands
+    assert len(coroutines) == len(manager) == 2 * len(inventory)
+    assert all(result.result == "unset" for result in manager.results)
+    assert all(dev.unsupported_commands is unsupported_commands for dev in inventory.devices)
+
+
+async def test_main_unsupported_commands(inventory: AntaInventory) -> None:
+    """Test that each call to main() uses a new memo of unsupported commands unless one is provided."""
+    catalog = AntaCatalog.from_list([(FakeTest, None)])
+    await main(ResultManager(), inventory, catalog, dry_run=True)
+    memo = inventory.devices[0].unsupported_commands
+    assert memo is not None
+    await main(ResultManager(), inventory, catalog, dry_run=True)
+    assert inventory.devices[0].unsupported_commands is not memo
+
+    await main(ResultManager(), inventory, catalog, dry_run=True, unsupported_commands=memo)
+    assert all(dev.unsupported_commands is memo for dev in inventory.devices)
+
+
+def test_get_coroutines_skip_on_platforms(inventory: AntaInventory) -> None:
+    """Test that get_coroutines skips the tests decorated with skip_on_platforms without instantiating them."""
+    catalog = AntaCatalog.from_list([(SkipOnPlatformTest, {"result_overwrite": {"custom_field": "custom"}}), (UnSkipOnPlatformTest, None)])
+    selected_tests = prepare_tests(inventory=inventory, catalog=catalog, tests=None, tags=None)
+    assert selected_tests is not None
+    for device in inventory.devices:
+        device.hw_model = DEVICE_HW_MODEL
+    manager = ResultManager()
+    with patch.object(SkipOnPlatformTest, "__init__") as init_mock:
+        coroutines = get_coroutines(selected_tests, manager)
+    for coro in coroutines:
+        coro.close()
+    init_mock.assert_not_called()
+    assert len(coroutines) == len(inventory)
+    skipped = [result for result in manager.results if result.result == "skipped"]
+    assert len(skipped) == len(inventory)
+    assert all(result.test == "SkipOnPlatformTest" and result.custom_field == "custom" for result in skipped)
+    assert skipped[0].messages == [f"SkipOnPlatformTest test is not supported on {DEVICE_HW_MODEL}."]
+
+
 async def test_dry_run(caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
     """Test that when dry_run is True, no tests are run."""
     caplog.set_level(logging.INFO)
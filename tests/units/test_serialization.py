@@ -0,0 +1,65 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.serialization.py."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+import pytest
+import yaml
+
+from anta.serialization import dump_yaml, load_json, load_yaml
+
+DATA: list[Any] = [
+    {"anta.tests.system": [{"VerifyUptime": {"minimum": 10, "filters": {"tags": ["fabric"]}}}]},
+    [1, 2.5, None, True, "string", {"nested": ["list"]}],
+    {"long": "word " * 100},
+    {},
+]
+
+
+@pytest.mark.parametrize("data", DATA)
+def test_load_yaml(data: Any) -> None:  # noqa: ANN401
+    """Test load_yaml() returns the same data as yaml.safe_load()."""
+    document = yaml.safe_dump(data)
+    assert load_yaml(document) == yaml.safe_load(document) == data
+
+
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("kwargs", [{}, {"indent": 2, "width": math.inf}, {"sort_keys": False}])
+def test_dump_yaml(data: Any, kwargs: dict[str, Any]) -> None:  # noqa: ANN401
+    """Test dump_yaml() returns the same document as yaml.safe_dump()."""
+    assert dump_yaml(data, **kwargs) == yaml.safe_dump(data, **kwargs)
+
+
+def test_load_yaml_unsafe_tag() -> None:
+    """Test load_yaml() rejects non standard YAML tags."""
+    with pytest.raises(yaml.constructor.ConstructorError):
+        load_yaml("password: !vault |\n  $ANSIBLE_VAULT;1.1;AES256\n")
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        pytest.param('{"key": [1, 2.5, null, true, "string"]}', {"key": [1, 2.5, None, True, "string"]}, id="str"),
+        pytest.param(b'{"key": "value"}', {"key": "value"}, id="bytes"),
+    ],
+)
+def test_load_json(document: str | bytes, expected: Any) -> None:  # noqa: ANN401
+    """Test load_json() returns the same data as json.loads()."""
+    assert load_json(document) == json.loads(document) == expected
+
+
+def test_load_json_nan() -> None:
+    """Test load_json() accepts NaN like json.loads()."""
+    assert math.isnan(load_json('{"value": NaN}')["value"])
+
+
+def test_load_json_invalid() -> None:
+    """Test load_json() raises json.JSONDecodeError on invalid documents."""
+    with pytest.raises(json.JSONDecodeError):
+        load_json("{invalid")
@@ -0,0 +1,128 @@
+# Copyright (c) 2023-2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for anta.tags.py."""
+
+from __future__ import annotations
+
+import pickle
+import re
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from anta.tags import TagExpression, from_bitset, to_bitset
+
+DEVICES_TAGS: list[set[str]] = [
+    {"spine", "dc1"},
+    {"spine", "dc1", "lab"},
+    {"leaf", "dc1"},
+    {"leaf", "dc2"},
+    {"border"},
+    set(),
+]
+
+
+class TagsModel(BaseModel):
+    """Model used to test the validation of tag expressions."""
+
+    tags: set[str] | TagExpression | None = None
+
+
+@pytest.mark.parametrize(
+    ("expression", "text", "expected"),
+    [
+        pytest.param("spine", "spine", [0, 1], id="tag"),
+        pytest.param("spine,leaf", "spine or leaf", [0, 1, 2, 3], id="comma"),
+        pytest.param("spine AND dc1", "spine and dc1", [0, 1], id="and"),
+        pytest.param("not dc1", "not dc1", [3, 4, 5], id="not"),
+        pytest.param("(spine or leaf) and not lab and dc1", "(spine or leaf) and not lab and dc1", [0, 2], id="parentheses"),
+        pytest.param("spine or leaf and not dc1", "spine or leaf and not dc1", [0, 1, 3], id="precedence"),
+        pytest.param("not (spine or (leaf))", "not (spine or leaf)", [4, 5], id="nested"),
+        pytest.param("not not border", "not not border", [4], id="double-not"),
+        pytest.param("unknown or border", "unknown or border", [4], id="unknown-tag"),
+    ],
+)
+def test_tag_expression(expression: str, text: str, expected: list[int]) -> None:
+    """Test TagExpression evaluation on sets of tags and on bitsets."""
+    tag_expression = TagExpression(expression)
+    assert str(tag_expression) == text
+    assert [position for position, tags in enumerate(DEVICES_TAGS) if tag_expression.match(tags)] == expected
+    index = {tag: to_bitset([position for position, tags in enumerate(DEVICES_TAGS) if tag in tags], len(DEVICES_TAGS)) for tag in tag_expression.tags}
+    assert from_bitset(tag_expression.select(index, (1 << len(DEVICES_TAGS)) - 1)) == expected
+
+
+@pytest.mark.parametrize(
+    ("expression", "error"),
+    [
+        pytest.param("", "the expression is empty", id="empty"),
+        pytest.param("spine leaf", "unexpected 'leaf'", id="missing-operator"),
+        pytest.param("(spine or leaf", "unexpected end of expression", id="missing-parenthesis"),
+        pytest.param("spine)", "unexpected ')'", id="extra-parenthesis"),
+        pytest.param("spine and", "unexpected end of expression", id="missing-operand"),
+        pytest.param("or spine", "unexpected 'or'", id="leading-operator"),
+        pytest.param("()", "unexpected ')'", id="empty-parentheses"),
+    ],
+)
+def test_tag_expression_invalid(expression: str, error: str) -> None:
+    """Test TagExpression with invalid expressions."""
+    with pytest.raises(ValueError, match=re.escape(f"Invalid tag expression '{expression}': {error}")):
+        TagExpression(expression)
+
+
+def test_tag_expression_tags() -> None:
+    """Test TagExpression tags attributes."""
+    expression = TagExpression("(spine or leaf) and not (lab or dc2)")
+    assert expression.tags == {"spine", "leaf", "lab", "dc2"}
+    assert expression.positive_tags == {"spine", "leaf"}
+    assert expression.union_tags is None
+    assert TagExpression("spine or leaf,border").union_tags == {"spine", "leaf", "border"}
+    assert TagExpression("spine").union_tags == {"spine"}
+
+
+def test_tag_expression_equality() -> None:
+    """Test TagExpression equality, hash and pickling."""
+    expression = TagExpression("(spine OR leaf)  and not lab")
+    assert expression == TagExpression("(spine or leaf) and not lab")
+    assert hash(expression) == hash(TagExpression("(spine or leaf) and not lab"))
+    assert expression != TagExpression("spine or leaf and not lab")
+    assert pickle.loads(pickle.dumps(expression)) == expression  # noqa: S301
+    assert repr(expression) == "TagExpression('(spine or leaf) and not lab')"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param("spine,leaf", False, id="list"),
+        pytest.param("spine", False, id="tag"),
+        pytest.param("spine or leaf", True, id="operator"),
+        pytest.param("NOT lab", True, id="uppercase-operator"),
+        pytest.param("(spine)", True, id="parentheses"),
+        pytest.param("notaspine", False, id="operator-prefix"),
+    ],
+)
+def test_is_expression(value: str, expected: bool) -> None:
+    """Test TagExpression.is_expression."""
+    assert TagExpression.is_expression(value) is expected
+
+
+def test_pydantic() -> None:
+    """Test TagExpression validation and serialization in pydantic models."""
+    assert TagsModel.model_validate({"tags": ["spine"]}).tags == {"spine"}
+    model = TagsModel.model_validate({"tags": "spine and not lab"})
+    assert model.tags == TagExpression("spine and not lab")
+    assert model.model_dump(mode="json") == {"tags": "spine and not lab"}
+    assert TagsModel.model_validate_json(model.model_dump_json()) == model
+    assert TagsModel(tags=TagExpression("leaf")).tags == TagExpression("leaf")
+    with pytest.raises(ValidationError, match="Invalid tag expression 'spine leaf'"):
+        TagsModel.model_validate({"tags": "spine leaf"})
+    with pytest.raises(ValidationError, match="Input should be a valid tag expression string"):
+        TagsModel.model_validate({"tags": 42})
+
+
+def test_bitset() -> None:
+    """Test to_bitset and from_bitset."""
+    assert to_bitset([0, 3, 9], 10) == 0b1000001001
+    assert to_bitset([], 10) == 0
+    assert from_bitset(0b1000001001) == [0, 3, 9]
+    assert from_bitset(0) == []
@@ -11,7 +11,22 @@ from typing import Any
 
 import pytest
 
-from anta.tools import convert_categories, custom_division, format_data, get_dict_superset, get_failed_logs, get_item, get_value
+from anta.tools import (
+    ITEM_INDEX_MIN_SIZE,
+    ItemIndex,
+    ValuePath,
+    compile_path,
+    convert_categories,
+    custom_division,
+    format_data,
+    get_dict_superset,
+    get_failed_logs,
+    get_item,
+    get_value,
+    get_values,
+    index_items,
+    item_indexes,
+)
 
 TEST_GET_FAILED_LOGS_DATA = [
     {"id": 1, "name": "Alice", "age": 30, "email": "alice@example.com"},
@@ -431,6 +446,63 @@ def test_get_value(
         assert get_value(input_dict, key, **kwargs) == expected_result  # type: ignore[arg-type]
 
 
+TEST_VALUE_PATH_DATA = {
+    "vrfs": {
+        "default": {"peers": {"10.0.0.1": {"state": "Established"}, "10.0.0.2": {"state": "Idle"}}},
+        "MGMT": {"peers": {"10.1.0.1": {"state": "Established"}}},
+        "EMPTY": {"peers": {}},
+        "NONE": None,
+    }
+}
+
+
+@pytest.mark.parametrize(
+    ("key", "separator", "default", "required", "expected_result", "expected_raise"),
+    [
+        pytest.param("vrfs.MGMT.peers", ".", None, False, {"10.1.0.1": {"state": "Established"}}, does_not_raise(), id="no wildcard"),
+        pytest.param("vrfs..default..peers..10.0.0.2..state", "..", None, False, "Idle", does_not_raise(), id="custom separator"),
+        pytest.param("vrfs.*.peers.*.state", ".", None, False, ["Established", "Idle", "Established"], does_not_raise(), id="wildcards"),
+        pytest.param("vrfs.*.peers.10.1.0.1", ".", None, False, None, does_not_raise(), id="wildcard no match"),
+        pytest.param("vrfs..*..peers..10.1.0.1", "..", None, False, [{"state": "Established"}], does_not_raise(), id="wildcard custom separator"),
+        pytest.param("vrfs.*.missing", ".", "default", False, "default", does_not_raise(), id="wildcard default"),
+        pytest.param("vrfs.*.missing", ".", None, True, None, pytest.raises(ValueError, match=r"vrfs\.\*\.missing"), id="wildcard required"),
+        pytest.param("vrfs.MISSING.peers", ".", None, True, None, pytest.raises(ValueError, match="vrfs.MISSING.peers"), id="required"),
+    ],
+)
+def test_value_path(
+    key: str,
+    separator: str,
+    default: str | None,
+    required: bool,
+    expected_result: Any,  # noqa: ANN401
+    expected_raise: AbstractContextManager[Exception],
+) -> None:
+    """Test ValuePath.get."""
+    path = compile_path(key, separator)
+    assert path is compile_path(key, separator)
+    assert repr(path) == f"ValuePath({key!r}, separator={separator!r}, wildcard='*')"
+    with expected_raise:
+        assert path.get(TEST_VALUE_PATH_DATA, default, required=required) == expected_result
+
+
+def test_get_value_no_wildcard() -> None:
+    """Test that get_value does not expand wildcards."""
+    assert get_value({"*": {"key": 1}, "other": {"key": 2}}, "*.key") == 1
+    assert ValuePath("*.key", wildcard=None).get({"other": {"key": 2}}) is None
+
+
+def test_get_values() -> None:
+    """Test get_values."""
+    assert get_values(TEST_VALUE_PATH_DATA, ["vrfs.MGMT.peers.10.1.0.1", "vrfs.*.peers.*.state", "missing"], separator=".", default="default") == [
+        "default",
+        ["Established", "Idle", "Established"],
+        "default",
+    ]
+    assert get_values(TEST_VALUE_PATH_DATA, ["vrfs..MGMT..peers..10.1.0.1..state"], separator="..") == ["Established"]
+    with pytest.raises(ValueError, match="missing"):
+        get_values(TEST_VALUE_PATH_DATA, ["vrfs", "missing"], required=True)
+
+
 @pytest.mark.parametrize(
     ("list_of_dicts", "key", "value", "default", "required", "case_sensitive", "var_name", "custom_error_msg", "expected_result", "expected_raise"),
     [
@@ -487,6 +559,67 @@ def test_get_item(
         assert get_item(list_of_dicts, key, value, default, var_name, custom_error_msg, required=required, case_sensitive=case_sensitive) == expected_result
 
 
+TEST_ITEM_INDEX_DATA: list[Any] = [
+    "not a dict",
+    {"peerAddress": "10.0.0.1", "vrf": "default", "state": "Established"},
+    {"peerAddress": "10.0.0.2", "vrf": "default", "state": "Idle"},
+    {"peerAddress": "10.0.0.1", "vrf": "MGMT", "state": "Idle"},
+    {"peerAddress": ["unhashable"], "vrf": "MGMT"},
+    *({"peerAddress": f"10.1.0.{i}", "vrf": "DEV", "state": "Established"} for i in range(ITEM_INDEX_MIN_SIZE)),
+]
+
+
+def test_item_index() -> None:
+    """Test ItemIndex."""
+    index = ItemIndex(TEST_ITEM_INDEX_DATA, "peerAddress")
+    assert index.get("10.0.0.1") is TEST_ITEM_INDEX_DATA[1]
+    assert index.get_all("10.0.0.1") == [TEST_ITEM_INDEX_DATA[1], TEST_ITEM_INDEX_DATA[3]]
+    assert index.get("10.0.0.3", "default") == "default"
+    assert index.get_all("10.0.0.3") == []
+    with pytest.raises(TypeError):
+        index.get(["unhashable"])
+
+    index = ItemIndex(TEST_ITEM_INDEX_DATA, ("peerAddress", "vrf"))
+    assert index.get(("10.0.0.1", "mgmt")) is TEST_ITEM_INDEX_DATA[3]
+    assert ItemIndex(TEST_ITEM_INDEX_DATA, ("peerAddress", "vrf"), case_sensitive=True).get(("10.0.0.1", "mgmt")) is None
+    assert ItemIndex(TEST_ITEM_INDEX_DATA, "vrf", case_sensitive=True).get("MGMT") is TEST_ITEM_INDEX_DATA[3]
+
+
+def test_index_items() -> None:
+    """Test that index_items memoizes the index of a list within an item_indexes context until its length changes."""
+    data = list(TEST_ITEM_INDEX_DATA)
+    with item_indexes():
+        index = index_items(data, "peerAddress")
+        assert index_items(data, "peerAddress") is index
+        assert index_items(list(data), "peerAddress") is not index
+        assert index_items(data, "peerAddress", case_sensitive=True) is not index
+        data.append({"peerAddress": "10.0.0.3"})
+        new_index = index_items(data, "peerAddress")
+        assert new_index is not index
+        assert new_index.get("10.0.0.3") is data[-1]
+    # The indexes are not kept outside of the context
+    assert index_items(data, "peerAddress") is not index_items(data, "peerAddress")
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "case_sensitive"),
+    [
+        pytest.param("peerAddress", "10.0.0.1", False, id="first match"),
+        pytest.param("vrf", "mgmt", False, id="case insensitive"),
+        pytest.param("vrf", "mgmt", True, id="case sensitive"),
+        pytest.param("peerAddress", ["unhashable"], False, id="unhashable value"),
+        pytest.param(("peerAddress", "vrf"), "10.0.0.1", False, id="tuple key"),
+        pytest.param("state", "Down", False, id="missing item"),
+    ],
+)
+def test_get_item_indexed(key: str | tuple[str, str], value: str | list[str], case_sensitive: bool) -> None:
+    """Test that get_item returns the same item with or without an index."""
+    short_list = TEST_ITEM_INDEX_DATA[: ITEM_INDEX_MIN_SIZE - 1]
+    with item_indexes():
+        assert get_item(TEST_ITEM_INDEX_DATA, key, value, case_sensitive=case_sensitive) is get_item(short_list, key, value, case_sensitive=case_sensitive)
+        assert get_dict_superset(TEST_ITEM_INDEX_DATA, {key: value}) is get_dict_superset(short_list, {key: value})
+
+
 @pytest.mark.parametrize(
     ("numerator", "denominator", "expected_result"),
     [